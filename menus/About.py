@@ -3,14 +3,7 @@ from Screens.Screen import Screen
 from Components.ActionMap import ActionMap
 from Components.ScrollLabel import ScrollLabel
 from Components.Label import Label
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
 from enigma import getDesktop
 
@@ -101,12 +94,7 @@ class Abt(Screen):
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
 
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         self["actions"] = ActionMap(
             ["OkCancelActions", "DirectionActions"],
@@ -1,69 +1,38 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
-import hashlib
-import requests
-import socket
 from sys import version_info
-from threading import Timer
 
 # Enigma2 / GUI imports
-from enigma import getDesktop
 from Plugins.Plugin import PluginDescriptor
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
 from Components.Label import Label
 from Components.ActionMap import ActionMap
 from Components.GUIComponent import GUIComponent
-from Tools.LoadPixmap import LoadPixmap
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS, fileExists
 
 # Plugin-specific imports (updated for ElieSatPanelGrid)
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu
-from Plugins.Extensions.ElieSatPanelGrid.menus.Console import Console
+from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu, add_jump_actions
+from Plugins.Extensions.ElieSatPanelGrid.menus.ScriptCache import run_script
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import get_catalog
+from Plugins.Extensions.ElieSatPanelGrid.menus.CatalogSync import catalog_sync
+from Plugins.Extensions.ElieSatPanelGrid.menus.WarmPool import warm_pool
 from Plugins.Extensions.ElieSatPanelGrid.menus.Iptvadder import Iptvadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.Cccamadder import Cccamadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.News import News
 from Plugins.Extensions.ElieSatPanelGrid.menus.Scripts import Scripts
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-    is_device_unlocked
-)
-
-# Python 2/3 compatibility for urllib
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_cache
+
+# Python 2/3 compatibility
 PY3 = version_info[0] == 3
-try:
-    from urllib.request import Request as compat_Request, urlopen as compat_urlopen
-except ImportError:
-    from urllib2 import Request as compat_Request, urlopen as compat_urlopen
-
-# ---------------- Utility Functions ----------------
-def has_internet(timeout=3):
-    """Check for internet connection."""
-    s = None
-    try:
-        socket.setdefaulttimeout(timeout)
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.connect(("8.8.8.8", 53))
-        return True
-    except Exception:
-        return False
-    finally:
-        try:
-            if s:
-                s.close()
-        except Exception:
-            pass
 
 # URLs / Constants
 INSTALLER_URL = "https://raw.githubusercontent.com/eliesat/beta/main/installer.sh"
-EXTENSIONS_URL = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/refs/heads/main/assets/data/extensions"
 LOCAL_EXTENSIONS = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/data/extensions"
 
 # ---------------- Addons Screen Class ----------------
@@ -79,11 +48,7 @@ class Addons(Screen):
 
         Screen.__init__(self, session)
         # ---------------- ONLY LOAD IF DEVICE UNLOCKED AND FILES EXIST ----------------
-        unlock_ok = is_device_unlocked()
-        unlock_file_exists = os.path.exists("/etc/eliesat_unlocked.cfg")
-        main_mac_exists = os.path.exists("/etc/eliesat_main_mac.cfg")
-
-        if not unlock_ok or not unlock_file_exists or not main_mac_exists:
+        if not platform_facts().unlocked:
             # Close the screen immediately if checks fail
             self.close()
             return
@@ -111,35 +76,7 @@ class Addons(Screen):
     # ---------------- Skin ----------------
     def load_skin(self):
         """Load correct skin based on screen resolution."""
-        screen_width = 1280
-        try:
-            screen_width = getDesktop(0).size().width()
-        except Exception:
-            pass
-
-        base_skin_path = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/"
-        skin_files = {
-            "hd": os.path.join(base_skin_path, "eliesatpanel_hd.xml"),
-            "fhd": os.path.join(base_skin_path, "eliesatpanel_fhd.xml"),
-            "default": os.path.join(base_skin_path, "eliesatpanel.xml"),
-        }
-
-        skin_file = (
-            skin_files["fhd"]
-            if screen_width >= 1920 and os.path.exists(skin_files["fhd"])
-            else skin_files["hd"]
-            if os.path.exists(skin_files["hd"])
-            else skin_files["default"]
-        )
-
-        try:
-            with open(skin_file, "r", encoding="utf-8") as f:
-                self.skin = f.read()
-        except FileNotFoundError:
-            self.skin = """<screen name="Addons" position="center,center" size="1280,720">
-                                <eLabel text="Skin Missing" position="center,center" size="400,50"
-                                font="Regular;30" halign="center" valign="center"/>
-                            </screen>"""
+        self.skin = skin_loader().load("eliesatpanel")
 
     # ---------------- Icon ----------------
     def load_icon(self):
@@ -155,7 +92,7 @@ class Addons(Screen):
                     SCOPE_PLUGINS,
                     "Extensions/ElieSatPanelGrid/assets/icons/default.png",
                 )
-            self.iconPixmap = LoadPixmap(icon_path)
+            self.iconPixmap = pixmap_cache().load(icon_path)
         except Exception:
             self.iconPixmap = None
 
@@ -165,12 +102,7 @@ class Addons(Screen):
         self["description"] = Label("")
         self["pageinfo"] = Label("")
         self["pagelabel"] = Label("")
-        self["image_name"] = Label(f"Image: {get_image_name()}")
-        self["local_ip"] = Label(f"IP: {get_local_ip()}")
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label(f"Python: {get_python_version()}")
-        self["net_status"] = Label(f"Net: {check_internet()}")
+        system_info().attach(self)
 
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
@@ -198,14 +130,14 @@ class Addons(Screen):
             },
             -1,
         )
+        add_jump_actions(self)
 
     # ---------------- Background Updates ----------------
     def start_background_updates(self):
-        """Run background extension update only (plugin update removed)."""
-        if not has_internet():
-            print("[Addons] No internet detected: background updates aborted")
-            return
-        Timer(1, self.update_extensions_from_github).start()
+        """Register with the shared catalog sync service (one refresh per TTL for all screens)."""
+        catalog_sync().subscribe(LOCAL_EXTENSIONS, self.on_catalog_updated)
+        self.onClose.append(lambda: catalog_sync().unsubscribe(self.on_catalog_updated))
+        warm_pool().attach(self, (LOCAL_EXTENSIONS,))
 
     # ---------------- Menu Management ----------------
     def load_main_menu(self):
@@ -247,32 +179,7 @@ class Addons(Screen):
         saved = self.submenu_indices.get(title, 0)
 
         try:
-            with open(LOCAL_EXTENSIONS, "r") as f:
-                lines = f.read().splitlines()
-
-            name = version = desc = ""
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                if line.startswith("Package:"):
-                    name = line.split(":", 1)[1].strip()
-
-                elif line.startswith("Version:"):
-                    p = line.split(":", 1)[1].strip().split(None, 1)
-                    version = p[0]
-                    desc = p[1] if len(p) > 1 else ""
-
-                elif line.startswith("Status:"):
-                    raw = line.split(":", 1)[1].strip()
-                    statuses = raw.replace(",", " ").split()
-
-                    if status in statuses:
-                        items.append(("%s-%s" % (name, version), desc))
-
-                    name = version = desc = ""
+            items = get_catalog(LOCAL_EXTENSIONS).items(status, exact=False)
 
             if not items:
                 items = [("No packages", "")]
@@ -318,26 +225,11 @@ class Addons(Screen):
             print("[Addons] No script found for", selected_label)
             return
 
-        cmd = f'wget -q --no-check-certificate "{script_url}" -O - | /bin/sh'
-        self.session.open(Console, title=f"Running {selected_label}...", cmdlist=[cmd], closeOnSuccess=True)
+        run_script(self.session, script_url, f"Running {selected_label}...")
 
     def _find_script_url(self, pkg_name):
         try:
-            with open(LOCAL_EXTENSIONS, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            block = {}
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith("Package:"):
-                    if block and block.get("Package") == pkg_name:
-                        return next((v for v in block.values() if isinstance(v, str) and v.endswith(".sh")), None)
-                    block = {"Package": line.split(":", 1)[1].strip()}
-                elif "=" in line:
-                    key, val = line.split("=", 1)
-                    block[key.strip()] = val.strip().strip("'\"")
-            return None
+            return get_catalog(LOCAL_EXTENSIONS).script_url(pkg_name)
         except Exception as e:
             print("[Addons] _find_script_url error:", e)
             return None
@@ -382,42 +274,13 @@ class Addons(Screen):
         dots = " ".join(["●" if i == currentPage else "○" for i in range(1, totalPages + 1)])
         self["pagelabel"].setText(dots)
 
-    # ---------------- GitHub Extensions Update ----------------
-    def update_extensions_from_github(self):
-        """Update extensions file from GitHub repository."""
-        if not has_internet():
-            print("[Addons] No internet: skipping extensions update")
-            return False
-        try:
-            response = requests.get(EXTENSIONS_URL, timeout=10)
-            if response.status_code != 200:
-                print(f"[Addons] Failed to fetch extensions: {response.status_code}")
-                return False
-
-            new_hash = hashlib.md5(response.content).hexdigest()
-            local_hash = None
-            if os.path.exists(LOCAL_EXTENSIONS):
-                with open(LOCAL_EXTENSIONS, "rb") as f:
-                    local_hash = hashlib.md5(f.read()).hexdigest()
-
-            if local_hash == new_hash:
-                print("[Addons] Extensions already up-to-date")
-                return False
-
-            with open(LOCAL_EXTENSIONS, "wb") as f:
-                f.write(response.content)
-
-            print("[Addons] Extensions file updated from GitHub")
-
-            if not self.in_submenu:
-                self.load_main_menu()
-            else:
-                for cat in self.main_categories:
-                    if cat[0] == self.submenu_title:
-                        self.load_sub_menu(cat[2], cat[0])
-                        break
-            return True
-        except Exception as e:
-            print("[Addons] update_extensions_from_github error:", e)
-            return False
-
+    # ---------------- Catalog Sync ----------------
+    def on_catalog_updated(self, path):
+        """Reload the visible menu after the shared sync service replaced the catalog file."""
+        if not self.in_submenu:
+            self.load_main_menu()
+        else:
+            for cat in self.main_categories:
+                if cat[0] == self.submenu_title:
+                    self.load_sub_menu(cat[2], cat[0])
+                    break
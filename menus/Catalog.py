@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Catalog.py
+Parsed, in-memory index of the assets/data catalog files shared by all category screens.
+Each file is parsed once and rebuilt only when its mtime or size changes.
+The parsed index is also persisted as a marshal cache next to the source file,
+so the first open after an enigma2 restart needs no text parsing.
+"""
+
+import marshal
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+DATA_DIR = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/data"
+CACHE_FORMAT = 1
+
+
+# ---------------- CATALOG INDEX ----------------
+class CatalogIndex(object):
+    """Index of one catalog file: package -> fields, status -> ordered (label, desc) list."""
+
+    def __init__(self, path: str, stamp: Tuple[int, int]):
+        self.path = path
+        self.stamp = stamp
+        self.packages: Dict[str, dict] = {}
+        self.by_status: Dict[str, List[Tuple[str, str]]] = {}
+        self.by_raw_status: Dict[str, List[Tuple[str, str]]] = {}
+
+    def parse(self, text: str) -> None:
+        """Tokenize the catalog text. Same block rules as the old per-screen parsers."""
+        current = None
+        name = version = desc = ""
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            if line.startswith("Package:"):
+                name = line.split(":", 1)[1].strip()
+                # First block wins for script lookups, like the old linear scan
+                current = self.packages.get(name)
+                if current is None:
+                    current = {"name": name, "version": "", "description": "",
+                               "status": "", "statuses": [], "script": None}
+                    self.packages[name] = current
+                else:
+                    current = None
+
+            elif line.startswith("Version:"):
+                parts = line.split(":", 1)[1].strip().split(None, 1)
+                version = parts[0] if parts else ""
+                desc = parts[1] if len(parts) > 1 else ""
+                if current is not None:
+                    current["version"] = version
+                    current["description"] = desc
+
+            elif line.startswith("Status:"):
+                raw = line.split(":", 1)[1].strip()
+                statuses = [s.lower() for s in raw.replace(",", " ").split()]
+                item = ("%s-%s" % (name, version), desc)
+
+                self.by_raw_status.setdefault(raw.lower(), []).append(item)
+                for st in statuses:
+                    self.by_status.setdefault(st, []).append(item)
+
+                if current is not None:
+                    current["status"] = raw
+                    current["statuses"] = statuses
+                name = version = desc = ""
+
+            elif "=" in line and current is not None and not current["script"]:
+                val = line.split("=", 1)[1].strip().strip("'\"")
+                if val.endswith(".sh"):
+                    current["script"] = val
+
+    def dump(self) -> dict:
+        """Return the index as plain containers for marshal."""
+        return {
+            "format": CACHE_FORMAT,
+            "marshal": marshal.version,
+            "stamp": tuple(self.stamp),
+            "packages": self.packages,
+            "by_status": self.by_status,
+            "by_raw_status": self.by_raw_status,
+        }
+
+    @classmethod
+    def load(cls, path: str, data: dict) -> "CatalogIndex":
+        """Rebuild an index from dump() output."""
+        index = cls(path, tuple(data["stamp"]))
+        index.packages = data["packages"]
+        index.by_status = data["by_status"]
+        index.by_raw_status = data["by_raw_status"]
+        return index
+
+    def items(self, status: str, exact: bool = True) -> List[Tuple[str, str]]:
+        """
+        Return the (name-version, description) pairs for a status code.
+        exact=True matches the whole Status line, exact=False matches any of its codes.
+        """
+        table = self.by_raw_status if exact else self.by_status
+        return list(table.get((status or "").lower(), []))
+
+    def get(self, pkg_name: str) -> Optional[dict]:
+        """Return the parsed fields of a package or None."""
+        return self.packages.get(pkg_name)
+
+    def script_url(self, pkg_name: str) -> Optional[str]:
+        """Return the install script URL of a package or None."""
+        pkg = self.packages.get(pkg_name)
+        return pkg["script"] if pkg else None
+
+
+# ---------------- SESSION CACHE ----------------
+_catalogs: Dict[str, CatalogIndex] = {}
+_lock = threading.Lock()
+
+
+def _stamp(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9)), st.st_size)
+
+
+def cache_path(path: str) -> str:
+    """Return the binary cache path of a catalog file, e.g. assets/data/.extensions.cache"""
+    folder, name = os.path.split(path)
+    return os.path.join(folder, ".%s.cache" % name)
+
+
+def _read_cache(path: str, stamp: Tuple[int, int]) -> Optional[CatalogIndex]:
+    """Load the binary cache of `path` if it was built from the same file stamp."""
+    try:
+        # One read, then decode: marshal.load() on a file object reads in tiny chunks
+        with open(cache_path(path), "rb") as f:
+            data = marshal.loads(f.read())
+        if data.get("format") != CACHE_FORMAT or data.get("marshal") != marshal.version:
+            return None
+        if tuple(data.get("stamp", ())) != stamp:
+            return None
+        return CatalogIndex.load(path, data)
+    except Exception:
+        return None
+
+
+def _write_cache(index: CatalogIndex) -> None:
+    """Write the binary cache atomically (temp file + rename in the same folder)."""
+    target = cache_path(index.path)
+    tmp = "%s.%d.tmp" % (target, os.getpid())
+    try:
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps(index.dump()))
+        os.replace(tmp, target)
+    except Exception as e:
+        print("[Catalog] cache write failed for %s: %s" % (index.path, e))
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+
+
+def _parse_file(path: str, stamp: Tuple[int, int]) -> CatalogIndex:
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    index = CatalogIndex(path, stamp)
+    index.parse(text)
+    return index
+
+
+def catalog_path(name: str) -> str:
+    """Return the full path of a catalog file in assets/data."""
+    return os.path.join(DATA_DIR, name)
+
+
+def get_catalog(path: str) -> CatalogIndex:
+    """
+    Return the index for `path`, parsing the file only if it is new or its
+    mtime/size changed. A valid binary cache is used instead of the text file
+    when possible. Raises OSError if the file does not exist.
+    """
+    stamp = _stamp(path)
+    with _lock:
+        index = _catalogs.get(path)
+        if index is not None and index.stamp == stamp:
+            return index
+
+        index = _read_cache(path, stamp)
+        if index is None:
+            index = _parse_file(path, stamp)
+            _write_cache(index)
+        _catalogs[path] = index
+        return index
+
+
+def invalidate(path: Optional[str] = None) -> None:
+    """Drop the in-memory index of `path`, or of every file when path is None."""
+    with _lock:
+        if path is None:
+            _catalogs.clear()
+        else:
+            _catalogs.pop(path, None)
+
+
+# ---------------- BENCHMARK ----------------
+def benchmark(path: str, rounds: int = 50) -> Dict[str, float]:
+    """
+    Compare cold open time of one catalog: text parse versus binary cache load.
+    Returns average milliseconds per open for both paths.
+    """
+    stamp = _stamp(path)
+    _write_cache(_parse_file(path, stamp))
+
+    start = time.time()
+    for _ in range(rounds):
+        _parse_file(path, stamp)
+    text_ms = (time.time() - start) * 1000.0 / rounds
+
+    start = time.time()
+    for _ in range(rounds):
+        _read_cache(path, stamp)
+    cache_ms = (time.time() - start) * 1000.0 / rounds
+
+    return {"text_ms": text_ms, "cache_ms": cache_ms}
+
+
+if __name__ == "__main__":
+    import sys
+    folder = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    for name in sorted(os.listdir(folder)):
+        full = os.path.join(folder, name)
+        if name.startswith(".") or not os.path.isfile(full):
+            continue
+        res = benchmark(full)
+        print("%-12s text %.3f ms  cache %.3f ms" % (name, res["text_ms"], res["cache_ms"]))
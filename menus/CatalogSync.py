@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+CatalogSync.py
+One process-wide service that keeps the assets/data catalog files in sync with GitHub.
+Each file is refreshed at most once per TTL with a conditional request (ETag /
+If-Modified-Since) on a single worker thread, and open screens are notified on the
+enigma2 main loop only when a file actually changed.
+"""
+
+import json
+import os
+import threading
+import time
+
+import requests
+from enigma import eTimer
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import DATA_DIR, invalidate
+
+RAW_BASE = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/refs/heads/main/assets/data/"
+STATE_FILE = os.path.join(DATA_DIR, ".sync_state.json")
+SYNC_TTL = 15 * 60          # seconds between two checks of the same file
+POLL_INTERVAL = 300         # ms, main loop poll while the worker is busy
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+# ---------------- SYNC SERVICE ----------------
+class CatalogSync(object):
+    """Shared downloader for assets/data files with per-file TTL and change callbacks."""
+
+    def __init__(self, ttl=SYNC_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+        self._listeners = []        # (path, callback)
+        self._queue = []
+        self._changed = []
+        self._running = False
+        self._timer = None
+
+    # ---------------- Persistent state ----------------
+    def _load_state(self):
+        try:
+            with open(STATE_FILE, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_state(self):
+        tmp = STATE_FILE + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(self._state, f)
+            os.replace(tmp, STATE_FILE)
+        except Exception as e:
+            print("[CatalogSync] Failed to save state:", e)
+
+    def is_fresh(self, path):
+        """True if `path` was checked less than one TTL ago."""
+        entry = self._state.get(os.path.basename(path), {})
+        return time.time() - entry.get("checked", 0) < self.ttl
+
+    def mark_checked(self, path, etag=None, last_modified=None):
+        """Record that `path` was just synced by someone else (e.g. the splash screen)."""
+        with self._lock:
+            entry = self._state.setdefault(os.path.basename(path), {})
+            entry["checked"] = time.time()
+            if etag:
+                entry["etag"] = etag
+            if last_modified:
+                entry["last_modified"] = last_modified
+            self._save_state()
+
+    # ---------------- Subscriptions (main loop) ----------------
+    def subscribe(self, path, callback):
+        """
+        Call `callback(path)` on the main loop whenever `path` is replaced,
+        and schedule a refresh of it if the TTL expired.
+        """
+        self._listeners.append((path, callback))
+        self.request(path)
+
+    def unsubscribe(self, callback):
+        self._listeners = [(p, cb) for (p, cb) in self._listeners if cb != callback]
+
+    def request(self, path, force=False):
+        """Queue `path` for a conditional refresh unless it is still fresh."""
+        with self._lock:
+            if path in self._queue or (not force and self.is_fresh(path)):
+                return
+            self._queue.append(path)
+            if not self._running:
+                self._running = True
+                worker = threading.Thread(target=self._run)
+                worker.daemon = True
+                worker.start()
+        self._start_poll()
+
+    def _start_poll(self):
+        if self._timer is None:
+            self._timer = eTimer()
+            self._timer.callback.append(self._poll)
+        self._timer.start(POLL_INTERVAL, False)
+
+    def _poll(self):
+        with self._lock:
+            changed, self._changed = self._changed, []
+            busy = self._running
+        if not busy:
+            self._timer.stop()
+
+        for path in changed:
+            self.notify(path)
+
+    def notify(self, path):
+        """Call the listeners of `path` (main loop only), e.g. after another downloader replaced it."""
+        for (p, cb) in list(self._listeners):
+            if p == path:
+                try:
+                    cb(path)
+                except Exception as e:
+                    print("[CatalogSync] listener error:", e)
+
+    def shutdown(self):
+        """Stop the poll timer and drop the queue; a fetch in progress still finishes."""
+        with self._lock:
+            self._queue = self._queue[:1] if self._running else []
+        self._listeners = []
+        if self._timer is not None:
+            self._timer.stop()
+
+    # ---------------- Worker ----------------
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._running = False
+                    return
+                path = self._queue[0]
+            try:
+                changed = self._fetch(path)
+            except Exception as e:
+                print("[CatalogSync] %s: %s" % (os.path.basename(path), e))
+                changed = None
+            with self._lock:
+                self._queue.pop(0)
+                # A failed check is not stamped: the next request() retries it
+                if changed is not None:
+                    self._state.setdefault(os.path.basename(path), {})["checked"] = time.time()
+                    self._save_state()
+                if changed:
+                    self._changed.append(path)
+
+    def _fetch(self, path):
+        """
+        Conditional GET of one file. Returns True if the local copy was replaced,
+        False if it is current (304 or same content), None if the fetch failed.
+        """
+        name = os.path.basename(path)
+        entry = self._state.get(name, {})
+        headers = dict(HEADERS)
+        if os.path.exists(path):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = requests.get(RAW_BASE + name, headers=headers, timeout=10)
+        if response.status_code == 304:
+            print("[CatalogSync] %s not modified" % name)
+            return False
+        if response.status_code != 200:
+            print("[CatalogSync] Failed to fetch %s: %s" % (name, response.status_code))
+            return None
+
+        with self._lock:
+            entry = self._state.setdefault(name, {})
+            entry["etag"] = response.headers.get("ETag", "")
+            entry["last_modified"] = response.headers.get("Last-Modified", "")
+
+        content = response.content
+        try:
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return False
+        except Exception:
+            pass
+
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+        invalidate(path)
+        print("[CatalogSync] %s updated from GitHub" % name)
+        return True
+
+
+_service = None
+
+
+def catalog_sync():
+    """Return the process-wide CatalogSync instance."""
+    global _service
+    if _service is None:
+        _service = CatalogSync()
+    return _service
+
+
+def shutdown():
+    """Called by Updater.reload_modules() before this module is unloaded."""
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
@@ -5,7 +5,6 @@ from datetime import datetime
 import gettext
 import socket
 
-from enigma import getDesktop
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
 from Components.ActionMap import ActionMap
@@ -19,10 +18,8 @@ from Components.Language import language
 
 from Plugins.Extensions.ElieSatPanelGrid.menus.Infobox import OSCamReadersScreen
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip, check_internet, get_image_name,
-    get_python_version, get_storage_info, get_ram_info
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
 
 # --- Translation setup ---
 def localeInit():
@@ -49,21 +46,9 @@ PANEL_DIRS = [
 # Unified Protocol Editor
 # ----------------------------
 class Cccamadder(Screen, ConfigListScreen):
-    # ---------------- Load correct skin ----------------
-    width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-    skin_file = (
-        "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/cccamadder_fhd.xml"
-        if width >= 1920
-        else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/cccamadder_hd.xml"
-    )
-    try:
-        with open(skin_file, "r") as f:
-            skin = f.read()
-    except Exception as e:
-        print(f"[ElieSatPanel] Failed to load skin: {e}")
-        skin = "<screen></screen>"
 
     def __init__(self, session):
+        self.skin = skin_loader().load("cccamadder", "<screen></screen>")
         Screen.__init__(self, session)
         self.session = session
         self.panel_dir = self.detect_panel_dir()
@@ -71,12 +56,7 @@ class Cccamadder(Screen, ConfigListScreen):
             os.makedirs(self.panel_dir)
 
         # System info
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
 
@@ -337,21 +317,9 @@ class Cccamadder(Screen, ConfigListScreen):
 # GreenJobScreen
 # ----------------------------
 class GreenJobScreen(Screen):
-    # ---------------- Load correct skin ----------------
-    width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-    skin_file = (
-        "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/cccamadder2_fhd.xml"
-        if width >= 1920
-        else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/cccamadder2_hd.xml"
-    )
-    try:
-        with open(skin_file, "r") as f:
-            skin = f.read()
-    except Exception as e:
-        print(f"[ElieSatPanel] Failed to load skin: {e}")
-        skin = "<screen></screen>"
 
     def __init__(self, session):
+        self.skin = skin_loader().load("cccamadder2", "<screen></screen>")
         Screen.__init__(self, session)
         self.session = session
         self.setTitle(_("Subscription Labels"))
@@ -359,12 +327,7 @@ class GreenJobScreen(Screen):
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
 
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         self.sub_labels_list = MenuList([], enableWrapAround=True)
         self["sub_labels"] = self.sub_labels_list
@@ -531,21 +494,9 @@ class GreenJobScreen(Screen):
 # BlueJobScreen
 # ----------------------------
 class BlueJobScreen(Screen):
-    # ---------------- Load correct skin ----------------
-    width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-    skin_file = (
-        "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/cccamadder1_fhd.xml"
-        if width >= 1920
-        else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/cccamadder1_hd.xml"
-    )
-    try:
-        with open(skin_file, "r") as f:
-            skin = f.read()
-    except Exception as e:
-        print(f"[ElieSatPanel] Failed to load skin: {e}")
-        skin = "<screen></screen>"
 
     def __init__(self, session):
+        self.skin = skin_loader().load("cccamadder1", "<screen></screen>")
         Screen.__init__(self, session)
         self.session = session
         self.setTitle(_("Subscription Labels"))
@@ -555,12 +506,7 @@ class BlueJobScreen(Screen):
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
 
         # System info
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         # Subscription list
         self.sub_labels_list = MenuList([], enableWrapAround=True)
@@ -11,11 +11,10 @@ from Components.ActionMap import ActionMap
 from Components.ScrollLabel import ScrollLabel
 from Components.Sources.StaticText import StaticText
 from Screens.MessageBox import MessageBox
-from enigma import getDesktop
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
 
 def getDesktopSize():
-    s = getDesktop(0).size()
-    return (s.width(), s.height())
+    return platform_facts().desktop_size
 
 def isHD():
     desktopSize = getDesktopSize()
@@ -1,58 +1,35 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
-import hashlib
-import requests
-import socket
 from sys import version_info
-from threading import Timer
 
 # Enigma2 / GUI imports
-from enigma import getDesktop
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
 from Components.Label import Label
 from Components.ActionMap import ActionMap
-from Tools.LoadPixmap import LoadPixmap
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS, fileExists
 
 # Plugin-specific imports
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu
-from Plugins.Extensions.ElieSatPanelGrid.menus.Console import Console
+from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu, add_jump_actions
+from Plugins.Extensions.ElieSatPanelGrid.menus.ScriptCache import run_script
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import get_catalog
+from Plugins.Extensions.ElieSatPanelGrid.menus.CatalogSync import catalog_sync
+from Plugins.Extensions.ElieSatPanelGrid.menus.WarmPool import warm_pool
 from Plugins.Extensions.ElieSatPanelGrid.menus.Iptvadder import Iptvadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.Cccamadder import Cccamadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.News import News
 from Plugins.Extensions.ElieSatPanelGrid.menus.Scripts import Scripts
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-    is_device_unlocked
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_cache
 
 # Python 2/3 compatibility
 PY3 = version_info[0] == 3
-try:
-    from urllib.request import Request as compat_Request, urlopen as compat_urlopen
-except ImportError:
-    from urllib2 import Request as compat_Request, urlopen as compat_urlopen
-
-# ---------------- Utility ----------------
-def has_internet(timeout=3):
-    try:
-        socket.setdefaulttimeout(timeout)
-        socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect(("8.8.8.8", 53))
-        return True
-    except Exception:
-        return False
-
 
 # ---------------- URLs ----------------
-EXTENSIONS_URL = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/refs/heads/main/assets/data//feeds"
 LOCAL_EXTENSIONS = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/data/feeds"
 
 
@@ -71,11 +48,7 @@ class Feeds(Screen):
         self.load_skin()
         Screen.__init__(self, session)
         # ---------------- ONLY LOAD IF DEVICE UNLOCKED AND FILES EXIST ----------------
-        unlock_ok = is_device_unlocked()
-        unlock_file_exists = os.path.exists("/etc/eliesat_unlocked.cfg")
-        main_mac_exists = os.path.exists("/etc/eliesat_main_mac.cfg")
-
-        if not unlock_ok or not unlock_file_exists or not main_mac_exists:
+        if not platform_facts().unlocked:
             # Close the screen immediately if checks fail
             self.close()
             return
@@ -102,35 +75,7 @@ class Feeds(Screen):
 
     # ---------------- Skin Loader ----------------
     def load_skin(self):
-        screen_width = 1280
-        try:
-            screen_width = getDesktop(0).size().width()
-        except Exception:
-            pass
-
-        base_skin_path = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/"
-        skin_files = {
-            "hd": os.path.join(base_skin_path, "eliesatpanel_hd.xml"),
-            "fhd": os.path.join(base_skin_path, "eliesatpanel_fhd.xml"),
-            "default": os.path.join(base_skin_path, "eliesatpanel.xml"),
-        }
-
-        skin_file = (
-            skin_files["fhd"] if screen_width >= 1920 and os.path.exists(skin_files["fhd"])
-            else skin_files["hd"] if os.path.exists(skin_files["hd"])
-            else skin_files["default"]
-        )
-
-        try:
-            with open(skin_file, "r", encoding="utf-8") as f:
-                self.skin = f.read()
-        except Exception:
-            self.skin = (
-                '<screen name="Feeds" position="center,center" size="1280,720">'
-                '<eLabel text="Skin Missing" position="center,center" size="400,50" '
-                'font="Regular;30" halign="center" valign="center"/>'
-                '</screen>'
-            )
+        self.skin = skin_loader().load("eliesatpanel")
 
     # ---------------- Icon Loader ----------------
     def load_icon(self):
@@ -145,7 +90,7 @@ class Feeds(Screen):
                     SCOPE_PLUGINS,
                     "Extensions/ElieSatPanelGrid/assets/icons/default.png"
                 )
-            self.iconPixmap = LoadPixmap(icon_path)
+            self.iconPixmap = pixmap_cache().load(icon_path)
         except Exception:
             self.iconPixmap = None
 
@@ -154,12 +99,7 @@ class Feeds(Screen):
         self["description"] = Label("")
         self["pageinfo"] = Label("")
         self["pagelabel"] = Label("")
-        self["image_name"] = Label(f"Image: {get_image_name()}")
-        self["local_ip"] = Label(f"IP: {get_local_ip()}")
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label(f"Python: {get_python_version()}")
-        self["net_status"] = Label(f"Net: {check_internet()}")
+        system_info().attach(self)
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
         self["red"] = Label("IPTV Adder")
@@ -185,13 +125,14 @@ class Feeds(Screen):
             },
             -1,
         )
+        add_jump_actions(self)
 
     # ---------------- Background Updates ----------------
     def start_background_updates(self):
-        if not has_internet():
-            print("[Feeds] No internet detected: skipping updates")
-            return
-        Timer(1, self.update_extensions_from_github).start()
+        """Register with the shared catalog sync service (one refresh per TTL for all screens)."""
+        catalog_sync().subscribe(LOCAL_EXTENSIONS, self.on_catalog_updated)
+        self.onClose.append(lambda: catalog_sync().unsubscribe(self.on_catalog_updated))
+        warm_pool().attach(self, (LOCAL_EXTENSIONS,))
 
     # ---------------- Main Menu ----------------
     def load_main_menu(self):
@@ -212,23 +153,7 @@ class Feeds(Screen):
         try:
             if not os.path.exists(LOCAL_EXTENSIONS):
                 raise FileNotFoundError(f"feeds file not found: {LOCAL_EXTENSIONS}")
-            with open(LOCAL_EXTENSIONS, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-
-            name = version = desc = st = ""
-            for line in lines:
-                line = line.strip()
-                if not line: continue
-                if line.startswith("Package:"): name = line.split(":", 1)[1].strip()
-                elif line.startswith("Version:"):
-                    parts = line.split(":", 1)[1].strip().split(None, 1)
-                    version = parts[0]
-                    desc = parts[1] if len(parts) > 1 else ""
-                elif line.startswith("Status:"):
-                    st = line.split(":", 1)[1].strip()
-                    if st.lower() == status.lower():
-                        packages.append((f"{name}-{version}", desc))
-                    name = version = desc = st = ""
+            packages = get_catalog(LOCAL_EXTENSIONS).items(status)
             if not packages:
                 packages.append((f"No packages with Status: {status}", ""))
         except Exception as e:
@@ -266,29 +191,11 @@ class Feeds(Screen):
         if not script_url:
             print("[Feeds] No script found for", selected_label)
             return
-        self.session.open(
-            Console,
-            title=f"Running {selected_label}...",
-            cmdlist=[f'wget -q --no-check-certificate "{script_url}" -O - | /bin/sh'],
-            closeOnSuccess=True
-        )
+        run_script(self.session, script_url, f"Running {selected_label}...")
 
     def _find_script_url(self, pkg_name):
         try:
-            with open(LOCAL_EXTENSIONS, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            block = {}
-            for line in lines:
-                line = line.strip()
-                if not line: continue
-                if line.startswith("Package:"):
-                    if block and block.get("Package") == pkg_name:
-                        return next((v for k,v in block.items() if v.endswith(".sh")), None)
-                    block = {"Package": line.split(":",1)[1].strip()}
-                elif "=" in line:
-                    key,val = line.split("=",1)
-                    block[key.strip()] = val.strip().strip("'\"")
-            return None
+            return get_catalog(LOCAL_EXTENSIONS).script_url(pkg_name)
         except Exception as e:
             print("[Feeds] _find_script_url error:", e)
             return None
@@ -330,33 +237,10 @@ class Feeds(Screen):
         self["pageinfo"].setText(f"Page {currentPage}/{totalPages}")
         self["pagelabel"].setText(" ".join(["●" if i==currentPage else "○" for i in range(1,totalPages+1)]))
 
-    # ---------------- Git Update ----------------
-    def update_extensions_from_github(self):
-        if not has_internet():
-            print("[Feeds] No internet: skipping update")
-            return False
-        try:
-            response = requests.get(EXTENSIONS_URL, timeout=10)
-            if response.status_code != 200:
-                print(f"[Feeds] Failed to fetch feeds: {response.status_code}")
-                return False
-            new_hash = hashlib.md5(response.content).hexdigest()
-            local_hash = None
-            if os.path.exists(LOCAL_EXTENSIONS):
-                with open(LOCAL_EXTENSIONS,"rb") as f:
-                    local_hash = hashlib.md5(f.read()).hexdigest()
-            if local_hash == new_hash:
-                print("[Feeds] Feeds already up-to-date")
-                return False
-            with open(LOCAL_EXTENSIONS,"wb") as f:
-                f.write(response.content)
-            print("[Feeds] Feeds updated from GitHub")
-            if not self.in_submenu:
-                self.load_main_menu()
-            else:
-                self.load_sub_menu("Feeds","Feeds")
-            return True
-        except Exception as e:
-            print("[Feeds] update_extensions_from_github error:", e)
-            return False
-
+    # ---------------- Catalog Sync ----------------
+    def on_catalog_updated(self, path):
+        """Reload the visible menu after the shared sync service replaced the catalog file."""
+        if not self.in_submenu:
+            self.load_main_menu()
+        else:
+            self.load_sub_menu("Feeds", "Feeds")
@@ -1,18 +1,33 @@
 # -*- coding: utf-8 -*-
+"""
+FlexibleMenu.py
+Grid menu used by the main panel and every submenu.
+Tile geometry is computed once per skin / resolution (grid_layout) and shared,
+pages are built on demand and kept in a small LRU, and a move inside a page only
+swaps the old and the new selected tile. Which icon a tile shows is pluggable:
+screen_icon (one icon per screen, the default) or item_icon (one per item).
+Number keys jump to pages and typed letters to the first matching title
+(add_jump_actions).
+"""
 import math
-from sys import version_info
-from threading import Timer
+import time
+from collections import OrderedDict
 
-from Tools.LoadPixmap import LoadPixmap
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS, fileExists
+from Components.ActionMap import NumberActionMap
 from Components.GUIComponent import GUIComponent
 from Components.MultiContent import (
     MultiContentEntryText,
     MultiContentEntryPixmap,
     MultiContentEntryPixmapAlphaTest,
 )
-from Screens.Screen import Screen
 from skin import parseColor
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_bytes, pixmap_cache
+from Plugins.Extensions.ElieSatPanelGrid.menus.IconVariants import load_icon
+from Plugins.Extensions.ElieSatPanelGrid.menus.JumpIndex import JumpIndex
+from Plugins.Extensions.ElieSatPanelGrid.menus.KeyRepeat import KeyRepeat
+from Plugins.Extensions.ElieSatPanelGrid.menus.StartupTimer import overlay_enabled, startup_timer
 from enigma import (
     eListboxPythonMultiContent,
     eListbox,
@@ -20,8 +35,10 @@ from enigma import (
     eLabel,
     eSize,
     ePoint,
+    eTimer,
+    eRCInput,
     gFont,
-    getDesktop,
+    getPrevAsciiCode,
     BT_SCALE,
     BT_KEEP_ASPECT_RATIO,
     BT_ALIGN_CENTER,
@@ -29,47 +46,121 @@ from enigma import (
     RT_VALIGN_CENTER,
 )
 
+PAGE_CACHE_SIZE = 3     # prebuilt pages kept (current + neighbours)
+ICON_DIR = "Extensions/ElieSatPanelGrid/assets/icons/"
+SCALE_FLAGS = BT_SCALE | BT_ALIGN_CENTER | BT_KEEP_ASPECT_RATIO
+TYPE_TIMEOUT = 1200     # ms after the last typed key before a new search starts
+PAGER_DOTS = ("●", "○")                 # (current, other) page, any font
+PAGER_ICONS = ("\ue837", "\ue836")      # same in the "Icons" font of the main panel skin
+
+
+# ---------------- ICON RESOLVERS ----------------
+# resolver(menu, item) -> icon path, or a pixmap cache key stored by the screen
+def _icon(name):
+    path = resolveFilename(SCOPE_PLUGINS, ICON_DIR + name + ".png")
+    if fileExists(path):
+        return path
+    return None
+
+
+def screen_icon(menu, item):
+    """One icon for the whole grid, named after the owning screen class."""
+    cls = getattr(getattr(menu, "parent", None), "__class__", None)
+    name = cls.__name__.lower() if cls else "default"
+    return _icon(name) or _icon("default") or name
+
+
+def item_icon(menu, item):
+    """One icon per item, named after its title ("Tools panels" -> tools_panels.png)."""
+    return _icon(item[0].lower().replace(" ", "_")) or _icon("default")
+
+
+def _set_bytes(logos):
+    """Decoded size of the logo and active logo of one logo set."""
+    pixmaps = dict((id(p), p) for p in (logos[0], logos[2]) if p is not None)
+    return sum(pixmap_bytes(p) for p in pixmaps.values())
+
+
+# ---------------- LAYOUT ----------------
+class GridLayout(object):
+    """Tile positions of one page and the text rows under each tile."""
+
+    def __init__(self, columns, itemPerPage, boxsize, activesize, margin, lines, fhd):
+        self.boxwidth, self.boxheight = boxsize
+        self.activeboxwidth, self.activeboxheight = activesize
+        self.xoffset = (self.activeboxwidth - self.boxwidth) // 2
+        self.yoffset = (self.activeboxheight - self.boxheight) // 2
+        self.cells = [((slot % columns) * (self.boxwidth + margin),
+                       (slot // columns) * (self.boxheight + margin))
+                      for slot in range(itemPerPage)]
+
+        # Distance of each text row from the tile bottom, and the logo height above them
+        if lines == 2:
+            self.text_rows = (60, 30) if fhd else (65, 45)
+            self.text_height = 60
+            self.frame_pad = 5
+        else:
+            self.text_rows = (40,)
+            self.text_height = 40
+            self.frame_pad = 0
+
+
+_layouts = {}
+
+
+def grid_layout(*key):
+    """Return the shared GridLayout for (columns, itemPerPage, boxsize, activesize, margin, lines, fhd)."""
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = GridLayout(*key)
+    return layout
+
 
 # ---------------- FLEXIBLE MENU ----------------
 class FlexibleMenu(GUIComponent):
-    """A grid-like flexible menu that accepts a list of (title, description) pairs."""
+    """
+    A grid-like flexible menu that accepts a list of (title, description) pairs.
+    split_version shows "Name-1.0" titles as two rows (name, version).
+    """
 
-    _cached_logos = {}
+    _cached_logos = pixmap_cache()     # screens may store their icon by class name
 
-    def __init__(self, list_=None, parent=None):
+    def __init__(self, list_=None, parent=None, logo=screen_icon, split_version=True, pager=PAGER_DOTS):
         GUIComponent.__init__(self)
         self.parent = parent
+        self.logo = logo
+        self.split_version = split_version
+        self.selectedicon, self.unselectedicon = pager
         self.l = eListboxPythonMultiContent()
         self.list = list_ or []
         self._normalize_list()
-        self.entries = dict()
+        self._pages = OrderedDict()     # page index -> render state, LRU
+        self._logo_sets = {}            # icon -> (logo, flags, active logo, active flags)
+        self._logo_bytes = 0            # decoded size of the logos in _logo_sets
+        self._shown_page = None
+        self._warm = None               # snapshot of a closed screen, see warm()
+        self.layout = None
+        self.isFHD = platform_facts().is_fhd
         self.onSelectionChanged = []
+        self.onFirstPaint = []
+        self.painted = False
         self.current = 0
         self.total_pages = 1
-
-        # -------------------- IMAGE DETECTION --------------------
-        def isOpenPLi():
-            try:
-                if fileExists("/etc/opkg/all-feed.conf"):
-                    with open("/etc/opkg/all-feed.conf", "r") as f:
-                        data = f.read().lower()
-                        if "openpli" in data:
-                            return True
-            except:
-                pass
-            return False
-
-        is_pli = isOpenPLi()
-        # -----------------------------------------------------------
-
-        # HD/FHD dynamic defaults
-        if getDesktop(0).size().width() >= 1920:
-            if is_pli:
-                self.normalFont = gFont("Regular", 30)
-                self.selFont = gFont("Regular", 30)
-            else:
-                self.normalFont = gFont("Bold", 30)
-                self.selFont = gFont("Bold", 30)
+        self.render_ms = 0.0
+        self.log_render = overlay_enabled()
+        self.keys = KeyRepeat(self._apply_moves)
+        self._paint_timer = eTimer()
+        self._paint_timer.callback.append(self.setL)
+        self.jump_index = JumpIndex(title for (title, _) in self.list)
+        self.typed = ""
+        self._typed_timer = eTimer()
+        self._typed_timer.callback.append(self._clear_typed)
+
+        # HD/FHD defaults, the skin usually overrides them
+        font = "Regular" if platform_facts().image_type == "openpli" else "Bold"
+        if self.isFHD:
+            self.normalFont = gFont(font, 30)
+            self.selFont = gFont(font, 30)
             self.boxwidth = 240
             self.boxheight = 240
             self.activeboxwidth = 285
@@ -79,12 +170,8 @@ class FlexibleMenu(GUIComponent):
             self.itemPerPage = 18
             self.columns = 6
         else:
-            if is_pli:
-                self.normalFont = gFont("Regular", 20)
-                self.selFont = gFont("Regular", 20)
-            else:
-                self.normalFont = gFont("Bold", 20)
-                self.selFont = gFont("Bold", 20)
+            self.normalFont = gFont(font, 20)
+            self.selFont = gFont(font, 20)
             self.boxwidth = 160
             self.boxheight = 180
             self.activeboxwidth = 210
@@ -94,9 +181,6 @@ class FlexibleMenu(GUIComponent):
             self.itemPerPage = 12
             self.columns = 4
 
-        self.selectedicon = "●"
-        self.unselectedicon = "○"
-
         # Preload pager pixmaps
         self.ptr_pagerleft = self._loadPixmapSafe("Extensions/ElieSatPanelGrid/assets/icon/pager_left.png")
         self.ptr_pagerright = self._loadPixmapSafe("Extensions/ElieSatPanelGrid/assets/icon/pager_right.png")
@@ -108,10 +192,39 @@ class FlexibleMenu(GUIComponent):
 
     def _loadPixmapSafe(self, path):
         try:
-            return LoadPixmap(resolveFilename(SCOPE_PLUGINS, path))
+            return self._cached_logos.load(resolveFilename(SCOPE_PLUGINS, path))
         except Exception:
             return None
 
+    def _loadLogo(self, path, width, height):
+        """Return (pixmap, blit flags) for a logo drawn in a width x height box."""
+        pixmap, exact = load_icon(path, width, height, self._cached_logos)
+        return pixmap, BT_ALIGN_CENTER if exact else SCALE_FLAGS
+
+    def _logo_set(self, icon):
+        """(logo, flags, active logo, active flags) of `icon`, loaded once per layout."""
+        logos = self._logo_sets.get(icon)
+        if logos is not None:
+            return logos
+        logos = (None, SCALE_FLAGS, None, SCALE_FLAGS)
+        try:
+            if icon and fileExists(icon):
+                # Exact-size variants for both tile states, painted without scaling
+                text_height = self.layout.text_height
+                logo, flags = self._loadLogo(icon, self.boxwidth, self.boxheight - text_height)
+                active, active_flags = self._loadLogo(icon, self.activeboxwidth, self.activeboxheight - text_height)
+                logos = (logo, flags, active, active_flags)
+            elif icon:
+                # Icon stored by the screen itself
+                pixmap = self._cached_logos.get(icon)
+                logos = (pixmap, SCALE_FLAGS, pixmap, SCALE_FLAGS)
+        except Exception as e:
+            print("[FlexibleMenu] logo error:", e)
+        self._logo_sets[icon] = logos
+        self._logo_bytes += _set_bytes(logos)
+        self._cached_logos.fit(self._logo_bytes)
+        return logos
+
     def _normalize_list(self):
         normalized = []
         for item in (self.list or []):
@@ -155,15 +268,16 @@ class FlexibleMenu(GUIComponent):
                     if self.instance:
                         self.instance.resize(eSize(self.listWidth, self.listHeight))
                 elif attrib == "itemPixmap":
-                    self.itemPixmap = LoadPixmap(value)
+                    self.itemPixmap = self._cached_logos.load(value)
                 elif attrib == "selPixmap":
-                    self.selPixmap = LoadPixmap(value)
+                    self.selPixmap = self._cached_logos.load(value)
                 else:
                     attribs.append((attrib, value))
             except Exception:
                 continue
 
         self.l.setFont(0, self.normalFont)
+        self.l.setFont(1, self.selFont)
         self.l.setItemHeight(self.panelheight)
         self.skinAttributes = attribs
         self.buildEntry()
@@ -210,7 +324,12 @@ class FlexibleMenu(GUIComponent):
         self.pager_center.hide()
         self.pagelabel.hide()
 
+        self._paint_timer.start(50, True)
+
     def preWidgetRemove(self, instance):
+        self.keys.stop()
+        self._paint_timer.stop()
+        self._typed_timer.stop()
         instance.setContent(None)
         self.instance = None
 
@@ -224,148 +343,178 @@ class FlexibleMenu(GUIComponent):
     def setList(self, list_):
         self.list = list_ or []
         self._normalize_list()
+        self.jump_index = JumpIndex(title for (title, _) in self.list)
         if self.current >= len(self.list):
             self.current = max(0, len(self.list) - 1)
         if self.instance:
             self.setL(True)
 
     def buildEntry(self):
-        self.entries.clear()
-        if len(self.list) == 0:
-            return
-
-        width = self.boxwidth + self.margin
-        height = self.boxheight + self.margin
-        xoffset = (self.activeboxwidth - self.boxwidth) // 2
-        yoffset = (self.activeboxheight - self.boxheight) // 2
-        isFHD = getDesktop(0).size().width() >= 1920
-        self.total_pages = int(math.ceil(float(len(self.list)) / self.itemPerPage)) if self.itemPerPage > 0 else 1
-
-        cls_name = getattr(getattr(self, "parent", None), "__class__", None)
-        cls_name = cls_name.__name__.lower() if cls_name else "default"
-
-        if cls_name not in self._cached_logos:
-            logoPath = resolveFilename(
-                SCOPE_PLUGINS,
-                f"Extensions/ElieSatPanelGrid/assets/icons/{cls_name}.png"
-            )
-            if not fileExists(logoPath):
-                logoPath = resolveFilename(
-                    SCOPE_PLUGINS,
-                    "Extensions/ElieSatPanelGrid/assets/icons/default.png"
-                )
-            self._cached_logos[cls_name] = LoadPixmap(logoPath) if fileExists(logoPath) else None
-
-        logo = self._cached_logos.get(cls_name)
-
-        for page_index in range(self.total_pages):
-            x = 0
-            y = 0
-            for idx in range(page_index * self.itemPerPage, min((page_index + 1) * self.itemPerPage, len(self.list))):
-                elem = self.list[idx]
-                try:
-                    full_text = elem[0]
-                    desc = elem[1] if len(elem) > 1 else ""
-                except Exception:
-                    continue
-
-                if "-" in full_text:
-                    name, version = full_text.rsplit("-", 1)
-                else:
-                    name = full_text
-                    version = ""
-
-                key = full_text
-                active_height = self.activeboxheight
-                inactive_height = self.boxheight
-                page = page_index + 1
-                text_width = self.activeboxwidth
-                text_x = x + xoffset + (self.boxwidth - text_width) // 2
-
-                active_texts = (
-                    MultiContentEntryText(pos=(x, y + self.activeboxheight - (60 if isFHD else 65)),
-                                          size=(text_width, 35), font=0, text=name,
-                                          flags=RT_HALIGN_CENTER | RT_VALIGN_CENTER,
-                                          color=0x00FF8C00),
-                    MultiContentEntryText(pos=(x, y + self.activeboxheight - (30 if isFHD else 45)),
-                                          size=(text_width, 35), font=0, text=version,
-                                          flags=RT_HALIGN_CENTER | RT_VALIGN_CENTER,
-                                          color=0x00FF8C00),
-                )
-                inactive_texts = (
-                    MultiContentEntryText(pos=(text_x, y + yoffset + self.boxheight - (60 if isFHD else 65)),
-                                          size=(text_width, 35), font=0, text=name,
-                                          flags=RT_HALIGN_CENTER | RT_VALIGN_CENTER),
-                    MultiContentEntryText(pos=(text_x, y + yoffset + self.boxheight - (30 if isFHD else 45)),
-                                          size=(text_width, 35), font=0, text=version,
-                                          flags=RT_HALIGN_CENTER | RT_VALIGN_CENTER),
-                )
-
-                self.entries[key] = {
-                    "active": (
-                        MultiContentEntryPixmap(pos=(x - 5, y - 5), size=(self.activeboxwidth + 10, active_height + 10),
-                                                png=self.selPixmap, flags=BT_SCALE),
-                        MultiContentEntryPixmapAlphaTest(pos=(x, y), size=(self.activeboxwidth, active_height - 60),
-                                                         png=logo, flags=BT_SCALE | BT_ALIGN_CENTER | BT_KEEP_ASPECT_RATIO),
-                    ) + active_texts,
-                    "u_active": (
-                        MultiContentEntryPixmap(pos=(x + xoffset, y + yoffset), size=(self.boxwidth, inactive_height),
-                                                png=self.itemPixmap, flags=BT_SCALE),
-                        MultiContentEntryPixmapAlphaTest(pos=(x + xoffset, y + yoffset),
-                                                         size=(self.boxwidth, inactive_height - 60),
-                                                         png=logo, flags=BT_SCALE | BT_ALIGN_CENTER | BT_KEEP_ASPECT_RATIO),
-                    ) + inactive_texts,
-                    "page": page
-                }
-
-                x += width
-                if (idx % self.columns) == (self.columns - 1):
-                    x = 0
-                    y += height
-
-        self.setL()
+        """Reset the layout. Tiles are built per page on demand by _page()."""
+        startup_timer().begin("FlexibleMenu.buildEntry")
+        try:
+            self._pages.clear()
+            self._logo_sets.clear()
+            self._logo_bytes = 0
+            self._shown_page = None
+            self.total_pages = int(math.ceil(float(len(self.list)) / self.itemPerPage)) if self.itemPerPage > 0 else 1
+            self.layout = grid_layout(
+                self.columns, self.itemPerPage,
+                (self.boxwidth, self.boxheight), (self.activeboxwidth, self.activeboxheight),
+                self.margin, 2 if self.split_version else 1, self.isFHD)
+            if len(self.list) == 0:
+                return
+            if self._warm is not None:
+                warm, self._warm = self._warm, None
+                if warm.get("layout") is self.layout and warm.get("list") == self.list:
+                    self._pages = warm["pages"]
+                    self._logo_sets = warm["logo_sets"]
+                    self._logo_bytes = sum(_set_bytes(logos) for logos in self._logo_sets.values())
+            self.setL()
+        finally:
+            startup_timer().end("FlexibleMenu.buildEntry")
+
+    def snapshot(self):
+        """Built state of this grid (list, layout, pages, logos) for the warm pool."""
+        return {"list": list(self.list), "layout": self.layout,
+                "pages": self._pages, "logo_sets": self._logo_sets}
+
+    def warm(self, snapshot):
+        """Reuse the pages of `snapshot` if the first list shown has the same items and layout."""
+        self._warm = snapshot
+
+    def _build_tile(self, idx):
+        """Return (active, u_active) MultiContent tuples for list item `idx`."""
+        elem = self.list[idx]
+        layout = self.layout
+        full_text = elem[0]
+
+        if self.split_version and "-" in full_text:
+            texts = full_text.rsplit("-", 1)
+        elif self.split_version:
+            texts = (full_text, "")
+        else:
+            texts = (full_text,)
+
+        logo, logo_flags, logo_active, logo_active_flags = self._logo_set(self.logo(self, elem))
+
+        x, y = layout.cells[idx % self.itemPerPage]
+        xoffset = layout.xoffset
+        yoffset = layout.yoffset
+        pad = layout.frame_pad
+        text_width = self.activeboxwidth
+        text_x = x + xoffset + (self.boxwidth - text_width) // 2
+
+        active_texts = tuple(
+            MultiContentEntryText(pos=(x, y + self.activeboxheight - row),
+                                  size=(text_width, 35), font=0, text=text,
+                                  flags=RT_HALIGN_CENTER | RT_VALIGN_CENTER,
+                                  color=0x00FF8C00)
+            for (text, row) in zip(texts, layout.text_rows))
+        inactive_texts = tuple(
+            MultiContentEntryText(pos=(text_x, y + yoffset + self.boxheight - row),
+                                  size=(text_width, 35), font=0, text=text,
+                                  flags=RT_HALIGN_CENTER | RT_VALIGN_CENTER)
+            for (text, row) in zip(texts, layout.text_rows))
+
+        active = (
+            MultiContentEntryPixmap(pos=(x - pad, y - pad),
+                                    size=(self.activeboxwidth + 2 * pad, self.activeboxheight + 2 * pad),
+                                    png=self.selPixmap, flags=BT_SCALE),
+            MultiContentEntryPixmapAlphaTest(pos=(x, y),
+                                             size=(self.activeboxwidth, self.activeboxheight - layout.text_height),
+                                             png=logo_active, flags=logo_active_flags),
+        ) + active_texts
+        u_active = (
+            MultiContentEntryPixmap(pos=(x + xoffset, y + yoffset), size=(self.boxwidth, self.boxheight),
+                                    png=self.itemPixmap, flags=BT_SCALE),
+            MultiContentEntryPixmapAlphaTest(pos=(x + xoffset, y + yoffset),
+                                             size=(self.boxwidth, self.boxheight - layout.text_height),
+                                             png=logo, flags=logo_flags),
+        ) + inactive_texts
+        return active, u_active
+
+    def _page(self, page_index):
+        """
+        Return the cached render state of one page (0-based), building it on first use:
+        {"tiles": [(active, u_active)], "slots": [tile tuple drawn per item]}.
+        Only PAGE_CACHE_SIZE pages are kept.
+        """
+        page = self._pages.get(page_index)
+        if page is not None:
+            self._pages.move_to_end(page_index)
+            return page
+
+        start = page_index * self.itemPerPage
+        tiles = [self._build_tile(idx) for idx in range(start, min(start + self.itemPerPage, len(self.list)))]
+        page = {"tiles": tiles, "slots": [u_active for (_, u_active) in tiles], "selected": None}
+        self._pages[page_index] = page
+        while len(self._pages) > PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+        return page
 
     # --------------------- LIST DISPLAY ---------------------
     def setL(self, refresh=False):
         if refresh:
-            self.entries.clear()
             self.buildEntry()
             return
-        if len(self.entries) > 0 and len(self.list) > 0:
-            res = [None]
-            if self.current > (len(self.list) - 1):
-                self.current = (len(self.list) - 1)
+        if len(self.list) == 0 or self.layout is None:
             try:
-                current_key = self.list[self.current][0]
-                current = self.entries.get(current_key)
+                self.l.setList([])
             except Exception:
-                current = None
-                if len(self.entries):
-                    first_key = next(iter(self.entries))
-                    current = self.entries[first_key]
-                    self.current = 0
-
-            current_page = current.get("page") if current else 1
-            page_items = []
-            for _, value in self.entries.items():
-                if value["page"] == current_page:
-                    page_items.extend(value["active"] if value == current else value["u_active"])
+                pass
+            return
 
-            try:
-                self.l.setList([res + page_items])
-            except Exception:
-                try:
-                    self.l.setList([])
-                except Exception:
-                    pass
+        started = time.time()
+        first = not self.painted
+        if first:
+            startup_timer().begin("first setL")
 
-            self.setpage()
-        else:
+        if self.current > (len(self.list) - 1):
+            self.current = (len(self.list) - 1)
+        if self.current < 0:
+            self.current = 0
+
+        page_index = self.current // self.itemPerPage
+        page = self._page(page_index)
+
+        # Swap only the previously selected and the newly selected tile
+        slot = self.current - page_index * self.itemPerPage
+        if page["selected"] != slot:
+            if page["selected"] is not None:
+                page["slots"][page["selected"]] = page["tiles"][page["selected"]][1]
+            page["slots"][slot] = page["tiles"][slot][0]
+            page["selected"] = slot
+
+        # The enlarged active tile is drawn last, over its neighbours
+        res = [None]
+        for i, parts in enumerate(page["slots"]):
+            if i != slot:
+                res.extend(parts)
+        res.extend(page["slots"][slot])
+
+        try:
+            self.l.setList([res])
+        except Exception:
             try:
                 self.l.setList([])
             except Exception:
                 pass
 
+        if self._shown_page != page_index:
+            self.setpage()
+        self._shown_page = page_index
+
+        self.render_ms = (time.time() - started) * 1000.0
+        if self.log_render:
+            print("[FlexibleMenu] render %.2f ms (page %d)" % (self.render_ms, page_index + 1))
+
+        if first:
+            self.painted = True
+            startup_timer().end("first setL")
+            for f in self.onFirstPaint:
+                f()
+
     # --------------------- PAGER ---------------------
     def setpage(self):
         if self.total_pages > 1:
@@ -404,44 +553,80 @@ class FlexibleMenu(GUIComponent):
                 pass
 
     def getCurrentPage(self):
-        if len(self.entries) > 0 and len(self.list) > 0:
-            if self.current > (len(self.list) - 1):
-                self.current = (len(self.list) - 1)
-            try:
-                current_key = self.list[self.current][0]
-                current = self.entries.get(current_key, None)
-                if current:
-                    return current["page"]
-            except Exception:
-                pass
-            return 1
+        if len(self.list) > 0 and self.itemPerPage > 0:
+            return min(self.current, len(self.list) - 1) // self.itemPerPage + 1
         return 1
 
     # --------------------- MOVEMENT ---------------------
     def left(self):
-        self.move(1, "backwards")
+        self.keys.push(-1)
 
     def right(self):
-        self.move(1, "forward")
+        self.keys.push(1)
 
     def up(self):
-        self.move(self.columns, "backwards")
+        self.keys.push(-self.columns)
 
     def down(self):
-        if len(self.list) > 0:
-            if self.current + self.columns > (len(self.list) - 1) and self.current != (len(self.list) - 1):
-                self.current = len(self.list) - 1
-                self.setL()
-                self.selectionChanged()
-            else:
-                self.move(self.columns, "forward")
+        self.keys.push("down")
+
+    def _apply_moves(self, moves):
+        """Apply queued moves (+/-step, or "down") and redraw once."""
+        if len(self.list) == 0:
+            return
+        last = len(self.list) - 1
+        for step in moves:
+            if step == "down":
+                if self.current + self.columns > last and self.current != last:
+                    self.current = last
+                    continue
+                step = self.columns
+            self.current = (self.current + step) % len(self.list)
+        self.setL()
+        self.selectionChanged()
 
     def move(self, step, direction):
-        if len(self.list) > 0:
-            self.current = (self.current - step if direction == "backwards" else self.current + step) % len(self.list)
+        self.keys.push(-step if direction == "backwards" else step)
+
+    # --------------------- JUMPS ---------------------
+    def jumpTo(self, index):
+        if 0 <= index < len(self.list) and index != self.current:
+            self.keys.stop()
+            self.current = index
             self.setL()
             self.selectionChanged()
 
+    def jumpToPage(self, page):
+        """Select the first item of `page` (1-based)."""
+        if 1 <= page <= self.total_pages:
+            self.jumpTo((page - 1) * self.itemPerPage)
+
+    def typeAhead(self, char):
+        """
+        Extend the typed text by `char` and jump to the first match.
+        Digits select a page ("1", "2" -> page 12 when it exists), letters a title prefix.
+        """
+        self._typed_timer.start(TYPE_TIMEOUT, True)
+        if char.isdigit():
+            digits = self.typed + char if self.typed.isdigit() else char
+            if int(digits) > self.total_pages:
+                digits = char
+            self.typed = digits
+            self.jumpToPage(int(digits))
+            return
+
+        typed = self.typed + char if self.typed and not self.typed.isdigit() else char
+        index = self.jump_index.find(typed)
+        if index is None and len(typed) > 1:
+            typed = char
+            index = self.jump_index.find(typed)
+        self.typed = typed
+        if index is not None:
+            self.jumpTo(index)
+
+    def _clear_typed(self):
+        self.typed = ""
+
     def getCurrent(self):
         if len(self.list) > 0:
             try:
@@ -460,3 +645,56 @@ class FlexibleMenu(GUIComponent):
             self.current = 0
         if self.instance:
             self.setL()
+
+
+# ---------------- JUMP KEYS ----------------
+def add_jump_actions(screen, key="menu"):
+    """
+    Number keys jump to pages and keyboard letters type ahead in screen[key].
+    Letters from a USB / web keyboard arrive as ascii codes only in ascii mode,
+    which also turns its arrow and number keys into text. So ascii mode is on
+    only while a jump prompt is open: from a number key or the TEXT key until
+    TYPE_TIMEOUT after the last typed key. The previous mode is restored then.
+    """
+    rc = eRCInput.getInstance()
+    prompt = {"saved": None}
+    close_timer = eTimer()
+
+    def open_prompt():
+        if prompt["saved"] is None:
+            prompt["saved"] = rc.getKeyboardMode()
+            rc.setKeyboardMode(rc.kmAscii)
+        close_timer.start(TYPE_TIMEOUT, True)
+
+    def close_prompt():
+        close_timer.stop()
+        if prompt["saved"] is not None:
+            rc.setKeyboardMode(prompt["saved"])
+            prompt["saved"] = None
+
+    def toggle_prompt():
+        if prompt["saved"] is None:
+            open_prompt()
+        else:
+            close_prompt()
+
+    def typed_number(number):
+        screen[key].typeAhead(str(number))
+        open_prompt()
+
+    def typed_char():
+        code = getPrevAsciiCode()
+        char = chr(code) if 32 <= code < 127 else ""
+        if char.strip():
+            screen[key].typeAhead(char)
+        open_prompt()
+
+    actions = dict((str(n), typed_number) for n in range(10))
+    actions["gotAsciiCode"] = typed_char
+    actions["startTeletext"] = toggle_prompt
+    screen["jumpActions"] = NumberActionMap(
+        ["NumberActions", "InputAsciiActions", "InfobarTeletextActions"], actions, -1)
+
+    close_timer.callback.append(close_prompt)
+    screen.onHide.append(close_prompt)
+    screen.onClose.append(close_prompt)
@@ -71,6 +71,28 @@ def get_image_name() -> str:
     return "Unknown"
 
 
+_image_type: Optional[str] = None
+
+
+def get_image_type() -> str:
+    """Return the feed family from /etc/opkg/all-feed.conf ('openpli', 'openatv', ... or 'unknown'). Read once."""
+    global _image_type
+    if _image_type is not None:
+        return _image_type
+    _image_type = "unknown"
+    try:
+        if os.path.exists("/etc/opkg/all-feed.conf"):
+            with open("/etc/opkg/all-feed.conf", "r") as f:
+                data = f.read().lower()
+            for name in ("openpli", "openatv", "openbh", "openvision"):
+                if name in data:
+                    _image_type = name
+                    break
+    except Exception:
+        pass
+    return _image_type
+
+
 def get_python_version() -> str:
     """Return the running Python version like '3.10.6' or 'Unknown'."""
     try:
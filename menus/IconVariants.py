@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+IconVariants.py
+Exact-size tile icons for the current resolution and skin box sizes.
+A variant is the icon fitted inside the box with its aspect ratio kept. It is
+stored once as <source sha1>_<w>x<h>.png in the icon cache folder (HDD, else
+flash, outside the plugin tree so updates keep it) and later loaded as is.
+Until a variant exists the icon is decoded straight to its final size by
+enigma2's own PNG loader (LoadPixmap width / height) and a worker thread writes
+the variant for the next session. Either way the pixmap is kept in the pixmap
+cache under "<path>@<w>x<h>", so tiles are painted without BT_SCALE.
+On images whose LoadPixmap cannot scale, the source pixmap is drawn with
+BT_SCALE until the variant is written.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+import time
+import zlib
+
+from Tools.LoadPixmap import LoadPixmap
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_cache, png_size
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+CACHE_MOUNTS = ("/media/hdd", "/media/usb")     # tried in order, like ScriptCache
+CACHE_SUBDIR = "ElieSatPanelGrid/icons"
+FLASH_DIR = "/home/root/.cache/ElieSatPanelGrid/icons"
+DISK_CAP = 32 * 1024 * 1024
+FLASH_CAP = 2 * 1024 * 1024
+WRITE_PAUSE = 0.05          # s between two variants, keeps the GUI thread responsive
+
+_can_scale = True       # False once LoadPixmap rejected width / height
+_hashes = {}            # path -> ((mtime_ns, size), sha1)
+
+
+def variant_location():
+    """(folder, size cap): a mounted, writable disk if any, else flash."""
+    for mount in CACHE_MOUNTS:
+        if os.path.ismount(mount) and os.access(mount, os.W_OK):
+            return os.path.join(mount, CACHE_SUBDIR), DISK_CAP
+    return FLASH_DIR, FLASH_CAP
+
+
+def fit_size(path, width, height):
+    """(w, h) of the PNG `path` fitted inside width x height, or None if unknown."""
+    dims = png_size(path)
+    if not dims or not dims[0] or not dims[1] or width <= 0 or height <= 0:
+        return None
+    scale = min(float(width) / dims[0], float(height) / dims[1])
+    return (max(1, int(dims[0] * scale)), max(1, int(dims[1] * scale)))
+
+
+def _source_hash(path):
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    known = _hashes.get(path)
+    if known and known[0] == stamp:
+        return known[1]
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    _hashes[path] = (stamp, digest)
+    return digest
+
+
+def variant_path(path, width, height, folder=None):
+    """Where the width x height variant of `path` is stored."""
+    folder = folder or variant_location()[0]
+    return os.path.join(folder, "%s_%dx%d.png" % (_source_hash(path)[:20], width, height))
+
+
+# ---------------- PNG ----------------
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}     # colour type -> bytes per pixel (8 bit)
+
+
+def _unfilter(data, width, height, bpp):
+    """Raw scanlines of the inflated IDAT data."""
+    stride = width * bpp
+    rows = []
+    prev = bytearray(stride)
+    pos = 0
+    for _ in range(height):
+        kind = data[pos]
+        row = bytearray(data[pos + 1:pos + 1 + stride])
+        pos += 1 + stride
+        if kind == 1:
+            for i in range(bpp, stride):
+                row[i] = (row[i] + row[i - bpp]) & 0xFF
+        elif kind == 2:
+            for i in range(stride):
+                row[i] = (row[i] + prev[i]) & 0xFF
+        elif kind == 3:
+            for i in range(stride):
+                left = row[i - bpp] if i >= bpp else 0
+                row[i] = (row[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                a = row[i - bpp] if i >= bpp else 0
+                b = prev[i]
+                c = prev[i - bpp] if i >= bpp else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                if pa <= pb and pa <= pc:
+                    pred = a
+                elif pb <= pc:
+                    pred = b
+                else:
+                    pred = c
+                row[i] = (row[i] + pred) & 0xFF
+        elif kind != 0:
+            raise ValueError("bad PNG filter %d" % kind)
+        rows.append(row)
+        prev = row
+    return rows
+
+
+def read_png(path):
+    """(width, height, rows of RGBA bytes) of an 8 bit, non interlaced PNG."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("not a PNG")
+    pos = 8
+    idat = []
+    palette = b""
+    trns = b""
+    header = None
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif kind == b"PLTE":
+            palette = body
+        elif kind == b"tRNS":
+            trns = body
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+    width, height, depth, colour, _, _, interlace = header
+    if depth != 8 or interlace or colour not in _CHANNELS:
+        raise ValueError("unsupported PNG (depth %d, colour %d, interlace %d)" % (depth, colour, interlace))
+    bpp = _CHANNELS[colour]
+    rows = _unfilter(zlib.decompress(b"".join(idat)), width, height, bpp)
+
+    if colour == 3:
+        table = []
+        for i in range(256):
+            rgb = palette[i * 3:i * 3 + 3] or b"\x00\x00\x00"
+            table.append(bytes(rgb) + bytes((trns[i] if i < len(trns) else 255,)))
+        rows = [bytearray(b"".join(table[i] for i in row)) for row in rows]
+    elif colour != 6:
+        out = []
+        for row in rows:
+            rgba = bytearray(width * 4)
+            for x in range(width):
+                px = row[x * bpp:(x + 1) * bpp]
+                if colour == 2:
+                    rgba[x * 4:x * 4 + 4] = px + b"\xff"
+                elif colour == 0:
+                    rgba[x * 4:x * 4 + 4] = bytes((px[0], px[0], px[0], 255))
+                else:
+                    rgba[x * 4:x * 4 + 4] = bytes((px[0], px[0], px[0], px[1]))
+            out.append(rgba)
+        rows = out
+    return width, height, rows
+
+
+def scale_rgba(width, height, rows, new_width, new_height):
+    """
+    Area average to new_width x new_height (nearest pixel when enlarging).
+    Colours are weighted by alpha, so transparent pixels leave no dark fringe.
+    """
+    spans_x = [(x * width // new_width, max(x * width // new_width + 1, (x + 1) * width // new_width))
+               for x in range(new_width)]
+    out = []
+    for y in range(new_height):
+        y0 = y * height // new_height
+        y1 = max(y0 + 1, (y + 1) * height // new_height)
+        src = rows[y0:y1]
+        line = bytearray(new_width * 4)
+        for x, (x0, x1) in enumerate(spans_x):
+            r = g = b = a = 0
+            for row in src:
+                for i in range(x0 * 4, x1 * 4, 4):
+                    alpha = row[i + 3]
+                    r += row[i] * alpha
+                    g += row[i + 1] * alpha
+                    b += row[i + 2] * alpha
+                    a += alpha
+            if a:
+                count = (x1 - x0) * len(src)
+                line[x * 4:x * 4 + 4] = bytes((r // a, g // a, b // a, a // count))
+        out.append(line)
+    return out
+
+
+def write_png(path, width, height, rows):
+    """Store RGBA rows as a PNG (filter 0 on every line)."""
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+
+    raw = b"".join(b"\x00" + bytes(row) for row in rows)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def make_variant(path, target, size):
+    """Write `path` scaled to size = (w, h) as the PNG `target` (tmp file + rename)."""
+    tmp = "%s.%d.tmp" % (target, os.getpid())
+    if Image is not None:
+        img = Image.open(path).convert("RGBA")
+        img.resize(size, getattr(Image, "LANCZOS", Image.BICUBIC)).save(tmp, "PNG")
+    else:
+        width, height, rows = read_png(path)
+        write_png(tmp, size[0], size[1], scale_rgba(width, height, rows, size[0], size[1]))
+    os.replace(tmp, target)
+
+
+# ---------------- WRITER ----------------
+class VariantWriter(object):
+    """Writes queued variants on one worker thread, within the size cap of the cache folder."""
+
+    def __init__(self, folder=None, cap=None):
+        if folder is None:
+            folder, default_cap = variant_location()
+            cap = cap or default_cap
+        self.folder = folder
+        self.cap = cap or FLASH_CAP
+        self._lock = threading.Lock()
+        self._queue = []
+        self._queued = set()
+        self._running = False
+        self._used = None       # bytes in the folder, counted on the first write
+        self.written = 0
+
+    def add(self, path, target, size):
+        with self._lock:
+            if target in self._queued:
+                return
+            self._queued.add(target)
+            self._queue.append((path, target, size))
+            if self._running:
+                return
+            self._running = True
+        worker = threading.Thread(target=self._run)
+        worker.daemon = True
+        worker.start()
+
+    def shutdown(self):
+        """Drop the queued variants; the one being written is finished."""
+        with self._lock:
+            self._queue = []
+
+    def _trim(self):
+        """Drop the oldest variants while the folder is over the cap; returns the bytes left."""
+        try:
+            files = [os.path.join(self.folder, n) for n in os.listdir(self.folder) if n.endswith(".png")]
+        except OSError:
+            return 0
+        stats = sorted((os.stat(p).st_mtime, os.path.getsize(p), p) for p in files)
+        used = sum(size for (_, size, _) in stats)
+        for (_, size, p) in stats:
+            if used <= self.cap:
+                break
+            try:
+                os.remove(p)
+                used -= size
+            except OSError:
+                pass
+        return used
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._running = False
+                    return
+                path, target, size = self._queue.pop(0)
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                if self._used is None:
+                    self._used = self._trim()
+                if self._used < self.cap and not os.path.exists(target):
+                    make_variant(path, target, size)
+                    self._used += os.path.getsize(target)
+                    self.written += 1
+            except Exception as e:
+                print("[IconVariants] %s: %s" % (path, e))
+            time.sleep(WRITE_PAUSE)
+
+
+_writer = None
+
+
+def variant_writer():
+    """Return the process-wide VariantWriter instance."""
+    global _writer
+    if _writer is None:
+        _writer = VariantWriter()
+    return _writer
+
+
+def shutdown():
+    """Called by Updater.reload_modules() before this module is unloaded."""
+    global _writer
+    if _writer is not None:
+        _writer.shutdown()
+        _writer = None
+
+
+# ---------------- LOAD ----------------
+def load_icon(path, width, height, cache=None):
+    """
+    Return (pixmap, exact) for a box of width x height.
+    exact is True when the pixmap already has its final size, so it can be
+    drawn without scaling.
+    """
+    global _can_scale
+    cache = cache if cache is not None else pixmap_cache()
+    size = fit_size(path, width, height)
+    if size:
+        key = "%s@%dx%d" % (path, size[0], size[1])
+        pixmap = cache.get(key)
+        if pixmap is None:
+            writer = variant_writer()
+            try:
+                target = variant_path(path, size[0], size[1], writer.folder)
+                if os.path.exists(target):
+                    pixmap = LoadPixmap(target)
+                else:
+                    writer.add(path, target, size)
+                    if _can_scale:
+                        pixmap = LoadPixmap(path, width=size[0], height=size[1])
+            except TypeError:
+                # Older image: LoadPixmap(path) only
+                _can_scale = False
+            except Exception as e:
+                print("[IconVariants] %s: %s" % (path, e))
+            if pixmap is not None:
+                cache.put(key, pixmap, size[0] * size[1] * 4)
+        if pixmap is not None:
+            return pixmap, True
+    return cache.load(path), False
@@ -1,65 +1,36 @@
 # -*- coding: utf-8 -*-
 import os
-import hashlib
-import requests
-import socket
 from sys import version_info
-from threading import Timer
 
 # Enigma2 / GUI imports
-from enigma import getDesktop
 from Plugins.Plugin import PluginDescriptor
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
 from Components.Label import Label
 from Components.ActionMap import ActionMap
 from Components.GUIComponent import GUIComponent
-from Tools.LoadPixmap import LoadPixmap
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS, fileExists
 
 # Plugin-specific imports
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu
-from Plugins.Extensions.ElieSatPanelGrid.menus.Console import Console
+from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu, add_jump_actions
+from Plugins.Extensions.ElieSatPanelGrid.menus.ScriptCache import run_script
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import get_catalog
+from Plugins.Extensions.ElieSatPanelGrid.menus.CatalogSync import catalog_sync
+from Plugins.Extensions.ElieSatPanelGrid.menus.WarmPool import warm_pool
 from Plugins.Extensions.ElieSatPanelGrid.menus.Iptvadder import Iptvadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.Cccamadder import Cccamadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.News import News
 from Plugins.Extensions.ElieSatPanelGrid.menus.Scripts import Scripts
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-    is_device_unlocked
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import is_device_unlocked
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_cache
 
 # Python 2/3 compatibility
 PY3 = version_info[0] == 3
-try:
-    from urllib.request import Request as compat_Request, urlopen as compat_urlopen
-except ImportError:
-    from urllib2 import Request as compat_Request, urlopen as compat_urlopen
-
-# ---------------- Utility Functions ----------------
-def has_internet(timeout=3):
-    try:
-        socket.setdefaulttimeout(timeout)
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.connect(("8.8.8.8", 53))
-        return True
-    except Exception:
-        return False
-    finally:
-        try:
-            if s:
-                s.close()
-        except Exception:
-            pass
 
 # URLs / Constants
-EXTENSIONS_URL = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/refs/heads/main/assets/data//imagesd"
 LOCAL_EXTENSIONS = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/data/imagesd"
 
 # ---------------- IMAGESDOWNLOAD CLASS ----------------
@@ -67,35 +38,8 @@ class Imagesdownload(Screen):
     skin = ""
 
     def __init__(self, session):
-        # ---------------- Detect Screen Width ----------------
-        screen_width = 1280
-        try:
-            screen_width = getDesktop(0).size().width()
-        except Exception:
-            pass
-
-        # ---------------- Load Skin ----------------
-        base_skin_path = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/"
-        skin_files = {
-            "hd": os.path.join(base_skin_path, "eliesatpanel_hd.xml"),
-            "fhd": os.path.join(base_skin_path, "eliesatpanel_fhd.xml"),
-            "default": os.path.join(base_skin_path, "eliesatpanel.xml")
-        }
-
-        skin_file = (
-            skin_files["fhd"] if screen_width >= 1920 and os.path.exists(skin_files["fhd"])
-            else skin_files["hd"] if os.path.exists(skin_files["hd"])
-            else skin_files["default"]
-        )
-
-        try:
-            with open(skin_file, "r", encoding="utf-8") as f:
-                self.skin = f.read()
-        except Exception:
-            self.skin = """<screen name="Imagesdownload" position="center,center" size="1280,720">
-                              <eLabel text="Skin Missing" position="center,center" size="400,50"
-                              font="Regular;30" halign="center" valign="center"/>
-                           </screen>"""
+        # ---------------- Skin ----------------
+        self.skin = skin_loader().load("eliesatpanel")
 
         # ---------------- Initialize Screen ----------------
         Screen.__init__(self, session)
@@ -117,7 +61,7 @@ class Imagesdownload(Screen):
                     SCOPE_PLUGINS,
                     "Extensions/ElieSatPanelGrid/assets/icons/default.png"
                 )
-            self.iconPixmap = LoadPixmap(icon_path)
+            self.iconPixmap = pixmap_cache().load(icon_path)
         except Exception:
             self.iconPixmap = None
 
@@ -130,12 +74,7 @@ class Imagesdownload(Screen):
         self["description"] = Label("")
         self["pageinfo"] = Label("")
         self["pagelabel"] = Label("")
-        self["image_name"] = Label(f"Image: {get_image_name()}")
-        self["local_ip"] = Label(f"IP: {get_local_ip()}")
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label(f"Python: {get_python_version()}")
-        self["net_status"] = Label(f"Net: {check_internet()}")
+        system_info().attach(self)
 
         vertical_left = "\n".join(list("Version " + Version))
         vertical_right = "\n".join(list("By ElieSat"))
@@ -165,6 +104,7 @@ class Imagesdownload(Screen):
             },
             -1,
         )
+        add_jump_actions(self)
 
         # ---------------- Layout Finish ----------------
         self.onLayoutFinish.append(self.load_main_menu)
@@ -177,7 +117,9 @@ class Imagesdownload(Screen):
             pass
 
         # ---------------- Background tasks ----------------
-        Timer(1, self.update_extensions_from_github).start()
+        catalog_sync().subscribe(LOCAL_EXTENSIONS, self.on_catalog_updated)
+        self.onClose.append(lambda: catalog_sync().unsubscribe(self.on_catalog_updated))
+        warm_pool().attach(self, (LOCAL_EXTENSIONS,))
 
     # ---------------- Main Menu ----------------
     def load_main_menu(self):
@@ -224,25 +166,7 @@ class Imagesdownload(Screen):
         try:
             if not os.path.exists(LOCAL_EXTENSIONS):
                 raise FileNotFoundError(f"extensions file not found: {LOCAL_EXTENSIONS}")
-            with open(LOCAL_EXTENSIONS, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            name = version = desc = st = ""
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith("Package:"):
-                    name = line.split(":", 1)[1].strip()
-                elif line.startswith("Version:"):
-                    ver_line = line.split(":", 1)[1].strip()
-                    parts = ver_line.split(None, 1)
-                    version = parts[0]
-                    desc = parts[1] if len(parts) > 1 else ""
-                elif line.startswith("Status:"):
-                    st = line.split(":", 1)[1].strip()
-                    if st.lower() == status.lower():
-                        packages.append((f"{name}-{version}", desc))
-                    name = version = desc = st = ""
+            packages = get_catalog(LOCAL_EXTENSIONS).items(status)
             if not packages:
                 packages.append((f"No packages with Status: {status}", ""))
         except Exception as e:
@@ -267,26 +191,11 @@ class Imagesdownload(Screen):
         if not script_url:
             print("[Imagesdownload] No script found for", selected_label)
             return
-        cmd = f'wget -q --no-check-certificate "{script_url}" -O - | /bin/sh'
-        self.session.open(Console, title=f"Running {selected_label}...", cmdlist=[cmd], closeOnSuccess=True)
+        run_script(self.session, script_url, f"Running {selected_label}...")
 
     def _find_script_url(self, pkg_name):
         try:
-            with open(LOCAL_EXTENSIONS, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            block = {}
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith("Package:"):
-                    if block and block.get("Package") == pkg_name:
-                        return next((v for v in block.values() if isinstance(v, str) and v.endswith(".sh")), None)
-                    block = {"Package": line.split(":", 1)[1].strip()}
-                elif "=" in line:
-                    key, val = line.split("=", 1)
-                    block[key.strip()] = val.strip().strip("'\"")
-            return None
+            return get_catalog(LOCAL_EXTENSIONS).script_url(pkg_name)
         except Exception as e:
             print("[Imagesdownload] _find_script_url error:", e)
             return None
@@ -333,33 +242,13 @@ class Imagesdownload(Screen):
         except Exception:
             self["pagelabel"].setText("")
 
-    # ---------------- GitHub Extensions Update ----------------
-    def update_extensions_from_github(self):
-        try:
-            response = requests.get(EXTENSIONS_URL, timeout=10)
-            if response.status_code != 200:
-                print(f"[Imagesdownload] Failed to fetch extensions: {response.status_code}")
-                return False
-            new_hash = hashlib.md5(response.content).hexdigest()
-            local_hash = None
-            if os.path.exists(LOCAL_EXTENSIONS):
-                with open(LOCAL_EXTENSIONS, "rb") as f:
-                    local_hash = hashlib.md5(f.read()).hexdigest()
-            if local_hash == new_hash:
-                print("[Imagesdownload] Extensions already up-to-date")
-                return False
-            with open(LOCAL_EXTENSIONS, "wb") as f:
-                f.write(response.content)
-            print("[Imagesdownload] Extensions file updated from GitHub")
-            if not self.in_submenu:
-                self.load_main_menu()
-            else:
-                for cat in self.main_categories:
-                    if cat[0] == self.submenu_title:
-                        self.load_sub_menu(cat[2], cat[0])
-                        break
-            return True
-        except Exception as e:
-            print("[Imagesdownload] update_extensions_from_github error:", e)
-            return False
-
+    # ---------------- Catalog Sync ----------------
+    def on_catalog_updated(self, path):
+        """Reload the visible menu after the shared sync service replaced the catalog file."""
+        if not self.in_submenu:
+            self.load_main_menu()
+        else:
+            for cat in self.main_categories:
+                if cat[0] == self.submenu_title:
+                    self.load_sub_menu(cat[2], cat[0])
+                    break
@@ -1,14 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-    is_device_unlocked
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_cache
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
 from Components.ActionMap import ActionMap
@@ -16,7 +11,7 @@ from Components.Label import Label
 from Components.ProgressBar import ProgressBar
 from Components.ChoiceList import ChoiceEntryComponent, ChoiceList
 from Components.Pixmap import Pixmap
-from enigma import eTimer, getDesktop
+from enigma import eTimer
 import requests
 import os
 import re
@@ -166,31 +161,15 @@ for group in GROUPS:
         BOX_FALLBACKS[hostname] = group
 
 class Imagesdownloader(Screen):
-    width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-    skin_file = (
-        "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/imagesdownloader_fhd.xml"
-        if width >= 1920
-        else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/imagesdownloader_hd.xml"
-    )
-    try:
-        with open(skin_file, "r") as f:
-            skin = f.read()
-    except Exception as e:
-        print(f"[ElieSatPanel] Failed to load skin: {e}")
-        skin = "<screen></screen>"
-
     LOG_FILE = "/tmp/extra1_downloads.log"
 
     def __init__(self, session):
+        self.skin = skin_loader().load("imagesdownloader", "<screen></screen>")
         Screen.__init__(self, session)
         self.session = session
 
         # ---------------- ONLY LOAD IF DEVICE UNLOCKED AND FILES EXIST ----------------
-        unlock_ok = is_device_unlocked()
-        unlock_file_exists = os.path.exists("/etc/eliesat_unlocked.cfg")
-        main_mac_exists = os.path.exists("/etc/eliesat_main_mac.cfg")
-
-        if not unlock_ok or not unlock_file_exists or not main_mac_exists:
+        if not platform_facts().unlocked:
             self.close()
             return
 
@@ -202,12 +181,7 @@ class Imagesdownloader(Screen):
         self.onLayoutFinish.append(self._safeLoadDeviceIcon)
 
         self["item_name"] = Label("")
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
         self["device_name"] = Label("Device: " + self.hostname)
         self["download_info"] = Label("")
 
@@ -276,7 +250,12 @@ class Imagesdownloader(Screen):
 
         if os.path.exists(icon_path):
             try:
-                self["device_icon"].instance.setPixmapFromFile(icon_path)
+                # Decoded once per session, later opens reuse the cached pixmap
+                pixmap = pixmap_cache().load(icon_path)
+                if pixmap:
+                    self["device_icon"].instance.setPixmap(pixmap)
+                else:
+                    self["device_icon"].instance.setPixmapFromFile(icon_path)
             except Exception as e:
                 print(f"[ElieSatPanel] Failed to set pixmap: {e}")
         else:
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
 import os
 import sys
 import subprocess
@@ -25,10 +27,23 @@ PLUGIN_TMP = "/tmp/eliesatpanelgrid-main.tar.gz"
 SCRIPTS_TMP = "/tmp/scripts-main.tar.gz"
 
 PLUGIN_DIR = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid"
+# New tree is built next to the installed one (same filesystem) and renamed in;
+# kept outside Extensions so enigma2 never loads a half built tree
+PLUGIN_NEW = "/usr/lib/enigma2/python/Plugins/.ElieSatPanelGrid.new"
+PLUGIN_OLD = "/usr/lib/enigma2/python/Plugins/.ElieSatPanelGrid.old"
+RESTART_FILES = ["plugin.py"]
+PLUGIN_RAW = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/main/"
+TREE_MANIFEST = "assets/plugin_manifest.json"
 SCRIPTS_PATH = "/usr/script/Eliesat-Eliesatpanel.sh"
 
 OUTPUT_LOG = "/tmp/panel.txt"
 
+DEPENDENCIES = ["python3-requests", "python3-six"]
+OPKG_LISTS = "/var/lib/opkg/lists"
+OPKG_UPDATE_TTL = 6 * 60 * 60       # seconds a feed index download stays fresh
+
+LOG_LOCK = threading.Lock()
+
 
 # --------------------------------------------------
 # UTILITIES
@@ -42,8 +57,9 @@ def log(msg, newline=True):
     else:
         print(f"\r{line}", end="", flush=True)
 
-    with open(OUTPUT_LOG, "a") as f:
-        f.write(line + "\n")
+    with LOG_LOCK:
+        with open(OUTPUT_LOG, "a") as f:
+            f.write(line + "\n")
 
     sys.stdout.flush()
 
@@ -88,13 +104,44 @@ def detect_package_manager():
     return None
 
 
-def install_package(pkg, manager):
+def lists_fresh():
+    """True if `opkg update` ran less than OPKG_UPDATE_TTL ago (newest feed index file)."""
+    try:
+        newest = max(os.path.getmtime(os.path.join(OPKG_LISTS, n)) for n in os.listdir(OPKG_LISTS))
+    except (OSError, ValueError):
+        return False
+    return time.time() - newest < OPKG_UPDATE_TTL
+
+
+def missing_packages(pkgs, manager):
+    """The packages of `pkgs` that are not installed yet, each listed once."""
+    wanted = list(dict.fromkeys(pkgs))
+    if manager == "opkg":
+        try:
+            out = subprocess.check_output(["opkg", "list-installed"], stderr=subprocess.DEVNULL)
+        except Exception:
+            return wanted
+        installed = set(line.split(" - ")[0] for line in out.decode("utf-8", "ignore").splitlines())
+        return [p for p in wanted if p not in installed]
+    return wanted
+
+
+def install_packages(pkgs, manager):
+    """
+    Missing packages in one transaction; the feed index is downloaded at most
+    once per OPKG_UPDATE_TTL.
+    """
+    pkgs = missing_packages(pkgs, manager)
+    if not pkgs:
+        return
+    names = " ".join(pkgs)
     if manager == "opkg":
-        run("opkg update", silent=True)
-        run(f"opkg install {pkg}", silent=True)
+        if not lists_fresh():
+            run("opkg update", silent=True)
+        run(f"opkg install {names}", silent=True)
     elif manager == "apt":
         run("apt-get update", silent=True)
-        run(f"apt-get install -y {pkg}", silent=True)
+        run(f"apt-get install -y {names}", silent=True)
 
 
 def download(url, dest):
@@ -106,6 +153,178 @@ def extract_tar(tar_path, dest="/tmp"):
         tar.extractall(path=dest, numeric_owner=False)
 
 
+# --------------------------------------------------
+# DIFFERENTIAL UPDATE
+# --------------------------------------------------
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                h.update(block)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def read_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f).get("files", {})
+    except Exception:
+        return {}
+
+
+def prepare_tree():
+    """Hard linked copy of the installed tree in PLUGIN_NEW (real copies if links fail)."""
+    shutil.rmtree(PLUGIN_NEW, ignore_errors=True)
+    ignore = shutil.ignore_patterns("__pycache__", "*.tmp")
+    try:
+        shutil.copytree(PLUGIN_DIR, PLUGIN_NEW, copy_function=os.link, ignore=ignore)
+    except (OSError, shutil.Error):
+        shutil.rmtree(PLUGIN_NEW, ignore_errors=True)
+        shutil.copytree(PLUGIN_DIR, PLUGIN_NEW, ignore=ignore)
+
+
+def swap_in():
+    """Rename PLUGIN_NEW to PLUGIN_DIR, putting the old tree back if that fails."""
+    shutil.rmtree(PLUGIN_OLD, ignore_errors=True)
+    if os.path.exists(PLUGIN_DIR):
+        os.rename(PLUGIN_DIR, PLUGIN_OLD)
+    try:
+        os.rename(PLUGIN_NEW, PLUGIN_DIR)
+    except OSError:
+        if os.path.exists(PLUGIN_OLD):
+            os.rename(PLUGIN_OLD, PLUGIN_DIR)
+        raise
+    shutil.rmtree(PLUGIN_OLD, ignore_errors=True)
+
+
+def update_changed_files():
+    """
+    Bring an installed plugin up to date from assets/plugin_manifest.json:
+    only files whose size or sha256 differ are downloaded into a hard linked
+    copy of the tree, which is then swapped in.
+    Returns the changed paths, or None if the full install is needed.
+    """
+    try:
+        with urllib.request.urlopen(PLUGIN_RAW + TREE_MANIFEST, timeout=10) as resp:
+            manifest = json.loads(resp.read().decode("utf-8"))
+        files = manifest.get("files") if manifest.get("format") == 1 else None
+    except Exception:
+        files = None
+    if not files:
+        return None
+
+    changed = []
+    for rel, entry in sorted(files.items()):
+        if rel.startswith("/") or ".." in rel.split("/"):
+            return None
+        path = os.path.join(PLUGIN_DIR, rel)
+        if os.path.isfile(path) and os.path.getsize(path) == entry.get("size") \
+                and sha256_file(path) == entry.get("sha256"):
+            continue
+        changed.append(rel)
+    removed = [rel for rel in read_manifest(os.path.join(PLUGIN_DIR, TREE_MANIFEST)) if rel not in files]
+
+    try:
+        prepare_tree()
+        for rel in changed:
+            # The target may be a hard link to the installed file: write beside it, then rename
+            staged = os.path.join(PLUGIN_NEW, rel)
+            os.makedirs(os.path.dirname(staged), exist_ok=True)
+            download(PLUGIN_RAW + rel, staged + ".tmp")
+            if sha256_file(staged + ".tmp") != files[rel].get("sha256"):
+                raise ValueError("hash mismatch for " + rel)
+            os.replace(staged + ".tmp", staged)
+        for rel in removed:
+            if os.path.isfile(os.path.join(PLUGIN_NEW, rel)):
+                os.remove(os.path.join(PLUGIN_NEW, rel))
+        # Hard linked to the installed manifest as well: replace, never rewrite in place
+        staged = os.path.join(PLUGIN_NEW, TREE_MANIFEST)
+        with open(staged + ".tmp", "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(staged + ".tmp", staged)
+        swap_in()
+    except Exception as e:
+        log(f"Differential update failed: {e}")
+        shutil.rmtree(PLUGIN_NEW, ignore_errors=True)
+        return None
+
+    size = sum(files[rel].get("size", 0) for rel in changed)
+    log(f"Updated {len(changed)} files ({size} bytes), removed {len(removed)}")
+    return changed
+
+
+def install_full():
+    """
+    Whole tarball, extracted in /tmp and moved to PLUGIN_NEW before the swap.
+    Returns True if enigma2 has to be restarted.
+    """
+    download(PLUGIN_URL, PLUGIN_TMP)
+    extract_tar(PLUGIN_TMP)
+
+    src = "/tmp/eliesatpanelgrid-main"
+    if not os.path.exists(src):
+        raise RuntimeError("no eliesatpanelgrid-main folder in the plugin archive")
+    # A fresh install has no loaded plugin to reload
+    restart = not os.path.exists(PLUGIN_DIR) or any(
+        sha256_file(os.path.join(PLUGIN_DIR, rel)) != sha256_file(os.path.join(src, rel))
+        for rel in RESTART_FILES
+    )
+    shutil.rmtree(PLUGIN_NEW, ignore_errors=True)
+    shutil.move(src, PLUGIN_NEW)
+    swap_in()
+    return restart
+
+
+# --------------------------------------------------
+# PARALLEL STEPS
+# --------------------------------------------------
+
+def install_plugin():
+    """Changed files of an installed plugin, else the whole tarball. Returns True if a restart is needed."""
+    changed = update_changed_files() if os.path.exists(PLUGIN_DIR) else None
+    if changed is not None:
+        return any(rel in RESTART_FILES for rel in changed)
+    return install_full()
+
+
+def fetch_scripts():
+    """Download and extract the scripts archive in /tmp; copied by install_scripts()."""
+    download(SCRIPTS_URL, SCRIPTS_TMP)
+    extract_tar(SCRIPTS_TMP)
+
+
+def install_scripts():
+    run("cp -r /tmp/scripts-main/usr/* /usr/", silent=True)
+
+
+def run_parallel(steps):
+    """
+    Run {name: function} on one thread each and wait for all of them.
+    Returns {name: result} of the steps that returned normally; a failed step
+    is logged and left out.
+    """
+    results = {}
+
+    def worker(name, func):
+        started = time.time()
+        try:
+            results[name] = func()
+        except Exception as e:
+            log(f"ERROR: {name} failed: {e}")
+        log(f"{name} took {time.time() - started:.1f}s")
+
+    threads = [threading.Thread(target=worker, args=(name, func)) for name, func in steps.items()]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
 # --------------------------------------------------
 # ANIMATION
 # --------------------------------------------------
@@ -159,28 +378,20 @@ stop_animation = threading.Event()
 thread = threading.Thread(target=animated_message, args=(stop_animation,))
 thread.start()
 
-# Install dependencies
+# Dependencies, plugin and scripts download at the same time: the downloads
+# run while the package manager works
+install_started = time.time()
+steps = {"plugin": install_plugin}
+if not os.path.exists(SCRIPTS_PATH):
+    steps["scripts"] = fetch_scripts
 if pkg_manager:
-    install_package("python3-requests", pkg_manager)
-    install_package("python3-six", pkg_manager)
-
-# Remove old plugin
-if os.path.exists(PLUGIN_DIR):
-    shutil.rmtree(PLUGIN_DIR)
+    steps["dependencies"] = lambda: install_packages(DEPENDENCIES, pkg_manager)
+results = run_parallel(steps)
+failed = [name for name in steps if name not in results]
 
-# Install plugin
-download(PLUGIN_URL, PLUGIN_TMP)
-extract_tar(PLUGIN_TMP)
-
-src = "/tmp/eliesatpanelgrid-main"
-if os.path.exists(src):
-    shutil.move(src, PLUGIN_DIR)
-
-# Install scripts if missing
-if not os.path.exists(SCRIPTS_PATH):
-    download(SCRIPTS_URL, SCRIPTS_TMP)
-    extract_tar(SCRIPTS_TMP)
-    run("cp -r /tmp/scripts-main/usr/* /usr/", silent=True)
+# Copied into /usr only once the package manager is done writing there
+if "scripts" in results:
+    install_scripts()
 
 # Stop animation
 stop_animation.set()
@@ -193,9 +404,26 @@ for f in [PLUGIN_TMP, SCRIPTS_TMP]:
 
 log("--------------------------------------------------")
 log("--------------------------------------------------")
-log("ElieSatPanelGrid installed successfully.")
+if "plugin" in failed:
+    # Nothing new was installed: keep enigma2 running
+    log("ERROR: ElieSatPanelGrid was not installed.")
+    log(f"Install time: {time.time() - install_started:.1f}s")
+    log("--------------------------------------------------")
+    sys.exit(1)
+if failed:
+    log(f"ElieSatPanelGrid installed, but {', '.join(failed)} failed (see {OUTPUT_LOG}).")
+else:
+    log("ElieSatPanelGrid installed successfully.")
+log(f"Install time: {time.time() - install_started:.1f}s")
 log("--------------------------------------------------")
 
+restart_needed = results["plugin"]
+if not restart_needed:
+    # The panel re-imports its modules when it is opened again
+    log("No restart needed, reopen the panel to load the new version.")
+    log("Done")
+    sys.exit(0)
+
 # Countdown
 for i in range(10, 0, -1):
     log(f"Restarting Enigma2 in {i} seconds...", newline=False)
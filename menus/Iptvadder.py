@@ -2,15 +2,8 @@
 import os
 import re
 from enigma import eTimer
-from enigma import getDesktop
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
 from Components.ActionMap import ActionMap
@@ -22,21 +15,8 @@ from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
 
 class Iptvadder(Screen, ConfigListScreen):
 
-    width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-
-    skin_file = (
-        "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/iptvadder_fhd.xml"
-        if width >= 1920
-        else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/iptvadder_hd.xml"
-    )
-
-    try:
-        with open(skin_file, "r") as f:
-            skin = f.read()
-    except:
-        skin = "<screen></screen>"
-
     def __init__(self, session):
+        self.skin = skin_loader().load("iptvadder", "<screen></screen>")
         Screen.__init__(self, session)
         self.session = session
         self.setTitle(_("Subscription Editor"))
@@ -82,12 +62,7 @@ class Iptvadder(Screen, ConfigListScreen):
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
 
         # System info
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         # Buttons
         self["red"] = Label(_("Check Path"))
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+JumpIndex.py
+Prefix index over grid item titles for type-ahead.
+Built once per list: every prefix up to PREFIX_LEN characters maps to the item
+indices starting with it, so a typed letter sequence is resolved by one lookup.
+"""
+
+PREFIX_LEN = 4      # longer input is filtered among the PREFIX_LEN matches
+
+
+class JumpIndex(object):
+    """Lowercase title prefix -> tuple of item indices (in list order)."""
+
+    def __init__(self, titles=()):
+        prefixes = {}
+        self.titles = [t.lower() for t in titles]
+        for idx, title in enumerate(self.titles):
+            for n in range(1, min(PREFIX_LEN, len(title)) + 1):
+                prefixes.setdefault(title[:n], []).append(idx)
+        self.prefixes = dict((k, tuple(v)) for k, v in prefixes.items())
+
+    def matches(self, text):
+        """Indices of the items whose title starts with `text`."""
+        text = text.lower()
+        found = self.prefixes.get(text[:PREFIX_LEN], ())
+        if len(text) > PREFIX_LEN:
+            found = tuple(i for i in found if self.titles[i].startswith(text))
+        return found
+
+    def find(self, text):
+        """
+        Index of the first item starting with `text`, or None.
+        Repeating one letter ("aaa") steps through the items starting with it.
+        """
+        found = self.matches(text)
+        if found:
+            return found[0]
+        if text and text == text[0] * len(text):
+            found = self.matches(text[0])
+            if found:
+                return found[(len(text) - 1) % len(found)]
+        return None
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+KeyRepeat.py
+Main loop input engine for grid navigation.
+Key presses are queued and applied together once per frame by a single eTimer,
+so a held key on a fast remote costs one redraw per frame and no threads.
+Long holds repeat each move a few times to scroll faster.
+"""
+
+import time
+
+from enigma import eTimer
+
+FRAME_MS = 40               # at most one redraw per frame
+HOLD_GAP = 0.25             # seconds between presses still counted as one hold
+ACCELERATION = ((20, 3), (8, 2))    # (presses held, moves per press), largest first
+
+
+class KeyRepeat(object):
+    """Coalesces queued moves and hands them to `apply(moves)` on the main loop."""
+
+    def __init__(self, apply):
+        self.apply = apply
+        self.pending = []
+        self.held = 0
+        self.last_press = 0.0
+        self.timer = eTimer()
+        self.timer.callback.append(self.flush)
+        self.busy = False
+
+    def factor(self):
+        for presses, moves in ACCELERATION:
+            if self.held >= presses:
+                return moves
+        return 1
+
+    def push(self, move):
+        """Queue `move` (whatever `apply` understands). The first press of a burst is applied at once."""
+        now = time.time()
+        self.held = self.held + 1 if now - self.last_press < HOLD_GAP else 0
+        self.last_press = now
+
+        self.pending.extend([move] * self.factor())
+        if not self.busy:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            self.busy = False
+            return
+        moves, self.pending = self.pending, []
+        self.busy = True
+        try:
+            self.apply(moves)
+        finally:
+            # Presses arriving during the next frame are applied together
+            self.timer.start(FRAME_MS, True)
+
+    def stop(self):
+        self.timer.stop()
+        self.pending = []
+        self.busy = False
@@ -3,15 +3,8 @@
 # -----------------------------
 # IMPORTS
 # -----------------------------
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-    is_device_unlocked
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import is_device_unlocked
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
 
 from Screens.Screen import Screen
 from Screens.MessageBox import MessageBox
@@ -75,12 +68,7 @@ class Libraries(Screen):
         # -----------------------------
         # SYSTEM INFO LABELS
         # -----------------------------
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         # -----------------------------
         # BUTTON LABELS
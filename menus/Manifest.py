@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Manifest.py
+Per-file content hashes of the assets/data catalogs.
+Hashes are git blob SHA-1s, the same value GitHub returns as `sha` in its
+contents API, so a local file can be compared with either source without
+downloading it. Run this module to regenerate assets/manifest.json.
+
+The plugin tree manifest (assets/plugin_manifest.json) lists every other file
+of the plugin with its SHA-256 and size, so a self-update only downloads the
+files that changed. Run this module with --tree to regenerate it.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+from typing import Dict, Iterable, Optional
+
+MANIFEST_FORMAT = 1
+TREE_MANIFEST = "assets/plugin_manifest.json"
+# assets/data is synced separately through assets/manifest.json, tests never run on a box
+TREE_SKIP_DIRS = ("assets/data/", "tests/")
+
+
+def blob_sha1(data: bytes) -> str:
+    """Return the git blob SHA-1 of `data`."""
+    h = hashlib.sha1(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
+def file_sha1(path: str) -> Optional[str]:
+    """Return the git blob SHA-1 of a local file or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return blob_sha1(f.read())
+    except Exception:
+        return None
+
+
+def file_sha256(path: str) -> Optional[str]:
+    """Return the SHA-256 of a local file or None if it cannot be read."""
+    try:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                h.update(block)
+        return h.hexdigest()
+    except Exception:
+        return None
+
+
+def tree_path_allowed(rel: str) -> bool:
+    """True for plugin files covered by the tree manifest (no caches, state files or catalogs)."""
+    parts = rel.split("/")
+    if any(p.startswith(".") or p == "__pycache__" or p == ".." for p in parts):
+        return False
+    if rel.endswith((".pyc", ".pyo", ".tmp")) or rel in (TREE_MANIFEST, "assets/manifest.json"):
+        return False
+    return not rel.startswith(TREE_SKIP_DIRS)
+
+
+def tree_files(root: str) -> Iterable[str]:
+    """Relative paths of the plugin files below `root` (git tracked files when run in a checkout)."""
+    try:
+        out = subprocess.check_output(["git", "ls-files"], cwd=root, stderr=subprocess.DEVNULL)
+        paths = out.decode("utf-8").splitlines()
+    except Exception:
+        paths = []
+        for base, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+            for name in names:
+                paths.append(os.path.relpath(os.path.join(base, name), root).replace(os.sep, "/"))
+    return sorted(p for p in paths if tree_path_allowed(p) and os.path.isfile(os.path.join(root, p)))
+
+
+def build_tree_manifest(root: str) -> dict:
+    """Return {"format": 1, "files": {relpath: {"sha256": ..., "size": ...}}} for a plugin tree."""
+    files: Dict[str, dict] = {}
+    for rel in tree_files(root):
+        path = os.path.join(root, rel)
+        files[rel] = {"sha256": file_sha256(path), "size": os.path.getsize(path)}
+    return {"format": MANIFEST_FORMAT, "files": files}
+
+
+def build_manifest(folder: str) -> dict:
+    """Return {"format": 1, "files": {name: {"sha": ..., "size": ...}}} for a data folder."""
+    files: Dict[str, dict] = {}
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        if name.startswith(".") or name.endswith(".tmp") or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        files[name] = {"sha": blob_sha1(data), "size": len(data)}
+    return {"format": MANIFEST_FORMAT, "files": files}
+
+
+if __name__ == "__main__":
+    import sys
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if sys.argv[1:2] == ["--tree"]:
+        target = os.path.join(root, TREE_MANIFEST)
+        manifest = build_tree_manifest(root)
+    else:
+        folder = sys.argv[1] if len(sys.argv) > 1 else os.path.join(root, "assets", "data")
+        target = sys.argv[2] if len(sys.argv) > 2 else os.path.join(root, "assets", "manifest.json")
+        manifest = build_manifest(folder)
+    with open(target, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+    print("Wrote", target)
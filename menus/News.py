@@ -10,35 +10,18 @@ from Screens.Screen import Screen
 from Components.ActionMap import ActionMap
 from Components.ScrollLabel import ScrollLabel
 from Components.Label import Label
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from enigma import getDesktop
 
 
 class News(Screen):
     def __init__(self, session):
-        # 🔹 Choose skin based on resolution
-        screen_width = getDesktop(0).size().width()
-        skin_path = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/news_hd.xml"
-        if screen_width >= 1920:
-            skin_path = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/news_fhd.xml"
-
-        if os.path.exists(skin_path):
-            with open(skin_path, "r") as f:
-                self.skin = f.read()
-        else:
-            # fallback inline skin if missing
-            self.skin = """<screen name="News" position="center,center" size="1280,720">
+        # 🔹 Skin for the current resolution (inline fallback if missing)
+        self.skin = skin_loader().load("news", """<screen name="News" position="center,center" size="1280,720">
                 <eLabel text="News skin missing!" position="center,center" size="400,40"
                     font="Regular;24" halign="center" valign="center" />
-            </screen>"""
+            </screen>""")
 
         Screen.__init__(self, session)
         self.session = session
@@ -51,12 +34,7 @@ class News(Screen):
         self["right_bar"] = Label(vertical_right)
 
         # System info
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         # Scrollable GitHub text
         self["github_text"] = ScrollLabel("Loading...")
@@ -8,7 +8,8 @@ from Screens.MessageBox import MessageBox
 from Screens.VirtualKeyBoard import VirtualKeyBoard
 from Components.Label import Label
 from Components.ActionMap import ActionMap
-from enigma import getDesktop
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
 
 # ---------------- Unlock marker path ----------------
 UNLOCK_FLAG = "/etc/eliesat_unlocked.cfg"
@@ -149,15 +150,8 @@ def make_password_from_mac(mac):
     return full_pass[:4]  # first 4 characters as password
 
 def is_unlocked():
-    if not os.path.exists(UNLOCK_FLAG):
-        return False
-    try:
-        with open(UNLOCK_FLAG, "r") as f:
-            saved_password = f.read().strip()
-        expected_password = make_password_from_mac(get_main_mac())
-        return bool(saved_password and expected_password and saved_password == expected_password)
-    except Exception:
-        return False
+    # Cached, recomputed only when the unlock / MAC file changes
+    return platform_facts().unlocked
 
 def set_unlocked(password):
     try:
@@ -166,6 +160,8 @@ def set_unlocked(password):
         return True
     except Exception:
         return False
+    finally:
+        platform_facts().invalidate()
 
 # ---------------- PANEL MANAGER SCREEN ----------------
 class PanelManager(Screen):
@@ -174,22 +170,14 @@ class PanelManager(Screen):
         self.session = session
 
         # ---------------- Load correct skin ----------------
-        width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-        skin_file = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/panel_manager_fhd.xml" \
-            if width >= 1920 else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/panel_manager_hd.xml"
-        try:
-            with open(skin_file, "r") as f:
-                self.skin = f.read()
-        except Exception as e:
-            print(f"[ElieSatPanel] Failed to load skin: {e}")
-            self.skin = "<screen></screen>"
+        self.skin = skin_loader().load("panel_manager", "<screen></screen>")
 
         self.dir_index = PANEL_DIRS.index(load_last_dir())
         self.current_dir = PANEL_DIRS[self.dir_index]
 
         self.username_value = "ElieSat"
         self.password_value = ""
-        self.mac = get_main_mac() or "Unknown"
+        self.mac = platform_facts().main_mac or "Unknown"
         self.device_name = os.uname().nodename
         self.expected_password = make_password_from_mac(self.mac)
 
@@ -17,17 +17,15 @@ from Components.ProgressBar import ProgressBar
 from Tools.LoadPixmap import LoadPixmap
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS
 
-from enigma import getDesktop, eConsoleAppContainer, eTimer
+from enigma import eConsoleAppContainer, eTimer
 
-from threading import Timer
 import requests
 import hashlib
 
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip, check_internet, get_image_name,
-    get_python_version, get_storage_info, get_ram_info
-)
+from Plugins.Extensions.ElieSatPanelGrid.menus.CatalogSync import catalog_sync
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
 
 
 def _(txt):
@@ -106,13 +104,8 @@ class InstallationReport(Screen):
 
 class Piconstudio(Screen):
 
-    width = getDesktop(0).size().width()
-    skin = open(
-        "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/%s"
-        % ("eliesatpanel_list_fhd.xml" if width >= 1920 else "eliesatpanel_list_hd.xml")
-    ).read()
-
     def __init__(self, session):
+        self.skin = skin_loader().load("eliesatpanel_list")
         Screen.__init__(self, session)
         self.session = session
         self.setTitle(_("PiconStudio"))
@@ -126,12 +119,7 @@ class Piconstudio(Screen):
         self["key_yellow"] = Label(_("Select All"))
         self["key_blue"] = Label(_("Report"))
 
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
@@ -204,7 +192,8 @@ class Piconstudio(Screen):
         # ===== BUILD MENU =====
         self.buildList()
 
-        Timer(1, self.update_extensions_from_github).start()
+        catalog_sync().subscribe(LOCAL_EXTENSIONS, self.on_catalog_updated)
+        self.onClose.append(lambda: catalog_sync().unsubscribe(self.on_catalog_updated))
 
     # ================= FILE =================
     def status_path(self):
@@ -561,33 +550,7 @@ class Piconstudio(Screen):
             return
         Screen.close(self)
 
-    # ================= GITHUB UPDATE =================
-    def update_extensions_from_github(self):
-        try:
-            response = requests.get(EXTENSIONS_URL, timeout=10)
-            if response.status_code != 200:
-                print(f"[Picons] Failed to fetch extensions: {response.status_code}")
-                return False
-
-            new_hash = hashlib.md5(response.content).hexdigest()
-            local_hash = None
-            if os.path.exists(LOCAL_EXTENSIONS):
-                with open(LOCAL_EXTENSIONS, "rb") as f:
-                    local_hash = hashlib.md5(f.read()).hexdigest()
-
-            if local_hash == new_hash:
-                print("[Picons] Extensions already up-to-date")
-                return False
-
-            with open(LOCAL_EXTENSIONS, "wb") as f:
-                f.write(response.content)
-
-            print("[Picons] Extensions file updated from GitHub")
-
-            # ===== AUTO REFRESH MENU =====
-            self.buildList()
-            return True
-        except Exception as e:
-            print("[Picons] update_extensions_from_github error:", e)
-            return False
-
+    # ================= CATALOG SYNC =================
+    def on_catalog_updated(self, path):
+        """Rebuild the list after the shared sync service replaced the picons file."""
+        self.buildList()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+PixmapCache.py
+Process-wide LRU cache for decoded pixmaps (menu logos, tile frames, pager arrows).
+Entries are charged by their decoded size (width * height * 4) against a byte
+budget, and the whole cache is dropped when MemAvailable falls below a threshold.
+The budget grows to the largest logo set a grid holds (fit), so the logos of
+the main panel are not evicted and decoded again on every page flip.
+It behaves like the dict it replaces (FlexibleMenu._cached_logos), so screens can
+still store their own icon under a key.
+"""
+
+import struct
+import time
+from collections import OrderedDict
+
+from Tools.LoadPixmap import LoadPixmap
+
+PIXMAP_BUDGET = 8 * 1024 * 1024         # bytes of decoded pixmaps kept
+PIXMAP_BUDGET_MAX = 24 * 1024 * 1024    # fit() never raises the budget above this
+PIXMAP_HEADROOM = 2 * 1024 * 1024       # frames, arrows and other screens' icons next to a logo set
+LOW_MEMORY_KB = 24 * 1024               # clear everything below this MemAvailable
+MEMORY_CHECK_INTERVAL = 10              # seconds between two /proc/meminfo reads
+
+
+def mem_available_kb():
+    """MemAvailable (or MemFree on old kernels) in kB, None if unknown."""
+    try:
+        free = None
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+                if line.startswith("MemFree:"):
+                    free = int(line.split()[1])
+        return free
+    except Exception:
+        return None
+
+
+def png_size(path):
+    """(width, height) from a PNG header without decoding it, or None."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(24)
+        if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+    except Exception:
+        pass
+    return None
+
+
+def pixmap_bytes(pixmap, path=None):
+    """Estimated decoded size of a pixmap (32 bit per pixel)."""
+    try:
+        size = pixmap.size()
+        return max(1, size.width() * size.height() * 4)
+    except Exception:
+        pass
+    dims = png_size(path) if path else None
+    if dims:
+        return dims[0] * dims[1] * 4
+    return 64 * 1024
+
+
+# ---------------- CACHE ----------------
+class PixmapCache(object):
+    """Byte-budgeted LRU of pixmaps with hit / miss / eviction counters."""
+
+    def __init__(self, budget=PIXMAP_BUDGET, low_memory_kb=LOW_MEMORY_KB, max_budget=PIXMAP_BUDGET_MAX):
+        self.base_budget = budget
+        self.budget = budget
+        self.max_budget = max(budget, max_budget)
+        self.low_memory_kb = low_memory_kb
+        self._items = OrderedDict()     # key -> (pixmap, bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.low_memory_clears = 0
+        self._checked = 0
+
+    # ---------------- dict compatibility ----------------
+    def __contains__(self, key):
+        return key in self._items
+
+    def __getitem__(self, key):
+        if key not in self._items:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key, pixmap):
+        self.put(key, pixmap)
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    # ---------------- store / load ----------------
+    def put(self, key, pixmap, size=None, path=None):
+        """Store `pixmap` under `key` and evict least recently used entries over budget."""
+        if key in self._items:
+            self.bytes -= self._items.pop(key)[1]
+        if pixmap is None:
+            return
+        size = size or pixmap_bytes(pixmap, path)
+        self._items[key] = (pixmap, size)
+        self.bytes += size
+        while self.bytes > self.budget and len(self._items) > 1:
+            _, (_, freed) = self._items.popitem(last=False)
+            self.bytes -= freed
+            self.evictions += 1
+
+    def fit(self, working_set):
+        """
+        Raise the budget so `working_set` bytes (the logos one grid holds)
+        fit next to PIXMAP_HEADROOM, up to max_budget. It is never lowered,
+        except by a low memory clear.
+        """
+        needed = min(self.max_budget, working_set + PIXMAP_HEADROOM)
+        if needed > self.budget:
+            self.budget = needed
+        return self.budget
+
+    def load(self, path):
+        """Return the pixmap of `path`, decoding it only on a cache miss (None if it cannot be loaded)."""
+        pixmap = self.get(path)
+        if pixmap is not None:
+            return pixmap
+        self.check_memory()
+        try:
+            pixmap = LoadPixmap(path)
+        except Exception:
+            pixmap = None
+        if pixmap is not None:
+            self.put(path, pixmap, path=path)
+        return pixmap
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def check_memory(self, force=False):
+        """Drop the whole cache when the box runs low on memory. Returns True if it was cleared."""
+        now = time.time()
+        if not force and now - self._checked < MEMORY_CHECK_INTERVAL:
+            return False
+        self._checked = now
+        available = mem_available_kb()
+        if available is not None and available < self.low_memory_kb and self._items:
+            print("[PixmapCache] Low memory (%d kB available), dropping %d pixmaps" % (available, len(self._items)))
+            self.clear()
+            self.budget = self.base_budget
+            self.low_memory_clears += 1
+            return True
+        return False
+
+    def stats(self):
+        """Counters to size the budget: hits, misses, evictions, entries, bytes, low memory clears."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._items),
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "low_memory_clears": self.low_memory_clears,
+        }
+
+
+_cache = None
+
+
+def pixmap_cache():
+    """Return the process-wide PixmapCache instance."""
+    global _cache
+    if _cache is None:
+        _cache = PixmapCache()
+    return _cache
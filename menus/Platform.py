@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Platform.py
+Static facts about the box, computed once per process: image type, desktop
+size, main MAC and the panel unlock state.
+The unlock state is computed again only after invalidate() (PanelManager.set_unlocked)
+or when the unlock or MAC file changed, which is checked with a stat instead of
+reading the files and deriving the password on every screen open.
+"""
+
+import os
+
+from enigma import getDesktop
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
+    MAIN_MAC_FILE,
+    UNLOCK_FLAG,
+    get_image_type,
+    is_device_unlocked,
+    read_main_mac,
+)
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime, st.st_size)
+    except OSError:
+        return None
+
+
+# ---------------- FACTS ----------------
+class PlatformFacts(object):
+    """Lazily computed, process-wide box facts."""
+
+    def __init__(self):
+        self._desktop = None
+        self._mac = None
+        self._unlock = None     # (file stamps, unlocked)
+        self.computed = 0       # unlock state computations, for diagnostics
+
+    def load(self):
+        """Compute every fact now (plugin start), so screens only read cached values."""
+        self.image_type
+        self.desktop_size
+        self.unlocked
+        return self
+
+    @property
+    def image_type(self):
+        return get_image_type()
+
+    @property
+    def desktop_size(self):
+        if self._desktop is None:
+            try:
+                size = getDesktop(0).size()
+                self._desktop = (size.width(), size.height())
+            except Exception:
+                self._desktop = (1280, 720)
+        return self._desktop
+
+    @property
+    def is_fhd(self):
+        return self.desktop_size[0] >= 1920
+
+    def _stamps(self):
+        return (_stamp(UNLOCK_FLAG), _stamp(MAIN_MAC_FILE))
+
+    @property
+    def main_mac(self):
+        if self._mac is None or self._mac[0] != _stamp(MAIN_MAC_FILE):
+            mac = read_main_mac()   # creates MAIN_MAC_FILE on first run
+            self._mac = (_stamp(MAIN_MAC_FILE), mac)
+        return self._mac[1]
+
+    @property
+    def unlocked(self):
+        """True if the saved password matches the main MAC and both files exist."""
+        if self._unlock is None or self._unlock[0] != self._stamps():
+            unlocked = is_device_unlocked()
+            stamps = self._stamps()
+            self._unlock = (stamps, unlocked and None not in stamps)
+            self.computed += 1
+        return self._unlock[1]
+
+    def invalidate(self):
+        """Forget the MAC and unlock state (after the password was saved)."""
+        self._mac = None
+        self._unlock = None
+
+
+_facts = None
+
+
+def platform_facts():
+    """Return the process-wide PlatformFacts instance."""
+    global _facts
+    if _facts is None:
+        _facts = PlatformFacts()
+    return _facts
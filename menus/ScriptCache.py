@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+ScriptCache.py
+Local, content-addressed copies of the catalog install scripts.
+Scripts are stored as <sha256>.sh on the HDD (or in flash when no disk is
+mounted) with an index url -> hash, ETag / Last-Modified and last use.
+A copy younger than SCRIPT_TTL runs without any network access; an older one
+is revalidated with a conditional request and still used when the server cannot
+be reached. The least recently used scripts are dropped above the size cap.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from enigma import eTimer
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Console import Console
+
+CACHE_MOUNTS = ("/media/hdd", "/media/usb")     # tried in order
+CACHE_SUBDIR = "ElieSatPanelGrid/scripts"
+FLASH_DIR = "/home/root/.cache/ElieSatPanelGrid/scripts"
+DISK_CAP = 64 * 1024 * 1024
+FLASH_CAP = 2 * 1024 * 1024
+SCRIPT_TTL = 24 * 60 * 60       # seconds a copy is used without asking the server
+INDEX_FILE = "index.json"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+POLL_INTERVAL = 100             # ms, main loop poll while a script is fetched
+
+
+def cache_location():
+    """(folder, size cap): a mounted, writable disk if any, else flash."""
+    for mount in CACHE_MOUNTS:
+        if os.path.ismount(mount) and os.access(mount, os.W_OK):
+            return os.path.join(mount, CACHE_SUBDIR), DISK_CAP
+    return FLASH_DIR, FLASH_CAP
+
+
+# ---------------- CACHE ----------------
+class ScriptCache(object):
+    """Script URL -> {"sha", "size", "etag", "modified", "fetched", "used"}, files named by sha256."""
+
+    def __init__(self, folder=None, cap=None):
+        if folder is None:
+            folder, default_cap = cache_location()
+            cap = cap or default_cap
+        self.folder = folder
+        self.cap = cap or FLASH_CAP
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        self._inflight = {}         # url -> [done callbacks] of a running fetch
+        self._timers = {}           # url -> poll timer of that fetch
+        self.hits = 0
+        self.downloads = 0
+        self.revalidated = 0
+        self.offline = 0
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.folder, INDEX_FILE), "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        path = os.path.join(self.folder, INDEX_FILE)
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(path + ".tmp", "w") as f:
+                json.dump(self._index, f)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            print("[ScriptCache] index not saved:", e)
+
+    def _path(self, sha):
+        return os.path.join(self.folder, sha + ".sh")
+
+    def _entry(self, url):
+        """Index entry of `url` whose file still exists, or None."""
+        entry = self._index.get(url)
+        if entry and os.path.exists(self._path(entry["sha"])):
+            return entry
+        return None
+
+    def _use(self, url, entry, **changes):
+        with self._lock:
+            entry.update(changes)
+            entry["used"] = time.time()
+            self._index[url] = entry
+            self._save_index()
+        return self._path(entry["sha"])
+
+    def cached(self, url, max_age=SCRIPT_TTL):
+        """Path of a copy of `url` younger than `max_age`, or None. Never touches the network."""
+        entry = self._entry(url)
+        if entry and time.time() - entry.get("fetched", 0) < max_age:
+            self.hits += 1
+            return self._use(url, entry)
+        return None
+
+    def fetch(self, url):
+        """
+        Path of the current script of `url`: the cached copy while fresh, else
+        revalidated or downloaded; a stale copy when the server is unreachable.
+        None when there is no copy at all. Blocking: call it off the main loop.
+        """
+        path = self.cached(url)
+        if path:
+            return path
+
+        entry = self._entry(url)
+        headers = dict(HEADERS)
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("modified"):
+            headers["If-Modified-Since"] = entry["modified"]
+
+        try:
+            # No certificate check, like the `wget --no-check-certificate` it replaces:
+            # boxes with an old CA bundle would otherwise never revalidate
+            resp = requests.get(url, headers=headers, timeout=10, verify=False)
+            if resp.status_code == 304 and entry:
+                self.revalidated += 1
+                return self._use(url, entry, fetched=time.time())
+            resp.raise_for_status()
+            data = resp.content
+        except Exception as e:
+            if entry:
+                print("[ScriptCache] %s unreachable (%s), using the cached copy" % (url, e))
+                self.offline += 1
+                return self._use(url, entry)
+            print("[ScriptCache] %s unavailable: %s" % (url, e))
+            return None
+
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._path(sha)
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            if not os.path.exists(path):
+                with open(path + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(path + ".tmp", path)
+        except Exception as e:
+            print("[ScriptCache] %s not stored: %s" % (url, e))
+            return None
+        self.downloads += 1
+        path = self._use(url, {}, sha=sha, size=len(data), fetched=time.time(),
+                         etag=resp.headers.get("ETag"), modified=resp.headers.get("Last-Modified"))
+        self._evict(keep=url)
+        return path
+
+    def _evict(self, keep=None):
+        """Drop the least recently used scripts while the files are over the size cap."""
+        with self._lock:
+            sizes = dict((e["sha"], e.get("size", 0)) for e in self._index.values())
+            total = sum(sizes.values())
+            for url, entry in sorted(self._index.items(), key=lambda item: item[1].get("used", 0)):
+                if total <= self.cap:
+                    break
+                if url == keep:
+                    continue
+                del self._index[url]
+                sha = entry["sha"]
+                if not any(e["sha"] == sha for e in self._index.values()):
+                    total -= sizes[sha]
+                    try:
+                        os.remove(self._path(sha))
+                    except OSError:
+                        pass
+            self._save_index()
+
+    def pending(self, url):
+        """True while `url` is being fetched."""
+        return url in self._inflight
+
+    def prepare(self, url, done):
+        """
+        Call done(path or None) on the main loop: at once for a fresh copy,
+        else after fetch() ran on a worker thread. Callers asking for a URL that
+        is already being fetched share that fetch.
+        """
+        path = self.cached(url)
+        if path:
+            done(path)
+            return
+
+        waiting = self._inflight.get(url)
+        if waiting is not None:
+            waiting.append(done)
+            return
+        self._inflight[url] = [done]
+
+        result = []
+
+        def work():
+            path = None
+            try:
+                path = self.fetch(url)
+            except Exception as e:
+                print("[ScriptCache] fetch error:", e)
+            result.append(path)     # always set, so the waiting callers are released
+
+        worker = threading.Thread(target=work)
+        worker.daemon = True
+        worker.start()
+
+        def poll():
+            if not result:
+                return
+            self._timers.pop(url).stop()
+            for callback in self._inflight.pop(url, []):
+                try:
+                    callback(result[0])
+                except Exception as e:
+                    print("[ScriptCache] callback error:", e)
+
+        timer = eTimer()
+        timer.callback.append(poll)
+        timer.start(POLL_INTERVAL, False)
+        self._timers[url] = timer
+
+    def shutdown(self):
+        """Stop the fetch polls; their callers are not called any more."""
+        for timer in self._timers.values():
+            timer.stop()
+        self._timers.clear()
+        self._inflight.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "downloads": self.downloads,
+            "revalidated": self.revalidated,
+            "offline": self.offline,
+            "scripts": len(self._index),
+            "bytes": sum(e.get("size", 0) for e in self._index.values()),
+        }
+
+
+_cache = None
+
+
+def script_cache():
+    """Return the process-wide ScriptCache instance."""
+    global _cache
+    if _cache is None:
+        _cache = ScriptCache()
+    return _cache
+
+
+def shutdown():
+    """Called by Updater.reload_modules() before this module is unloaded."""
+    global _cache
+    if _cache is not None:
+        _cache.shutdown()
+        _cache = None
+
+
+def run_script(session, url, title, closeOnSuccess=True):
+    """Run the install script at `url` in a Console, from the local cache when possible."""
+
+    def start(path):
+        if path:
+            # stdin like the old `wget -O - | /bin/sh`
+            cmd = '/bin/sh < "%s"' % path
+        else:
+            cmd = 'wget -q --no-check-certificate "%s" -O - | /bin/sh' % url
+        session.open(Console, title=title, cmdlist=[cmd], closeOnSuccess=closeOnSuccess)
+
+    cache = script_cache()
+    if cache.pending(url):
+        # OK pressed again while the script downloads: it runs once
+        print("[ScriptCache] %s is already being fetched" % url)
+        return
+    cache.prepare(url, start)
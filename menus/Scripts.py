@@ -8,16 +8,10 @@ from Screens.MessageBox import MessageBox
 from Components.ActionMap import ActionMap
 from Components.Label import Label
 from Components.MenuList import MenuList
-from enigma import eConsoleAppContainer, getDesktop
-
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip,
-    check_internet,
-    get_image_name,
-    get_python_version,
-    get_storage_info,
-    get_ram_info,
-)
+from enigma import eConsoleAppContainer
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
 from Plugins.Extensions.ElieSatPanelGrid.menus.Console import Console
 
@@ -27,11 +21,7 @@ if not os.path.exists(scriptpath):
 
 class Scripts(Screen):
     def __init__(self, session):
-        width, height = getDesktop(0).size().width(), getDesktop(0).size().height()
-        skin_file = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/scripts_fhd.xml" \
-            if width >= 1920 else "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/scripts_hd.xml"
-        with open(skin_file, "r") as f:
-            self.skin = f.read()
+        self.skin = skin_loader().load("scripts")
 
         Screen.__init__(self, session)
         self.session = session
@@ -45,12 +35,7 @@ class Scripts(Screen):
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
 
         # System info
-        self["image_name"] = Label("Image: " + get_image_name())
-        self["local_ip"] = Label("IP: " + get_local_ip())
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label("Python: " + get_python_version())
-        self["net_status"] = Label("Net: " + check_internet())
+        system_info().attach(self)
 
         # Buttons
         self["red"] = Label(_("Remove List"))
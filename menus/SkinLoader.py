@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+SkinLoader.py
+Skin XML strings shared by every screen of the panel.
+The variant of a skin (<name>_fhd.xml, <name>_hd.xml or <name>.xml) is resolved
+once for the desktop width, the text is read once and kept in memory, and a
+file is read again only when its mtime or size changed.
+"""
+
+import os
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+
+SKIN_DIR = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin"
+MISSING_SKIN = """<screen name="%s" position="center,center" size="1280,720">
+    <eLabel text="Skin Missing" position="center,center" size="400,50"
+        font="Regular;30" halign="center" valign="center"/>
+</screen>"""
+
+
+# ---------------- LOADER ----------------
+class SkinLoader(object):
+    """Skin name -> resolved file, file -> ((mtime, size), text)."""
+
+    def __init__(self, skin_dir=SKIN_DIR):
+        self.skin_dir = skin_dir
+        self._paths = {}
+        self._texts = {}
+        self.bytes_read = 0     # bytes read from disk this session
+        self.reads = 0
+        self.hits = 0
+
+    def path(self, name):
+        """The file used for skin `name`: the FHD variant on FHD desktops, else HD, else the plain file."""
+        path = self._paths.get(name)
+        if path is None:
+            variants = ("_fhd", "_hd", "") if platform_facts().is_fhd else ("_hd", "")
+            for suffix in variants:
+                path = os.path.join(self.skin_dir, name + suffix + ".xml")
+                if os.path.exists(path):
+                    break
+            self._paths[name] = path
+        return path
+
+    def load(self, name, fallback=None):
+        """Skin text of `name`, or `fallback` (a 'Skin Missing' screen by default) if it cannot be read."""
+        path = self.path(name)
+        try:
+            st = os.stat(path)
+            stamp = (st.st_mtime, st.st_size)
+            cached = self._texts.get(path)
+            if cached and cached[0] == stamp:
+                self.hits += 1
+                return cached[1]
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            self._texts[path] = (stamp, text)
+            self.bytes_read += st.st_size
+            self.reads += 1
+            return text
+        except Exception as e:
+            print("[SkinLoader] %s: %s" % (path, e))
+            return fallback if fallback is not None else MISSING_SKIN % name
+
+    def stats(self):
+        """Reads, cache hits, bytes read from disk and bytes held in memory."""
+        return {
+            "reads": self.reads,
+            "hits": self.hits,
+            "bytes_read": self.bytes_read,
+            "bytes_cached": sum(len(text) for (_, text) in self._texts.values()),
+        }
+
+
+_loader = None
+
+
+def skin_loader():
+    """Return the process-wide SkinLoader instance."""
+    global _loader
+    if _loader is None:
+        _loader = SkinLoader()
+    return _loader
+
+
+def load_skin(name, fallback=None):
+    """Shortcut for skin_loader().load(name, fallback)."""
+    return skin_loader().load(name, fallback)
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+StartupSync.py
+Startup network work shared by the splash screen and the fast launch mode:
+remote version check and the manifest based catalog sync.
+It runs on one worker thread, behind the splash screen or, in fast mode,
+while EliesatPanel is already open; progress and results reach the main loop
+through an eTimer poll.
+"""
+
+import os
+import threading
+
+import requests
+from enigma import eTimer
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import DATA_DIR, invalidate
+from Plugins.Extensions.ElieSatPanelGrid.menus.CatalogSync import catalog_sync
+from Plugins.Extensions.ElieSatPanelGrid.menus.Manifest import MANIFEST_FORMAT, blob_sha1, file_sha1
+from Plugins.Extensions.ElieSatPanelGrid.menus.VersionService import version_service
+
+REPO_RAW = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/main/"
+RAW_BASE = REPO_RAW + "assets/data/"
+MANIFEST_URL = REPO_RAW + "assets/manifest.json"
+CONTENTS_API = "https://api.github.com/repos/eliesat/eliesatpanelgrid/contents/assets/data?ref=main"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+POLL_INTERVAL = 200         # ms, main loop poll while the worker is busy
+
+
+# ---------------- CATALOG FILES ----------------
+def fetch_manifest():
+    """One small request: hashes of every data file from assets/manifest.json."""
+    try:
+        manifest = requests.get(MANIFEST_URL, headers=HEADERS, timeout=5).json()
+        if manifest.get("format") != MANIFEST_FORMAT:
+            return None
+        return [
+            {"name": name, "sha": entry.get("sha"), "download_url": RAW_BASE + name}
+            for name, entry in manifest.get("files", {}).items()
+        ]
+    except Exception as e:
+        print("[StartupSync] Manifest unavailable:", e)
+        return None
+
+
+def fetch_contents_listing():
+    """Fallback: GitHub contents API listing (also carries git blob hashes)."""
+    try:
+        files = requests.get(CONTENTS_API, headers=HEADERS, timeout=10).json()
+        return files if isinstance(files, list) else None
+    except:
+        return None
+
+
+def fetch_file_list():
+    """Remote data files as [{"name", "sha", "download_url"}], or None when offline."""
+    files = fetch_manifest()
+    if files is None:
+        files = fetch_contents_listing()
+    return files
+
+
+def changed_entries(files, folder=DATA_DIR):
+    """Content-addressed: only entries whose hash differs from the local copy."""
+    return [
+        info for info in files
+        if info.get("download_url") and info.get("sha") != file_sha1(
+            os.path.join(folder, info.get("name", "")))
+    ]
+
+
+def confirm_changed(todo, folder=DATA_DIR):
+    """
+    Check the entries changed_entries() found against the contents API.
+    assets/manifest.json can lag behind the data files it lists; the git blob
+    hash GitHub reports wins, so a stale manifest entry is not downloaded again
+    on every launch. Without the listing `todo` is returned as it is.
+    """
+    listing = fetch_contents_listing()
+    if not listing:
+        return todo
+    shas = dict((entry.get("name"), entry.get("sha")) for entry in listing)
+    confirmed = []
+    for info in todo:
+        sha = shas.get(info.get("name"))
+        if sha and sha != info.get("sha"):
+            print("[StartupSync] Manifest is stale for", info.get("name"))
+            info = dict(info, sha=sha)
+        confirmed.append(info)
+    return changed_entries(confirmed, folder)
+
+
+def stage_entry(info, folder=DATA_DIR):
+    """Download one entry next to its target as .tmp. Returns the target path or None."""
+    url = info.get("download_url")
+    dest = os.path.join(folder, os.path.basename(url))
+    try:
+        data = requests.get(url, headers=HEADERS, timeout=10).content
+        if info.get("sha") and blob_sha1(data) != info["sha"]:
+            # Not staged: the local copy stays and the file is retried on the next sync
+            print("[StartupSync] Hash mismatch for", info.get("name"))
+            return None
+        with open(dest + ".tmp", "wb") as f:
+            f.write(data)
+        return dest
+    except Exception as e:
+        print("[StartupSync] Download failed for %s: %s" % (info.get("name"), e))
+        return None
+
+
+def apply_staged(paths, folder=DATA_DIR, unchanged=()):
+    """
+    Swap staged files in with atomic renames. The files swapped in and the
+    `unchanged` ones are marked as freshly synced; a file that failed keeps
+    its old state, so its screen still checks it.
+    """
+    applied = []
+    for dest in paths:
+        try:
+            os.replace(dest + ".tmp", dest)
+            invalidate(dest)
+            applied.append(dest)
+        except Exception as e:
+            print("[StartupSync] Failed to apply %s: %s" % (dest, e))
+
+    # Screens opened right after this need no second check of the same files
+    try:
+        sync = catalog_sync()
+        for path in applied + [os.path.join(folder, name) for name in unchanged]:
+            sync.mark_checked(path)
+    except Exception as e:
+        print("[StartupSync] sync state error:", e)
+    return applied
+
+
+# ---------------- BACKGROUND RUN ----------------
+class StartupSync(object):
+    """
+    Version check + catalog sync on a worker thread.
+    Listeners get progress(percent, text) while it runs and done(result) once,
+    both on the main loop. result = {"remote", "changelog", "newer", "changed"}.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners = []        # (progress, done)
+        self._timer = None
+        self.running = False
+        self.finished = False
+        self.percent = 0
+        self.text = ""
+        self.result = {"remote": None, "changelog": "", "newer": False, "changed": []}
+
+    def start(self):
+        """Start once per session. Later calls are no-ops."""
+        if self.running or self.finished:
+            return
+        self.running = True
+        worker = threading.Thread(target=self._run)
+        worker.daemon = True
+        worker.start()
+
+        self._timer = eTimer()
+        self._timer.callback.append(self._poll)
+        self._timer.start(POLL_INTERVAL, False)
+
+    def add_listener(self, progress, done):
+        """Listeners added after the run finished are not called (results were already shown)."""
+        self._listeners.append((progress, done))
+
+    def remove_listener(self, done):
+        self._listeners = [(p, d) for (p, d) in self._listeners if d != done]
+
+    def shutdown(self):
+        """Stop reporting; a run in progress finishes on its thread without listeners."""
+        self._listeners = []
+        if self._timer is not None:
+            self._timer.stop()
+
+    def _set_progress(self, percent, text):
+        with self._lock:
+            self.percent = percent
+            self.text = text
+
+    def _run(self):
+        result = {"remote": None, "changelog": "", "newer": False, "changed": []}
+        try:
+            self._set_progress(0, "Checking version")
+            version = version_service().check()
+            result["remote"] = version["remote"]
+            result["changelog"] = version["changelog"]
+            result["newer"] = version["newer"]
+
+            self._set_progress(5, "Syncing menus")
+            os.makedirs(DATA_DIR, exist_ok=True)
+            files = fetch_file_list()
+            todo = changed_entries(files) if files is not None else []
+            if todo:
+                todo = confirm_changed(todo)
+
+            staged = []
+            for i, info in enumerate(todo):
+                dest = stage_entry(info)
+                if dest:
+                    staged.append(dest)
+                self._set_progress(5 + int((i + 1) * 95 / len(todo)), "Syncing menus")
+
+            if files is not None:
+                pending = set(info.get("name") for info in todo)
+                unchanged = [info.get("name") for info in files
+                             if info.get("download_url") and info.get("name") not in pending]
+                result["changed"] = apply_staged(staged, unchanged=unchanged)
+        except Exception as e:
+            print("[StartupSync] error:", e)
+
+        with self._lock:
+            self.result = result
+            self.percent = 100
+            self.running = False
+
+    def _poll(self):
+        with self._lock:
+            percent, text, busy = self.percent, self.text, self.running
+
+        if busy:
+            for (progress, done) in list(self._listeners):
+                try:
+                    progress(percent, text)
+                except Exception as e:
+                    print("[StartupSync] listener error:", e)
+            return
+
+        self._timer.stop()
+        self.finished = True
+
+        # Reload catalog screens that are already open
+        sync = catalog_sync()
+        for path in self.result["changed"]:
+            sync.notify(path)
+
+        for (progress, done) in list(self._listeners):
+            try:
+                done(self.result)
+            except Exception as e:
+                print("[StartupSync] listener error:", e)
+
+
+_service = None
+
+
+def startup_sync():
+    """Return the process-wide StartupSync instance."""
+    global _service
+    if _service is None:
+        _service = StartupSync()
+    return _service
+
+
+def shutdown():
+    """Called by Updater.reload_modules() before this module is unloaded."""
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
+
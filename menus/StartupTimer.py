@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+StartupTimer.py
+Per-phase timing of one panel launch, from the plugin entry to the first painted page.
+Each launch appends a block to LOG_FILE; touching OVERLAY_FLAG also shows the
+numbers on the panel.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+LOG_FILE = "/tmp/eliesat_startup.log"
+LOG_MAX_SIZE = 64 * 1024
+OVERLAY_FLAG = "/etc/eliesat_timing.cfg"    # touch this file to show the overlay
+
+
+def _box_model():
+    for path in ("/proc/stb/info/vumodel", "/proc/stb/info/boxtype", "/proc/stb/info/model"):
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except Exception:
+            pass
+    return "unknown"
+
+
+# ---------------- TIMER ----------------
+class StartupTimer(object):
+    """Collects (phase, start ms, duration ms) between start() and finish()."""
+
+    def __init__(self):
+        self.active = False
+        self.t0 = 0.0
+        self.phases = []
+        self._open = {}
+
+    def start(self):
+        """Begin a new launch measurement (plugin entry)."""
+        self.active = True
+        self.t0 = time.time()
+        self.phases = []
+        self._open = {}
+
+    def begin(self, name):
+        if self.active:
+            self._open[name] = time.time()
+
+    def end(self, name):
+        if self.active and name in self._open:
+            started = self._open.pop(name)
+            self.phases.append((name, (started - self.t0) * 1000.0, (time.time() - started) * 1000.0))
+
+    @contextmanager
+    def phase(self, name):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def summary(self):
+        """Phase lines in start order plus the total, e.g. 'check_version  +12  840 ms'."""
+        lines = ["%-22s +%6.0f %7.1f ms" % (name, at, ms)
+                 for (name, at, ms) in sorted(self.phases, key=lambda p: p[1])]
+        lines.append("%-22s %15.1f ms" % ("total", (time.time() - self.t0) * 1000.0))
+        return lines
+
+    def finish(self, version=""):
+        """Stop measuring, append the result to LOG_FILE and return the summary lines."""
+        if not self.active:
+            return []
+        for name in list(self._open):
+            self.end(name)
+        lines = self.summary()
+        self.active = False
+
+        try:
+            if os.path.exists(LOG_FILE) and os.path.getsize(LOG_FILE) > LOG_MAX_SIZE:
+                os.remove(LOG_FILE)
+            with open(LOG_FILE, "a") as f:
+                f.write("=== %s  version %s  box %s\n" % (
+                    time.strftime("%Y-%m-%d %H:%M:%S"), version, _box_model()))
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            print("[StartupTimer] Failed to write log:", e)
+
+        for line in lines:
+            print("[StartupTimer]", line)
+        return lines
+
+
+def overlay_enabled():
+    return os.path.exists(OVERLAY_FLAG)
+
+
+_timer = StartupTimer()
+
+
+def startup_timer():
+    """Return the process-wide StartupTimer instance."""
+    return _timer
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+SystemInfo.py
+Shared provider for the system info header (image, IP, storage, RAM, python, net)
+shown on every panel screen.
+Values are sampled on one background worker every INFO_INTERVAL seconds, screens
+get the cached values instantly and visible labels are updated when a value changes.
+"""
+
+import threading
+import time
+
+from Components.Label import Label
+from enigma import eTimer
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
+    get_local_ip,
+    check_internet,
+    get_image_name,
+    get_python_version,
+    get_storage_info,
+    get_ram_info,
+)
+
+INFO_INTERVAL = 30          # seconds between two samples while a screen is open
+POLL_INTERVAL = 1000        # ms, main loop check for new values
+
+
+# ---------------- PROVIDER ----------------
+class SystemInfo(object):
+    """Label name -> text cache with a sampling worker and per-screen label updates."""
+
+    def __init__(self, interval=INFO_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._screens = []
+        self._worker = None
+        self._timer = None
+        self._dirty = False
+        self._stopped = False
+        self.sampled = 0
+
+        # Cheap local values right away, network values once the worker ran
+        self.values = {
+            "image_name": "Image: " + get_image_name(),
+            "local_ip": "IP: ...",
+            "StorageInfo": get_storage_info(),
+            "RAMInfo": get_ram_info(),
+            "python_ver": "Python: " + get_python_version(),
+            "net_status": "Net: ...",
+        }
+
+    def get(self, key):
+        with self._lock:
+            return self.values.get(key, "")
+
+    # ---------------- Screens (main loop) ----------------
+    def attach(self, screen):
+        """Create the header labels on `screen` from the cache and keep them updated while it is open."""
+        with self._lock:
+            values = dict(self.values)
+        for key, text in values.items():
+            screen[key] = Label(text)
+
+        self._screens.append(screen)
+        screen.onClose.append(lambda: self.detach(screen))
+        self._start()
+
+    def detach(self, screen):
+        if screen in self._screens:
+            self._screens.remove(screen)
+        if not self._screens and self._timer is not None:
+            self._timer.stop()
+
+    def _start(self):
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run)
+            self._worker.daemon = True
+            self._worker.start()
+        elif time.time() - self.sampled >= self.interval:
+            self._wake.set()
+
+        if self._timer is None:
+            self._timer = eTimer()
+            self._timer.callback.append(self._poll)
+        self._timer.start(POLL_INTERVAL, False)
+
+    def _poll(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            values = dict(self.values)
+
+        for screen in list(self._screens):
+            for key, text in values.items():
+                try:
+                    if key in screen and screen[key].getText() != text:
+                        screen[key].setText(text)
+                except Exception as e:
+                    print("[SystemInfo] update error:", e)
+
+    def shutdown(self):
+        """Stop the poll timer and let the worker end (before the panel modules are reloaded)."""
+        self._stopped = True
+        self._screens = []
+        if self._timer is not None:
+            self._timer.stop()
+        self._wake.set()
+
+    # ---------------- Worker ----------------
+    def _sample(self):
+        return {
+            "local_ip": "IP: " + get_local_ip(),
+            "StorageInfo": get_storage_info(),
+            "RAMInfo": get_ram_info(),
+            "net_status": "Net: " + check_internet(),
+        }
+
+    def _run(self):
+        while not self._stopped:
+            if self._screens or not self.sampled:
+                fresh = self._sample()
+                with self._lock:
+                    for key, text in fresh.items():
+                        if self.values.get(key) != text:
+                            self.values[key] = text
+                            self._dirty = True
+                    self.sampled = time.time()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+_provider = None
+
+
+def system_info():
+    """Return the process-wide SystemInfo provider."""
+    global _provider
+    if _provider is None:
+        _provider = SystemInfo()
+    return _provider
+
+
+def shutdown():
+    """Called by Updater.reload_modules() before this module is unloaded."""
+    global _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
@@ -1,41 +1,26 @@
 # -*- coding: utf-8 -*-
 import os
-import hashlib
-import requests
-from threading import Timer
-from enigma import getDesktop
 from Plugins.Plugin import PluginDescriptor
 from Screens.Screen import Screen
 from Components.Label import Label
 from Components.ActionMap import ActionMap
-from Tools.LoadPixmap import LoadPixmap
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS, fileExists
 
 from Plugins.Extensions.ElieSatPanelGrid.__init__ import Version
-from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu
-from Plugins.Extensions.ElieSatPanelGrid.menus.Console import Console
+from Plugins.Extensions.ElieSatPanelGrid.menus.FlexibleMenu import FlexibleMenu, add_jump_actions
+from Plugins.Extensions.ElieSatPanelGrid.menus.ScriptCache import run_script
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import get_catalog
+from Plugins.Extensions.ElieSatPanelGrid.menus.CatalogSync import catalog_sync
+from Plugins.Extensions.ElieSatPanelGrid.menus.WarmPool import warm_pool
 from Plugins.Extensions.ElieSatPanelGrid.menus.Iptvadder import Iptvadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.Cccamadder import Cccamadder
 from Plugins.Extensions.ElieSatPanelGrid.menus.News import News
 from Plugins.Extensions.ElieSatPanelGrid.menus.Scripts import Scripts
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import (
-    get_local_ip, check_internet, get_image_name,
-    get_python_version, get_storage_info, get_ram_info
-)
-from Plugins.Extensions.ElieSatPanelGrid.menus.Helpers import is_device_unlocked
-
-
-# ---------------- Utility ----------------
-def has_internet(timeout=3):
-    try:
-        import socket
-        socket.setdefaulttimeout(timeout)
-        s = socket.socket()
-        s.connect(("8.8.8.8", 53))
-        s.close()
-        return True
-    except:
-        return False
+from Plugins.Extensions.ElieSatPanelGrid.menus.SystemInfo import system_info
+from Plugins.Extensions.ElieSatPanelGrid.menus.SkinLoader import skin_loader
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import pixmap_cache
+from Plugins.Extensions.ElieSatPanelGrid.menus.Platform import platform_facts
+
 
 # ---------------- TOOLSP CLASS (Addons-style) ----------------
 class Toolsp(Screen):
@@ -50,11 +35,7 @@ class Toolsp(Screen):
 
         Screen.__init__(self, session)
         # ---------------- ONLY LOAD IF DEVICE UNLOCKED AND FILES EXIST ----------------
-        unlock_ok = is_device_unlocked()
-        unlock_file_exists = os.path.exists("/etc/eliesat_unlocked.cfg")
-        main_mac_exists = os.path.exists("/etc/eliesat_main_mac.cfg")
-
-        if not unlock_ok or not unlock_file_exists or not main_mac_exists:
+        if not platform_facts().unlocked:
             # Close the screen immediately if checks fail
             self.close()
             return
@@ -79,37 +60,15 @@ class Toolsp(Screen):
         # Load menu after layout
         self.onLayoutFinish.append(self.load_panels)
 
-        # Background update
-        Timer(1, self.update_data).start()
+        # Background update (shared sync service)
+        panels_file = resolveFilename(SCOPE_PLUGINS, "Extensions/ElieSatPanelGrid/assets/data/panels")
+        catalog_sync().subscribe(panels_file, self.on_catalog_updated)
+        self.onClose.append(lambda: catalog_sync().unsubscribe(self.on_catalog_updated))
+        warm_pool().attach(self, (panels_file,))
 
     # ---------------- Skin ----------------
     def load_skin(self):
-        screen_width = 1280
-        try:
-            screen_width = getDesktop(0).size().width()
-        except Exception:
-            pass
-
-        base_skin_path = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid/assets/skin/"
-        hd_skin = os.path.join(base_skin_path, "eliesatpanel_hd.xml")
-        fhd_skin = os.path.join(base_skin_path, "eliesatpanel_fhd.xml")
-        default_skin = os.path.join(base_skin_path, "eliesatpanel.xml")
-
-        if screen_width >= 1920 and os.path.exists(fhd_skin):
-            skin_file = fhd_skin
-        elif os.path.exists(hd_skin):
-            skin_file = hd_skin
-        else:
-            skin_file = default_skin
-
-        try:
-            with open(skin_file, "r", encoding="utf-8") as f:
-                self.skin = f.read()
-        except Exception:
-            self.skin = """<screen name="Toolsp" position="center,center" size="1280,720">
-                                <eLabel text="Skin Missing" position="center,center" size="400,50"
-                                font="Regular;30" halign="center" valign="center"/>
-                           </screen>"""
+        self.skin = skin_loader().load("eliesatpanel")
 
     # ---------------- Icon ----------------
     def load_icon(self):
@@ -124,7 +83,7 @@ class Toolsp(Screen):
                     SCOPE_PLUGINS,
                     "Extensions/ElieSatPanelGrid/assets/icons/default.png",
                 )
-            self.iconPixmap = LoadPixmap(icon_path)
+            self.iconPixmap = pixmap_cache().load(icon_path)
         except Exception:
             self.iconPixmap = None
 
@@ -134,12 +93,7 @@ class Toolsp(Screen):
         self["pageinfo"] = Label("")
         self["pagelabel"] = Label("")
 
-        self["image_name"] = Label(f"Image: {get_image_name()}")
-        self["local_ip"] = Label(f"IP: {get_local_ip()}")
-        self["StorageInfo"] = Label(get_storage_info())
-        self["RAMInfo"] = Label(get_ram_info())
-        self["python_ver"] = Label(f"Python: {get_python_version()}")
-        self["net_status"] = Label(f"Net: {check_internet()}")
+        system_info().attach(self)
 
         self["left_bar"] = Label("\n".join(list("Version " + Version)))
         self["right_bar"] = Label("\n".join(list("By ElieSat")))
@@ -167,6 +121,7 @@ class Toolsp(Screen):
             },
             -1,
         )
+        add_jump_actions(self)
 
     # ---------------- Load Panels ----------------
     def load_panels(self):
@@ -176,32 +131,16 @@ class Toolsp(Screen):
             SCOPE_PLUGINS, "Extensions/ElieSatPanelGrid/assets/data/panels"
         )
         try:
-            with open(panels_file, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-
-            name = version = desc = status = ""
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith("Package:"):
-                    name = line.split(":", 1)[1].strip()
-                elif line.startswith("Version:"):
-                    parts = line.split(":", 1)[1].strip().split(None, 1)
-                    version = parts[0]
-                    desc = parts[1] if len(parts) > 1 else ""
-                elif line.startswith("Status:"):
-                    status = line.split(":", 1)[1].strip()
-                    if status.lower() == "pan":
-                        # Icon per panel
-                        icon_name = f"{name.lower()}.png"
-                        icon_path = resolveFilename(
-                            SCOPE_PLUGINS,
-                            f"Extensions/ElieSatPanelGrid/assets/icons/{icon_name}",
-                        )
-                        pix = LoadPixmap(icon_path) if fileExists(icon_path) else None
-                        packages.append((f"{name}-{version}", desc, pix))
-                    name = version = desc = status = ""
+            for label, desc in get_catalog(panels_file).items("pan"):
+                name = label.rsplit("-", 1)[0]
+                # Icon per panel
+                icon_name = f"{name.lower()}.png"
+                icon_path = resolveFilename(
+                    SCOPE_PLUGINS,
+                    f"Extensions/ElieSatPanelGrid/assets/icons/{icon_name}",
+                )
+                pix = pixmap_cache().load(icon_path) if fileExists(icon_path) else None
+                packages.append((label, desc, pix))
 
             if not packages:
                 packages.append(("No panels found with Status: Pan", "", None))
@@ -236,28 +175,13 @@ class Toolsp(Screen):
             print("[Toolsp] No script found for", pkg_name)
             return
 
-        cmd = f'wget -q --no-check-certificate "{script_url}" -O - | /bin/sh'
-        self.session.open(Console, title=f"Running {pkg_name}...", cmdlist=[cmd], closeOnSuccess=True)
+        run_script(self.session, script_url, f"Running {pkg_name}...")
 
     def _find_script(self, pkg_name):
         file_path = resolveFilename(SCOPE_PLUGINS,
                                     "Extensions/ElieSatPanelGrid/assets/data/panels")
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            block = {}
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith("Package:"):
-                    if block.get("Package") == pkg_name:
-                        return next((v for v in block.values() if isinstance(v, str) and v.endswith(".sh")), None)
-                    block = {"Package": line.split(":", 1)[1].strip()}
-                elif "=" in line:
-                    key, val = line.split("=", 1)
-                    block[key.strip()] = val.strip().strip("'\"")
-            return None
+            return get_catalog(file_path).script_url(pkg_name)
         except Exception as e:
             print("[Toolsp] _find_script error:", e)
             return None
@@ -296,29 +220,7 @@ class Toolsp(Screen):
         dots = " ".join(["●" if i == currentPage else "○" for i in range(1, totalPages + 1)])
         self["pagelabel"].setText(dots)
 
-    # ---------------- Update Panels from GitHub ----------------
-    def update_data(self):
-        url = 'https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/refs/heads/main/assets/data/panels'
-        file_path = resolveFilename(SCOPE_PLUGINS,
-                                    "Extensions/ElieSatPanelGrid/assets/data/panels")
-        try:
-            response = requests.get(url)
-            if response.status_code != 200:
-                print('[Toolsp] Failed to download panels')
-                return False
-            new_hash = hashlib.md5(response.content).hexdigest()
-            local_hash = None
-            if os.path.exists(file_path):
-                with open(file_path, 'rb') as f:
-                    local_hash = hashlib.md5(f.read()).hexdigest()
-            if local_hash != new_hash:
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
-                print('[Toolsp] Panels updated from GitHub')
-                self.load_panels()
-                return True
-            return False
-        except Exception as e:
-            print('[Toolsp] update_data error:', e)
-            return False
-
+    # ---------------- Catalog Sync ----------------
+    def on_catalog_updated(self, path):
+        """Reload the panels after the shared sync service replaced the catalog file."""
+        self.load_panels()
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+Updater.py
+Self-update of the panel.
+An update builds the new plugin tree in a sibling folder and swaps it in with
+renames, so the installed tree is never half written.
+The sibling starts as a hard linked copy of the installed tree; then only the
+files whose sha256 differs from assets/plugin_manifest.json are downloaded
+into it. Without a usable manifest the GitHub tarball is piped straight into
+tarfile stream mode instead (no archive in /tmp).
+Both run on a worker thread, the GUI only polls progress through an eTimer.
+Afterwards the panel modules are re-imported in place; enigma2 is restarted
+only when plugin.py changed (its PluginDescriptors are registered at boot).
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import sys
+import tarfile
+import threading
+
+import requests
+from enigma import eTimer
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Manifest import (
+    MANIFEST_FORMAT,
+    TREE_MANIFEST,
+    file_sha256,
+    tree_path_allowed,
+)
+
+PACKAGE = "Plugins.Extensions.ElieSatPanelGrid"
+PLUGIN_PATH = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid"
+# Same filesystem as the plugin (renames), but outside Extensions so enigma2
+# never loads a half built tree as a plugin
+PLUGINS_ROOT = os.path.dirname(os.path.dirname(PLUGIN_PATH))
+NEW_PATH = os.path.join(PLUGINS_ROOT, ".ElieSatPanelGrid.new")
+OLD_PATH = os.path.join(PLUGINS_ROOT, ".ElieSatPanelGrid.old")
+RESTART_FILES = ("plugin.py",)
+UPDATE_URL = "https://github.com/eliesat/eliesatpanelgrid/archive/main.tar.gz"
+REPO_RAW = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/main/"
+ARCHIVE_ROOT = "eliesatpanelgrid-main"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+POLL_INTERVAL = 100         # ms, main loop poll while the worker is busy
+READ_SIZE = 64 * 1024
+
+
+# ---------------- DIFFERENTIAL ----------------
+def fetch_tree_manifest():
+    """Remote {relpath: {"sha256", "size"}}, or None when missing or of another format."""
+    try:
+        manifest = requests.get(REPO_RAW + TREE_MANIFEST, headers=HEADERS, timeout=10).json()
+        if manifest.get("format") != MANIFEST_FORMAT:
+            return None
+        files = manifest.get("files")
+        if not files or not all(tree_path_allowed(rel) for rel in files):
+            return None
+        return files
+    except Exception as e:
+        print("[Updater] Tree manifest unavailable:", e)
+        return None
+
+
+def read_tree_manifest(root=PLUGIN_PATH):
+    """Files listed by the installed manifest (what the last update shipped)."""
+    try:
+        with open(os.path.join(root, TREE_MANIFEST), "r") as f:
+            return json.load(f).get("files", {})
+    except Exception:
+        return {}
+
+
+def plan_update(remote, root=PLUGIN_PATH):
+    """
+    (changed, removed): files whose size or sha256 differ from `remote`, and
+    files the installed manifest shipped that `remote` no longer has.
+    Sizes are compared first, a file of another size is never hashed.
+    """
+    changed = []
+    for rel, entry in sorted(remote.items()):
+        path = os.path.join(root, rel)
+        try:
+            if os.path.getsize(path) == entry.get("size") and file_sha256(path) == entry.get("sha256"):
+                continue
+        except OSError:
+            pass
+        changed.append(rel)
+    removed = sorted(rel for rel in read_tree_manifest(root) if rel not in remote)
+    return changed, removed
+
+
+def stage_file(rel, entry, stage=NEW_PATH):
+    """
+    Download one file into the `stage` tree and check its sha256. Returns the bytes written.
+    Written next to the target and renamed over it: the target may be a hard link
+    to the installed file, which must not change.
+    """
+    dest = os.path.join(stage, rel)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    h = hashlib.sha256()
+    size = 0
+    resp = requests.get(REPO_RAW + rel, headers=HEADERS, stream=True, timeout=10)
+    try:
+        resp.raise_for_status()
+        with open(dest + ".tmp", "wb") as f:
+            for chunk in resp.iter_content(READ_SIZE):
+                f.write(chunk)
+                h.update(chunk)
+                size += len(chunk)
+    finally:
+        resp.close()
+    if h.hexdigest() != entry.get("sha256"):
+        os.remove(dest + ".tmp")
+        raise ValueError("hash mismatch for %s" % rel)
+    os.replace(dest + ".tmp", dest)
+    return size
+
+
+def prepare_tree(root=PLUGIN_PATH, stage=NEW_PATH):
+    """Copy the installed tree to `stage` as hard links (no flash writes), or real copies if links fail."""
+    shutil.rmtree(stage, ignore_errors=True)
+    ignore = shutil.ignore_patterns("__pycache__", "*.tmp")
+    try:
+        shutil.copytree(root, stage, copy_function=os.link, ignore=ignore)
+    except (OSError, shutil.Error):
+        shutil.rmtree(stage, ignore_errors=True)
+        shutil.copytree(root, stage, ignore=ignore)
+
+
+def remove_files(removed, stage=NEW_PATH):
+    for rel in removed:
+        try:
+            os.remove(os.path.join(stage, rel))
+        except OSError:
+            pass
+
+
+def swap_in(stage=NEW_PATH, target=PLUGIN_PATH, old=OLD_PATH):
+    """
+    Install the `stage` tree with two renames; the old tree is restored if the
+    second one fails. The previous tree is deleted afterwards.
+    """
+    shutil.rmtree(old, ignore_errors=True)
+    if os.path.exists(target):
+        os.rename(target, old)
+    try:
+        os.rename(stage, target)
+    except OSError:
+        if os.path.exists(old):
+            os.rename(old, target)
+        raise
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def write_tree_manifest(files, root=PLUGIN_PATH):
+    path = os.path.join(root, TREE_MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump({"format": MANIFEST_FORMAT, "files": files}, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(path + ".tmp", path)
+
+
+# ---------------- STREAM ----------------
+class _CountingReader(object):
+    """File-like view of a raw HTTP stream that counts the bytes read."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def read(self, size=READ_SIZE):
+        data = self.raw.read(size)
+        self.count += len(data)
+        return data
+
+
+def _safe_member(member, root=ARCHIVE_ROOT):
+    """Only regular files and directories below the archive root."""
+    name = member.name
+    if not (name == root or name.startswith(root + "/")):
+        return False
+    if name.startswith("/") or ".." in name.split("/"):
+        return False
+    return member.isfile() or member.isdir()
+
+
+def stream_extract(url=UPDATE_URL, dest=NEW_PATH, progress=None):
+    """
+    Download `url` and extract the archive root folder as `dest` in one pass.
+    progress(done_bytes, total_bytes, members) is called after every member.
+    Returns the number of extracted members.
+    """
+    resp = requests.get(url, headers=HEADERS, stream=True, timeout=10)
+    resp.raise_for_status()
+    total = int(resp.headers.get("content-length", 0))
+    reader = _CountingReader(resp.raw)
+    members = 0
+    try:
+        with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+            for member in tar:
+                if not _safe_member(member) or member.name == ARCHIVE_ROOT:
+                    continue
+                member.name = member.name[len(ARCHIVE_ROOT) + 1:]
+                tar.extract(member, dest)
+                members += 1
+                if progress:
+                    progress(reader.count, total, members)
+    finally:
+        resp.close()
+    return members
+
+
+# ---------------- RELOAD ----------------
+_reopen_timer = None
+
+
+def tree_stamp(root=PLUGIN_PATH):
+    """Changes whenever an update installed a new tree (its manifest is rewritten)."""
+    try:
+        st = os.stat(os.path.join(root, TREE_MANIFEST))
+        return (st.st_mtime, st.st_size, st.st_ino)
+    except OSError:
+        return None
+
+
+def reload_modules():
+    """
+    Forget the imported panel modules so the next import loads the installed
+    files. plugin.py stays: enigma2 holds its entry points.
+    Modules with timers or worker threads define shutdown(); it is called
+    first, so the old singletons stop instead of running next to the new ones.
+    """
+    keep = PACKAGE + ".plugin"
+    names = [n for n in sys.modules if (n == PACKAGE or n.startswith(PACKAGE + ".")) and n != keep]
+    for name in names:
+        hook = getattr(sys.modules[name], "shutdown", None)
+        if callable(hook):
+            try:
+                hook()
+            except Exception as e:
+                print("[Updater] %s shutdown error: %s" % (name, e))
+    for name in names:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+    print("[Updater] %d panel modules unloaded" % len(names))
+    return len(names)
+
+
+def reload_panel(session, screen=None):
+    """Close `screen` (the open panel), reload the panel modules and open the new panel."""
+    global _reopen_timer
+
+    def reopen():
+        main = importlib.import_module(PACKAGE + ".main")
+        session.open(main.EliesatPanel)
+
+    if screen is not None:
+        screen.close()
+    reload_modules()
+    # Opened once the closed screen left the dialog stack
+    _reopen_timer = eTimer()
+    _reopen_timer.callback.append(reopen)
+    _reopen_timer.start(100, True)
+
+
+# ---------------- BACKGROUND RUN ----------------
+class UpdateEngine(object):
+    """
+    Differential (or full) staged update on a worker thread.
+    progress(percent, text) is called on the main loop while it runs and
+    done(ok) once when it finished; needs_restart then tells whether the new
+    tree can be loaded with reload_panel() or needs an enigma2 restart.
+    """
+
+    def __init__(self, url=UPDATE_URL):
+        self.url = url
+        self._lock = threading.Lock()
+        self._timer = None
+        self._progress = None
+        self._done = None
+        self.running = False
+        self.ok = False
+        self.percent = 0
+        self.text = ""
+        self.mode = None            # "differential" or "full" once finished
+        self.bytes = 0              # bytes downloaded
+        self.needs_restart = False
+
+    def start(self, progress, done):
+        if self.running:
+            return
+        self.running = True
+        self._progress = progress
+        self._done = done
+        worker = threading.Thread(target=self._run)
+        worker.daemon = True
+        worker.start()
+
+        self._timer = eTimer()
+        self._timer.callback.append(self._poll)
+        self._timer.start(POLL_INTERVAL, False)
+
+    def _set_progress(self, done_bytes, total, members):
+        with self._lock:
+            if total > 0:
+                self.percent = min(99, int(done_bytes * 100 / total))
+                self.text = "Upgrading the panel: %d%%" % self.percent
+            else:
+                # codeload often sends no content-length: show what arrived
+                self.text = "Upgrading the panel: %d KB, %d files" % (done_bytes // 1024, members)
+
+    def _differential(self):
+        """True when the installed tree now matches the remote manifest."""
+        remote = fetch_tree_manifest()
+        if remote is None:
+            return False
+        changed, removed = plan_update(remote)
+        total = sum(remote[rel].get("size", 0) for rel in changed)
+        print("[Updater] %d changed, %d removed, %d bytes to download" % (len(changed), len(removed), total))
+
+        try:
+            prepare_tree()
+            for i, rel in enumerate(changed):
+                self.bytes += stage_file(rel, remote[rel])
+                self._set_progress(self.bytes, total, i + 1)
+            remove_files(removed)
+            write_tree_manifest(remote, NEW_PATH)
+            swap_in()
+        except Exception as e:
+            print("[Updater] differential update failed:", e)
+            shutil.rmtree(NEW_PATH, ignore_errors=True)
+            return False
+        self.mode = "differential"
+        self.needs_restart = any(rel in RESTART_FILES for rel in changed)
+        return True
+
+    def _full(self):
+        try:
+            shutil.rmtree(NEW_PATH, ignore_errors=True)
+            if stream_extract(self.url, NEW_PATH, self._set_progress):
+                self.needs_restart = any(
+                    file_sha256(os.path.join(PLUGIN_PATH, rel)) != file_sha256(os.path.join(NEW_PATH, rel))
+                    for rel in RESTART_FILES
+                )
+                swap_in()
+                self.mode = "full"
+                return True
+        except Exception as e:
+            print("[Updater] update failed:", e)
+        shutil.rmtree(NEW_PATH, ignore_errors=True)
+        return False
+
+    def _run(self):
+        ok = self._differential() or self._full()
+
+        with self._lock:
+            self.ok = ok
+            self.percent = 100
+            self.running = False
+
+    def _poll(self):
+        with self._lock:
+            percent, text, busy = self.percent, self.text, self.running
+
+        if busy:
+            try:
+                self._progress(percent, text)
+            except Exception as e:
+                print("[Updater] progress error:", e)
+            return
+
+        self._timer.stop()
+        self._done(self.ok)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+VersionService.py
+One place that knows the published panel version.
+The remote __init__.py is fetched at most once per TTL, concurrent callers share
+the same request, and the last result is kept on disk so launches within the
+TTL make no network call at all.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.Catalog import DATA_DIR
+
+PLUGIN_PATH = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid"
+VERSION_URL = "https://raw.githubusercontent.com/eliesat/eliesatpanelgrid/main/__init__.py"
+STATE_FILE = os.path.join(DATA_DIR, ".version_state.json")
+VERSION_TTL = 6 * 60 * 60   # seconds between two remote checks
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+VERSION_RE = re.compile(r"[Vv]ersion\s*=\s*['\"](.+?)['\"]")
+CHANGELOG_RE = re.compile(r"changelog\s*=\s*['\"](.+?)['\"]")
+
+
+# ---------------- HELPERS ----------------
+def read_local_version():
+    """Version of the installed panel as written in __init__.py, or "Unknown"."""
+    try:
+        with open(os.path.join(PLUGIN_PATH, "__init__.py")) as f:
+            m = VERSION_RE.search(f.read())
+            return m.group(1) if m else "Unknown"
+    except:
+        return "Unknown"
+
+
+def is_newer(remote, local):
+    """
+    True if `remote` is a later version than `local`.
+    Panel versions are decimals ("4.49" < "4.5"), longer dotted forms compare per part.
+    """
+    if not remote:
+        return False
+    try:
+        return float(remote) > float(local)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return tuple(int(p) for p in remote.split(".")) > tuple(int(p) for p in local.split("."))
+    except (ValueError, AttributeError):
+        return remote != local
+
+
+# ---------------- SERVICE ----------------
+class VersionService(object):
+    """TTL cache in front of the remote __init__.py, persisted in assets/data."""
+
+    def __init__(self, ttl=VERSION_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(STATE_FILE, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_state(self):
+        tmp = STATE_FILE + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(self._state, f)
+            os.replace(tmp, STATE_FILE)
+        except Exception as e:
+            print("[VersionService] Failed to save state:", e)
+
+    def _fetch(self):
+        content = requests.get(VERSION_URL, headers=HEADERS, timeout=5).text
+        m = VERSION_RE.search(content)
+        c = CHANGELOG_RE.search(content)
+        return (m.group(1) if m else None), (c.group(1) if c else "")
+
+    def remote(self, force=False):
+        """
+        Return (version, changelog) of the published panel.
+        Within the TTL the stored result is returned; callers arriving while a
+        fetch is running wait for it instead of starting their own.
+        On network errors the last known result (possibly (None, "")) is returned.
+        """
+        with self._lock:
+            fresh = time.time() - self._state.get("checked", 0) < self.ttl
+            if force or not fresh:
+                try:
+                    version, changelog = self._fetch()
+                    self._state = {
+                        "checked": time.time(),
+                        "version": version,
+                        "changelog": changelog,
+                    }
+                    self._save_state()
+                except Exception as e:
+                    print("[VersionService] Version check failed:", e)
+            return self._state.get("version"), self._state.get("changelog", "")
+
+    def check(self, local=None, force=False):
+        """Compare the installed and the published version. Returns {"local", "remote", "changelog", "newer"}."""
+        local = local or read_local_version()
+        remote, changelog = self.remote(force)
+        return {
+            "local": local,
+            "remote": remote,
+            "changelog": changelog,
+            "newer": is_newer(remote, local),
+        }
+
+
+_service = None
+
+
+def version_service():
+    """Return the process-wide VersionService instance."""
+    global _service
+    if _service is None:
+        _service = VersionService()
+    return _service
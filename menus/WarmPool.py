@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+WarmPool.py
+Keeps the built state of the last closed submenu screens so reopening one does
+not rebuild it: the grid pages with their loaded logos and the navigation state
+(selected category, per category positions).
+Entries are dropped when one of their catalog files changed, when the pool is
+over its size or byte budget, and when the box runs low on memory.
+Set WARM_POOL_SIZE to 0 to disable the pool.
+"""
+
+import os
+from collections import OrderedDict
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.PixmapCache import LOW_MEMORY_KB, mem_available_kb, pixmap_bytes
+
+WARM_POOL_SIZE = 4                      # closed screens kept
+WARM_POOL_BUDGET = 4 * 1024 * 1024      # bytes of logos held by pooled grids
+WARM_ATTRS = ("previous_index", "submenu_indices")
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+        # ns mtime + inode: CatalogSync replaces files with os.replace, a same-size
+        # update within one second still changes the stamp
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        return None
+
+
+def _grid_bytes(grid):
+    """Decoded size of the logos a grid snapshot keeps alive."""
+    seen = {}
+    for logos in grid.get("logo_sets", {}).values():
+        for pixmap in (logos[0], logos[2]):
+            if pixmap is not None:
+                seen[id(pixmap)] = pixmap
+    return sum(pixmap_bytes(p) for p in seen.values())
+
+
+# ---------------- POOL ----------------
+class WarmPool(object):
+    """Screen class name -> state of its last closed instance, LRU."""
+
+    def __init__(self, size=WARM_POOL_SIZE, budget=WARM_POOL_BUDGET):
+        self.size = size
+        self.budget = budget
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def attach(self, screen, sources=()):
+        """
+        Restore the pooled state of `screen` (call after screen["menu"] exists) and
+        pool it again when the screen closes. `sources` are the catalog files it shows.
+        Returns True when a warm state was reused.
+        """
+        if self.size <= 0:
+            return False
+        key = screen.__class__.__name__
+        entry = self.take(key)
+        if entry is not None:
+            for attr, value in entry["attrs"].items():
+                setattr(screen, attr, value)
+            if "menu" in screen:
+                screen["menu"].warm(entry["grid"])
+        screen.onClose.append(lambda: self.keep(screen, sources))
+        return entry is not None
+
+    def take(self, key):
+        """Remove and return the entry of `key`, or None if missing or stale."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.bytes -= entry["bytes"]
+        for path, stamp in entry["sources"].items():
+            if _stamp(path) != stamp:
+                print("[WarmPool] %s changed, %s rebuilt" % (path, key))
+                self.misses += 1
+                return None
+        self.hits += 1
+        return entry
+
+    def keep(self, screen, sources=()):
+        key = screen.__class__.__name__
+        try:
+            grid = screen["menu"].snapshot() if "menu" in screen else {}
+        except Exception as e:
+            print("[WarmPool] snapshot error:", e)
+            return
+        entry = {
+            "attrs": dict((a, getattr(screen, a)) for a in WARM_ATTRS if hasattr(screen, a)),
+            "grid": grid,
+            "sources": dict((path, _stamp(path)) for path in sources),
+            "bytes": _grid_bytes(grid),
+        }
+
+        self.discard(key)
+        available = mem_available_kb()
+        if available is not None and available < LOW_MEMORY_KB:
+            self.clear()
+            return
+        self._entries[key] = entry
+        self.bytes += entry["bytes"]
+        while len(self._entries) > self.size or (self.bytes > self.budget and len(self._entries) > 1):
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= old["bytes"]
+
+    def discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry["bytes"]
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.bytes}
+
+
+_pool = None
+
+
+def warm_pool():
+    """Return the process-wide WarmPool instance."""
+    global _pool
+    if _pool is None:
+        _pool = WarmPool()
+    return _pool
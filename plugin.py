@@ -6,15 +6,48 @@ from Components.Pixmap import Pixmap
 from Components.Label import Label
 from Components.ProgressBar import ProgressBar
 from Tools.LoadPixmap import LoadPixmap
-from enigma import eTimer, getDesktop
+from enigma import eTimer
 import os
-import re
-import tarfile
-import shutil
-import requests
+from importlib import import_module
 
 PLUGIN_PATH = "/usr/lib/enigma2/python/Plugins/Extensions/ElieSatPanelGrid"
 
+# "fast": open the panel at once from the local catalogs, check version and sync in the background
+# "splash": wait on the splash screen until the version check and the sync are done
+STARTUP_MODE = "fast"
+
+
+# ---------------- PANEL MODULES ----------------
+# plugin.py stays loaded when reload_modules() replaces the panel modules, so
+# it looks them up at call time instead of binding their names at import.
+def menus(name):
+    return import_module("Plugins.Extensions.ElieSatPanelGrid.menus." + name)
+
+
+def startup_timer():
+    return menus("StartupTimer").startup_timer()
+
+
+def platform_facts():
+    return menus("Platform").platform_facts()
+
+
+# ---------------- RELOAD ----------------
+# Plugin tree the imported panel modules were loaded from. Taken on the first
+# main() call, not at import: enigma2 imports plugin.py at every boot.
+_NOT_TAKEN = object()
+_loaded_tree = _NOT_TAKEN
+
+
+def tree_changed():
+    """True (once) when another tree was installed since the panel modules were imported."""
+    global _loaded_tree
+    stamp = menus("Updater").tree_stamp()
+    changed = _loaded_tree is not _NOT_TAKEN and stamp != _loaded_tree
+    _loaded_tree = stamp
+    return changed
+
+
 # ---------------- FHD SKIN ----------------
 SKIN_FHD_XML = """
 <screen name="SplashScreenFHD" position="575,280" size="768,512" flags="wfNoBorder">
@@ -46,7 +79,7 @@ SKIN_HD_XML = """
 # ---------------- SKIN DETECTION ----------------
 def detect_skin_type():
     try:
-        return "FHD" if getDesktop(0).size().width() >= 1920 else "HD"
+        return "FHD" if platform_facts().is_fhd else "HD"
     except:
         return "HD"
 
@@ -54,17 +87,9 @@ def detect_skin_type():
 # ---------------- SPLASH SCREEN ----------------
 class SplashScreen(Screen):
 
-    REPO_OWNER = "eliesat"
-    REPO_NAME = "eliesatpanelgrid"
-    FOLDER_PATH = "assets/data"
-    BRANCH = "main"
-    DEST_FOLDER = os.path.join(PLUGIN_PATH, "assets/data")
-
-    UPDATE_URL = "https://github.com/eliesat/eliesatpanelgrid/archive/main.tar.gz"
-    PACKAGE = "/tmp/eliesatpanelgrid-main.tar.gz"
-
     def __init__(self, session):
 
+        startup_timer().begin("SplashScreen.__init__")
         self.skin_type = detect_skin_type()
         self.skin = SKIN_HD_XML if self.skin_type == "HD" else SKIN_FHD_XML
         Screen.__init__(self, session)
@@ -81,11 +106,12 @@ class SplashScreen(Screen):
         # Layout actions
         self.onLayoutFinish.append(self.load_icon)
         self.onLayoutFinish.append(self.start_version_check)
+        startup_timer().end("SplashScreen.__init__")
 
-    # ---------- START VERSION CHECK ----------
+    # ---------- START VERSION CHECK + SYNC ----------
     def start_version_check(self):
         self.version_timer = eTimer()
-        self.version_timer.callback.append(self.check_version)
+        self.version_timer.callback.append(self.start_sync)
         self.version_timer.start(200, True)
 
     # ---------- LOAD ICON ----------
@@ -99,229 +125,86 @@ class SplashScreen(Screen):
 
     # ---------- READ LOCAL VERSION ----------
     def read_version(self):
-        try:
-            with open(os.path.join(PLUGIN_PATH, "__init__.py")) as f:
-                m = re.search(r"[Vv]ersion\s*=\s*['\"](.+?)['\"]", f.read())
-                return m.group(1) if m else "Unknown"
-        except:
-            return "Unknown"
-
-    # ---------- CHECK REMOTE VERSION ----------
-    def check_version(self):
-
-        local = self.read_version()
-        url = "https://raw.githubusercontent.com/%s/%s/%s/__init__.py" % (
-            self.REPO_OWNER, self.REPO_NAME, self.BRANCH)
-
-        try:
-
-            headers = {"User-Agent": "Mozilla/5.0"}
-            content = requests.get(url, headers=headers, timeout=5).text
-
-            m = re.search(r"[Vv]ersion\s*=\s*['\"](.+?)['\"]", content)
-            remote = m.group(1) if m else None
-
-            c = re.search(r"changelog\s*=\s*['\"](.+?)['\"]", content)
-            changelog = c.group(1) if c else ""
-
-            if remote and remote != local:
-
-                message = (
-                    "New version %s is available.\n%s\nDo you want to upgrade?"
-                ) % (remote, changelog)
+        return menus("VersionService").read_local_version()
 
-                self.session.openWithCallback(
-                    self.update_answer,
-                    MessageBox,
-                    message,
-                    MessageBox.TYPE_YESNO
-                )
+    # ---------- VERSION CHECK + MENU SYNC (worker thread) ----------
+    def start_sync(self):
+        sync = menus("StartupSync").startup_sync()
+        if sync.finished:
+            # Synced earlier in this session
+            self.open_panel()
+            return
 
-            else:
-                self.start_github_process()
+        startup_timer().begin("startup sync")
+        self["progress_bar"].setValue(0)
+        self["wait_text"].setText("Checking version")
+        sync.add_listener(self.sync_progress, self.sync_done)
+        self.onClose.append(lambda: sync.remove_listener(self.sync_done))
+        sync.start()
+
+    def sync_progress(self, percent, text):
+        self["progress_bar"].setValue(percent)
+        self["wait_text"].setText("%s: %d%%" % (text, percent))
+
+    def sync_done(self, result):
+        startup_timer().end("startup sync")
+        self["progress_bar"].setValue(100)
+
+        if result["newer"]:
+
+            message = (
+                "New version %s is available.\n%s\nDo you want to upgrade?"
+            ) % (result["remote"], result["changelog"])
+
+            self.session.openWithCallback(
+                self.update_answer,
+                MessageBox,
+                message,
+                MessageBox.TYPE_YESNO
+            )
 
-        except Exception as e:
-            print("Version check failed:", e)
-            self.start_github_process()
+        else:
+            self.open_panel()
 
     # ---------- UPDATE ANSWER ----------
     def update_answer(self, answer):
 
         if not answer:
-            self.start_github_process()
+            self.open_panel()
             return
 
         self["progress_bar"].show()
         self["progress_bar"].setValue(0)
-
-        self.display_progress = 0
-        self.downloaded = 0
-        self.phase = "download"
-        self.install_index = 0
-
         self["wait_text"].setText("Upgrading the panel: 0%")
 
-        self.download_update()
-
-    # ---------- DOWNLOAD UPDATE ----------
-    def download_update(self):
-
-        try:
-            self.req = requests.get(self.UPDATE_URL, stream=True, timeout=10)
-            self.total_size = int(self.req.headers.get("content-length", 0))
-
-            self.update_file = open(self.PACKAGE, "wb")
-            self.chunk_iter = self.req.iter_content(chunk_size=32768)
-
-            self.upgrade_timer = eTimer()
-            self.upgrade_timer.callback.append(self.download_and_install_tick)
-            self.upgrade_timer.start(50, True)
-
-        except Exception as e:
-            print("Update start error:", e)
-            self.start_github_process()
-
-    # ---------- DOWNLOAD + INSTALL ----------
-    def download_and_install_tick(self):
-
-        target_progress = self.display_progress
-
-        if self.phase == "download":
-
-            try:
-                chunk = next(self.chunk_iter)
-                self.update_file.write(chunk)
-                self.downloaded += len(chunk)
-
-                if self.total_size > 0:
-                    target_progress = int((self.downloaded / self.total_size) * 60)
-
-            except StopIteration:
+        self.updater = menus("Updater").UpdateEngine()
+        self.updater.start(self.update_progress, self.update_done)
 
-                self.update_file.close()
-                self.phase = "install"
+    # ---------- DOWNLOAD + INSTALL (worker thread) ----------
+    def update_progress(self, percent, text):
+        self["progress_bar"].setValue(percent)
+        self["wait_text"].setText(text)
 
-                try:
-                    self.tar = tarfile.open(self.PACKAGE, "r:gz")
-                    self.members = self.tar.getmembers()
-                    self.total_members = len(self.members)
-                    self.install_index = 0
-                except:
-                    self.start_github_process()
-                    return
-
-        elif self.phase == "install":
-
-            if self.install_index < self.total_members:
-
-                member = self.members[self.install_index]
-                self.tar.extract(member, "/tmp")
-                self.install_index += 1
-
-                target_progress = 60 + int(self.install_index / self.total_members * 40)
-
-            else:
-
-                self.tar.close()
-
-                try:
-                    os.remove(self.PACKAGE)
-
-                    if os.path.exists(PLUGIN_PATH):
-                        shutil.rmtree(PLUGIN_PATH)
-
-                    shutil.move("/tmp/eliesatpanelgrid-main", PLUGIN_PATH)
-
-                except Exception as e:
-                    print("Install error:", e)
-
-                target_progress = 100
-                self.phase = "done"
-
-        if self.display_progress < target_progress:
-
-            self.display_progress += max(
-                1, (target_progress - self.display_progress) // 3
-            )
-
-            if self.display_progress > target_progress:
-                self.display_progress = target_progress
-
-        self["progress_bar"].setValue(self.display_progress)
-
-        if self.phase in ["download", "install"]:
-            self["wait_text"].setText(
-                "Upgrading the panel: %d%%" % self.display_progress
-            )
-
-        if self.phase != "done":
-
-            self.upgrade_timer.start(50, True)
-
-        else:
-
-            self.upgrade_timer.stop()
-            self.session.nav.stopService()
-            os.system("killall -9 enigma2")
-
-    # ---------- DOWNLOAD MENU FILES ----------
-    def start_github_process(self):
-
-        self["progress_bar"].show()
-        self["progress_bar"].setValue(0)
-        self["wait_text"].setText("Uploading menus: 0%")
-
-        os.makedirs(self.DEST_FOLDER, exist_ok=True)
-
-        api = "https://api.github.com/repos/%s/%s/contents/%s?ref=%s" % (
-            self.REPO_OWNER,
-            self.REPO_NAME,
-            self.FOLDER_PATH,
-            self.BRANCH,
-        )
-
-        try:
-            files = requests.get(api).json()
-        except:
+    def update_done(self, ok):
+        if not ok:
             self.open_panel()
             return
 
-        self.files_to_download = files
-        self.current_file_index = 0
-
-        self.download_timer = eTimer()
-        self.download_timer.callback.append(self.download_next_file)
-        self.download_timer.start(100, True)
-
-    def download_next_file(self):
-
-        if self.current_file_index >= len(self.files_to_download):
-            self.open_panel()
+        self["progress_bar"].setValue(100)
+        if self.updater.needs_restart:
+            self.session.nav.stopService()
+            os.system("killall -9 enigma2")
             return
 
-        info = self.files_to_download[self.current_file_index]
-        url = info.get("download_url")
-
-        if url:
-            dest = os.path.join(self.DEST_FOLDER, os.path.basename(url))
-
-            try:
-                open(dest, "wb").write(requests.get(url).content)
-            except:
-                pass
-
-        total = len(self.files_to_download)
-        progress = int((self.current_file_index + 1) * 100 / total)
-
-        self["progress_bar"].setValue(progress)
-        self["wait_text"].setText("Uploading menus: %d%%" % progress)
-
-        self.current_file_index += 1
-        self.download_timer.start(100, True)
+        tree_changed()      # reload_panel imports the new tree now
+        menus("Updater").reload_panel(self.session, self)
 
     # ---------- OPEN PANEL ----------
     def open_panel(self):
 
+        # Ended by the first painted page (StartupTimer.finish closes open phases)
+        startup_timer().begin("open_panel")
+
         try:
             from Plugins.Extensions.ElieSatPanelGrid.main import EliesatPanel
             self.session.open(EliesatPanel)
@@ -333,7 +216,21 @@ class SplashScreen(Screen):
 
 # ---------------- ENTRY ----------------
 def main(session, **kwargs):
-    session.open(SplashScreen)
+    # Installer.py may have replaced the tree without restarting enigma2
+    if tree_changed():
+        menus("Updater").reload_modules()
+
+    timer = startup_timer()
+    timer.start()
+    with timer.phase("platform facts"):
+        platform_facts().load()
+    if STARTUP_MODE == "fast":
+        with timer.phase("import main"):
+            from Plugins.Extensions.ElieSatPanelGrid.main import EliesatPanel
+        menus("StartupSync").startup_sync().start()
+        session.open(EliesatPanel)
+    else:
+        session.open(SplashScreen)
 
 
 def menuHook(menuid, **kwargs):
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+conftest.py
+The panel modules import enigma2 (enigma, Components, Screens, Tools, skin),
+which only exists on a box, and requests, which may be missing. Those imports
+are answered with inert stand-ins, so the pure logic can be tested on a PC.
+The repository root is mapped to Plugins.Extensions.ElieSatPanelGrid, the
+package name every module imports the others by.
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "Plugins.Extensions.ElieSatPanelGrid"
+BOX_ONLY = ("enigma", "Components", "Screens", "Tools", "skin", "Plugins.Plugin")
+OPTIONAL = ("requests",)        # stand-in only when not installed
+
+
+# ---------------- STAND-INS ----------------
+class _StubType(type):
+    def __getattr__(cls, name):
+        return _Stub()
+
+
+class _Stub(object, metaclass=_StubType):
+    """Accepts any call and attribute; eTimer().callback.append(...) and the like do nothing."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        return _Stub()
+
+    def __getattr__(self, name):
+        return _Stub()
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _StubType(name, (_Stub,), {})
+        setattr(self, name, value)
+        return value
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Last on sys.meta_path: only answers what no real finder could import."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.startswith(tuple(p + "." for p in BOX_ONLY + OPTIONAL)) or fullname in BOX_ONLY + OPTIONAL:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def _package(name, path):
+    module = types.ModuleType(name)
+    module.__path__ = path
+    sys.modules[name] = module
+    return module
+
+
+if not any(isinstance(f, _StubFinder) for f in sys.meta_path):
+    sys.meta_path.append(_StubFinder())
+    _package("Plugins", [])
+    _package("Plugins.Extensions", [])
+    _package(PACKAGE, [ROOT])
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import os
+
+from Plugins.Extensions.ElieSatPanelGrid.menus import Catalog
+
+TEXT = """
+Package: enigma2-plugin-one
+Version: 1.0 First plugin
+Status: ext, new
+url='https://example.com/one.sh'
+
+Package: enigma2-plugin-two
+Version: 2.1
+Status: ext
+
+Package: enigma2-plugin-one
+Version: 9.9 Duplicate block
+Status: old
+url='https://example.com/other.sh'
+"""
+
+
+def write(tmp_path, text=TEXT):
+    path = tmp_path / "extensions"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_parse_indexes_packages_and_statuses():
+    index = Catalog.CatalogIndex("extensions", (0, 0))
+    index.parse(TEXT)
+    assert index.items("ext, new") == [("enigma2-plugin-one-1.0", "First plugin")]
+    assert index.items("ext", exact=False) == [
+        ("enigma2-plugin-one-1.0", "First plugin"),
+        ("enigma2-plugin-two-2.1", ""),
+    ]
+    assert index.items("old") == [("enigma2-plugin-one-9.9", "Duplicate block")]
+
+
+def test_first_package_block_wins_for_scripts():
+    index = Catalog.CatalogIndex("extensions", (0, 0))
+    index.parse(TEXT)
+    assert index.script_url("enigma2-plugin-one") == "https://example.com/one.sh"
+    assert index.get("enigma2-plugin-one")["version"] == "1.0"
+    assert index.script_url("enigma2-plugin-two") is None
+    assert index.get("missing") is None
+
+
+def test_get_catalog_writes_and_reuses_the_binary_cache(tmp_path):
+    path = write(tmp_path)
+    Catalog.invalidate()
+    first = Catalog.get_catalog(path)
+    assert os.path.exists(Catalog.cache_path(path))
+    assert Catalog.get_catalog(path) is first
+
+    # A new session reads the marshal cache instead of parsing the text
+    Catalog.invalidate()
+    again = Catalog.get_catalog(path)
+    assert again is not first
+    assert again.items("ext", exact=False) == first.items("ext", exact=False)
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    path = write(tmp_path)
+    Catalog.invalidate()
+    Catalog.get_catalog(path)
+    write(tmp_path, TEXT + "\nPackage: enigma2-plugin-three\nVersion: 3.0\nStatus: ext\n")
+    os.utime(path, ns=(1, 1))
+    index = Catalog.get_catalog(path)
+    assert index.get("enigma2-plugin-three") is not None
+
+
+def test_cache_of_another_stamp_is_ignored(tmp_path):
+    path = write(tmp_path)
+    stamp = Catalog._stamp(path)
+    Catalog._write_cache(Catalog._parse_file(path, stamp))
+    assert Catalog._read_cache(path, stamp) is not None
+    assert Catalog._read_cache(path, (stamp[0] + 1, stamp[1])) is None
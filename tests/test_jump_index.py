@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from Plugins.Extensions.ElieSatPanelGrid.menus.JumpIndex import JumpIndex
+
+TITLES = ["Addons", "About", "Backup", "Settings", "Skins", "Softcams", "Scripts"]
+
+
+def test_prefix_finds_first_match_in_list_order():
+    index = JumpIndex(TITLES)
+    assert index.find("s") == 3
+    assert index.find("sk") == 4
+    assert index.find("SOFT") == 5
+
+
+def test_longer_text_is_filtered_beyond_the_prefix_length():
+    index = JumpIndex(TITLES)
+    assert index.find("softcams") == 5
+    assert index.find("softcamx") is None
+
+
+def test_repeated_letter_steps_through_matches():
+    index = JumpIndex(TITLES)
+    assert index.find("a") == 0
+    assert index.find("aa") == 1
+    assert index.find("aaa") == 0
+    assert index.find("ss") == 4
+
+
+def test_no_match():
+    assert JumpIndex(TITLES).find("z") is None
+    assert JumpIndex().find("a") is None
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from Plugins.Extensions.ElieSatPanelGrid.menus import KeyRepeat as kr
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_first_press_is_applied_at_once_and_later_ones_per_frame(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(kr.time, "time", clock)
+    applied = []
+    keys = kr.KeyRepeat(applied.append)
+
+    keys.push("right")
+    assert applied == [["right"]]
+    clock.now += 0.1
+    keys.push("right")
+    clock.now += 0.1
+    keys.push("down")
+    assert applied == [["right"]]       # waiting for the frame timer
+    keys.flush()
+    assert applied == [["right"], ["right", "down"]]
+    keys.flush()
+    assert not keys.busy
+
+
+def test_long_hold_repeats_moves(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(kr.time, "time", clock)
+    keys = kr.KeyRepeat(lambda moves: None)
+    for _ in range(10):
+        clock.now += 0.05
+        keys.push("down")
+    assert keys.factor() == 2
+    keys.stop()
+    assert keys.pending == [] and not keys.busy
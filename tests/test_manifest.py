@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from Plugins.Extensions.ElieSatPanelGrid.menus import Manifest
+
+
+def test_blob_sha1_matches_git():
+    # git hash-object of "hello\n"
+    assert Manifest.blob_sha1(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_file_hashes(tmp_path):
+    path = tmp_path / "f"
+    path.write_bytes(b"hello\n")
+    assert Manifest.file_sha1(str(path)) == Manifest.blob_sha1(b"hello\n")
+    assert Manifest.file_sha256(str(path)).startswith("5891b5b522d5df08")
+    assert Manifest.file_sha1(str(tmp_path / "missing")) is None
+
+
+def test_tree_path_allowed():
+    assert Manifest.tree_path_allowed("plugin.py")
+    assert Manifest.tree_path_allowed("menus/Catalog.py")
+    assert not Manifest.tree_path_allowed("assets/data/extensions")
+    assert not Manifest.tree_path_allowed(Manifest.TREE_MANIFEST)
+    assert not Manifest.tree_path_allowed("menus/__pycache__/x.pyc")
+    assert not Manifest.tree_path_allowed("assets/.hidden")
+    assert not Manifest.tree_path_allowed("tests/test_manifest.py")
+
+
+def test_build_manifest_skips_state_and_temp_files(tmp_path):
+    (tmp_path / "extensions").write_bytes(b"Package: x\n")
+    (tmp_path / ".sync_state.json").write_text("{}")
+    (tmp_path / "feeds.tmp").write_bytes(b"")
+    manifest = Manifest.build_manifest(str(tmp_path))
+    assert manifest["format"] == Manifest.MANIFEST_FORMAT
+    assert manifest["files"] == {"extensions": {"sha": Manifest.blob_sha1(b"Package: x\n"), "size": 11}}
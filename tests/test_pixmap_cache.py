@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from Plugins.Extensions.ElieSatPanelGrid.menus import PixmapCache as pc
+
+
+def test_lru_evicts_oldest_over_budget():
+    cache = pc.PixmapCache(budget=300, max_budget=300)
+    cache.put("a", "A", 100)
+    cache.put("b", "B", 100)
+    cache.put("c", "C", 100)
+    assert cache.get("a") == "A"        # a is now the most recent
+    cache.put("d", "D", 100)
+    assert "b" not in cache
+    assert [k for k in ("a", "c", "d") if k in cache] == ["a", "c", "d"]
+    assert cache.bytes == 300
+    assert cache.evictions == 1
+
+
+def test_replacing_a_key_recharges_it():
+    cache = pc.PixmapCache(budget=1000)
+    cache.put("a", "A", 100)
+    cache.put("a", "A2", 300)
+    assert cache["a"] == "A2"
+    assert cache.bytes == 300
+    assert len(cache) == 1
+
+
+def test_counters():
+    cache = pc.PixmapCache(budget=1000)
+    cache["a"] = "A"
+    cache.get("a")
+    cache.get("missing")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_fit_grows_budget_to_the_working_set_up_to_the_cap():
+    cache = pc.PixmapCache(budget=100, max_budget=pc.PIXMAP_HEADROOM + 500)
+    assert cache.fit(200) == 200 + pc.PIXMAP_HEADROOM
+    assert cache.fit(50) == 200 + pc.PIXMAP_HEADROOM       # never lowered
+    assert cache.fit(10 ** 9) == pc.PIXMAP_HEADROOM + 500
+
+
+def test_low_memory_clear_resets_the_budget(monkeypatch):
+    cache = pc.PixmapCache(budget=100, low_memory_kb=1000)
+    cache.fit(5000)
+    cache.put("a", "A", 10)
+    monkeypatch.setattr(pc, "mem_available_kb", lambda: 10)
+    assert cache.check_memory(force=True)
+    assert len(cache) == 0
+    assert cache.budget == 100
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+from Plugins.Extensions.ElieSatPanelGrid.menus.ScriptCache import INDEX_FILE, ScriptCache
+
+
+def make_cache(folder, cap, scripts):
+    """ScriptCache in `folder` holding scripts = [(url, sha, size, used)]."""
+    cache = ScriptCache(str(folder), cap)
+    for url, sha, size, used in scripts:
+        with open(cache._path(sha), "wb") as f:
+            f.write(b"x" * size)
+        cache._index[url] = {"sha": sha, "size": size, "used": used}
+    return cache
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path, 250, [
+        ("http://a", "aaa", 100, 3.0),
+        ("http://b", "bbb", 100, 1.0),
+        ("http://c", "ccc", 100, 2.0),
+    ])
+    cache._evict()
+    assert sorted(cache._index) == ["http://a", "http://c"]
+    assert not os.path.exists(cache._path("bbb"))
+    assert os.path.exists(cache._path("aaa"))
+
+
+def test_evict_keeps_the_script_just_fetched(tmp_path):
+    cache = make_cache(tmp_path, 150, [
+        ("http://old", "old", 100, 1.0),
+        ("http://new", "new", 100, 0.5),
+    ])
+    cache._evict(keep="http://new")
+    assert list(cache._index) == ["http://new"]
+    assert os.path.exists(cache._path("new"))
+
+
+def test_evict_keeps_a_file_another_url_still_uses(tmp_path):
+    cache = make_cache(tmp_path, 150, [
+        ("http://mirror1", "same", 100, 1.0),
+        ("http://mirror2", "same", 100, 4.0),
+        ("http://other", "other", 100, 3.0),
+    ])
+    cache._evict()
+    # mirror1 went first, its file stays for mirror2, so other is dropped too
+    assert list(cache._index) == ["http://mirror2"]
+    assert os.path.exists(cache._path("same"))
+    assert not os.path.exists(cache._path("other"))
+
+
+def test_evict_under_cap_changes_nothing_and_saves_the_index(tmp_path):
+    cache = make_cache(tmp_path, 1000, [("http://a", "aaa", 100, 1.0)])
+    cache._evict()
+    assert list(cache._index) == ["http://a"]
+    with open(os.path.join(str(tmp_path), INDEX_FILE)) as f:
+        assert json.load(f) == cache._index
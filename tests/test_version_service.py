@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from Plugins.Extensions.ElieSatPanelGrid.menus.VersionService import is_newer
+
+
+def test_decimal_versions_compare_as_numbers():
+    assert is_newer("4.5", "4.49")
+    assert is_newer("4.50", "4.49")
+    assert not is_newer("4.49", "4.5")
+
+
+def test_same_version_is_not_newer():
+    assert not is_newer("4.49", "4.49")
+    assert not is_newer("4.5", "4.50")
+
+
+def test_dotted_versions_compare_per_part():
+    assert is_newer("1.10.0", "1.9.3")
+    assert not is_newer("1.9.3", "1.10.0")
+    assert not is_newer("2.0.1", "2.0.1")
+
+
+def test_missing_remote_is_not_newer():
+    assert not is_newer(None, "4.49")
+    assert not is_newer("", "4.49")
+
+
+def test_unparsable_versions_differ():
+    assert is_newer("4.49-beta", "4.49")
+    assert is_newer("4.49", "Unknown")
+    assert not is_newer("beta", "beta")